@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Microbenchmarks of the per-record functions that bound pipeline throughput.
+
+Each benchmark calls one function over a payload drawn from the synthetic
+corpus distribution (see synthetic_corpus.py): skewed countries with
+spelling variants and missing values, papers with several authors and
+institutions, citations in both the crawler and Semantic Scholar shapes.
+
+Reported per operation:
+    ns/op      best wall time over --repeat passes, after a warm-up pass
+               (caches are warm, as they are in the middle of a real run)
+    peak B/op  transient Python memory of one call (tracemalloc peak)
+    blocks/op  memory blocks still allocated after the call, i.e. what the
+               result keeps alive
+
+CPython does not count allocations, so the two memory columns come from
+tracemalloc on a sample of the payload. The "noop" row is the cost of the
+benchmark loop and call itself.
+
+Usage:
+    python benchmarks/hot_functions.py [--ops 20000] [--repeat 5] [--filter continent]
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic_corpus import CorpusSpec, SyntheticCorpusGenerator  # noqa: E402
+
+# Calls traced per benchmark for the memory columns
+MEMORY_SAMPLE = 2000
+
+
+@dataclass
+class MicroBenchmark:
+    """A function applied to each item of a payload."""
+    name: str
+    op: Callable[[Any], Any]
+    payload: List[Any]
+    bytes_per_op: int = 0
+
+
+@dataclass
+class MicroResult:
+    """Measurements of one benchmark."""
+    name: str
+    ops: int
+    ns_per_op: float
+    peak_bytes_per_op: float
+    blocks_per_op: float
+    mb_per_s: Optional[float] = None
+
+
+def measure(bench: MicroBenchmark, repeat: int) -> MicroResult:
+    """
+    Time a benchmark and sample its allocations.
+
+    Args:
+        bench: Benchmark to run
+        repeat: Timed passes over the payload; the fastest is kept
+
+    Returns:
+        MicroResult of the benchmark
+    """
+    op, payload = bench.op, bench.payload
+
+    for item in payload:
+        op(item)
+
+    best = None
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter_ns()
+            for item in payload:
+                op(item)
+            elapsed = time.perf_counter_ns() - start
+            best = elapsed if best is None else min(best, elapsed)
+    finally:
+        gc.enable()
+
+    ns_per_op = best / len(payload)
+    peak, blocks = sample_allocations(op, payload[:MEMORY_SAMPLE])
+
+    mb_per_s = None
+    if bench.bytes_per_op:
+        mb_per_s = bench.bytes_per_op / ns_per_op * 1e9 / (1024 * 1024)
+
+    return MicroResult(bench.name, len(payload), ns_per_op, peak, blocks, mb_per_s)
+
+
+def sample_allocations(op: Callable[[Any], Any], sample: List[Any]) -> tuple[float, float]:
+    """
+    Measure transient memory and retained blocks per call with tracemalloc.
+
+    Args:
+        op: Function under test
+        sample: Items to call it on
+
+    Returns:
+        Tuple of (mean peak bytes per call, mean retained blocks per call)
+    """
+    results = [None] * len(sample)
+    peak_total = 0
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+
+        for i, item in enumerate(sample):
+            current = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            results[i] = op(item)
+            peak_total += tracemalloc.get_traced_memory()[1] - current
+
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    diff = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), "filename")
+    blocks = sum(stat.count_diff for stat in diff)
+
+    return peak_total / len(sample), blocks / len(sample)
+
+
+def build_benchmarks(ops: int, seed: int, work_dir: Path) -> List[MicroBenchmark]:
+    """
+    Build the benchmarks with payloads from the synthetic corpus.
+
+    Args:
+        ops: Payload items per per-record benchmark
+        seed: Corpus seed
+        work_dir: Directory for the JSON file benchmarks
+
+    Returns:
+        List of benchmarks
+    """
+    from src.processors.big_tech_analyzer import BigTechAnalyzer
+    from src.processors.csv_generator import CSVGenerator
+    from src.utils.continent_mapper import ContinentMapper
+    from src.utils.file_manager import FileManager
+
+    generator = SyntheticCorpusGenerator(CorpusSpec(seed=seed))
+    papers = generator.sample_papers(ops)
+    citations = (generator.sample_citations(ops - ops // 5)
+                 + generator.sample_citations(ops // 5, s2=True))
+
+    authors = [paper["Authors and Institutions"] for paper in papers]
+    countries = [inst.get("Country")
+                 for author_list in authors
+                 for author in author_list
+                 for inst in author["Institutions"]][:ops]
+
+    mapper = ContinentMapper()
+    analyzer = BigTechAnalyzer(work_dir)
+    csv_generator = CSVGenerator(work_dir)
+    institutions = [analyzer.extract_institutions(paper) for paper in papers]
+
+    # A conference-sized file (the 1x corpus averages ~770 papers per conference)
+    file_manager = FileManager(work_dir)
+    document = {str(2012 + i % 13): [] for i in range(13)}
+    for i, paper in enumerate(generator.sample_papers(770)):
+        document[str(2012 + i % 13)].append(paper)
+
+    json_path = work_dir / "hot_functions.json"
+    file_manager.save_json(json_path, document)
+    file_size = json_path.stat().st_size
+    io_payload = [json_path] * 20
+
+    return [
+        MicroBenchmark("noop", lambda item: None, countries),
+        MicroBenchmark("ContinentMapper.country_to_continent",
+                       mapper.country_to_continent, countries),
+        MicroBenchmark("ContinentMapper.get_predominant_continent",
+                       mapper.get_predominant_continent, authors),
+        MicroBenchmark("BigTechAnalyzer.extract_institutions",
+                       analyzer.extract_institutions, papers),
+        MicroBenchmark("BigTechAnalyzer.classify_paper",
+                       analyzer.classify_paper, institutions),
+        MicroBenchmark("BigTechAnalyzer.extract+classify",
+                       lambda paper: analyzer.classify_paper(analyzer.extract_institutions(paper)),
+                       papers),
+        MicroBenchmark("CSVGenerator._extract_continents_from_citation",
+                       csv_generator._extract_continents_from_citation, citations),
+        MicroBenchmark("FileManager.load_json", file_manager.load_json, io_payload, file_size),
+        MicroBenchmark("FileManager.save_json",
+                       lambda path: file_manager.save_json(path, document),
+                       io_payload, file_size),
+    ]
+
+
+def main() -> int:
+    """Run the microbenchmarks and print a table."""
+    parser = argparse.ArgumentParser(description="Microbenchmark per-record hot functions")
+    parser.add_argument("--ops", type=int, default=20000,
+                        help="Payload items per per-record benchmark (default: 20000)")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="Timed passes per benchmark (default: 5)")
+    parser.add_argument("--seed", type=int, default=0, help="Payload seed (default: 0)")
+    parser.add_argument("--filter", help="Only run benchmarks whose name contains this")
+    parser.add_argument("--output", type=Path, help="Also write the results as JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        benchmarks = build_benchmarks(args.ops, args.seed, Path(tmp))
+        if args.filter:
+            benchmarks = [b for b in benchmarks
+                          if args.filter.lower() in b.name.lower() or b.name == "noop"]
+
+        print(f"{'Benchmark':48s} {'ops':>6s} {'ns/op':>10s} {'peak B/op':>10s} "
+              f"{'blocks/op':>9s} {'MB/s':>7s}")
+        print("-" * 95)
+
+        results = []
+        for bench in benchmarks:
+            result = measure(bench, args.repeat)
+            results.append(result)
+
+            mb_per_s = "" if result.mb_per_s is None else f"{result.mb_per_s:7.1f}"
+            print(f"{result.name:48s} {result.ops:6d} {result.ns_per_op:10.0f} "
+                  f"{result.peak_bytes_per_op:10.0f} {result.blocks_per_op:9.2f} {mb_per_s:>7s}")
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({"ops": args.ops, "repeat": args.repeat, "seed": args.seed,
+                       "results": [asdict(r) for r in results]}, f, indent=2)
+        print(f"\nResults saved: {args.output}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
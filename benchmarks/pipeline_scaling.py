@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+End-to-end scaling benchmark for the Python pipeline stages.
+
+Generates synthetic corpora of increasing size (see synthetic_corpus.py) and
+runs DataReducer, CSVGenerator and BigTechAnalyzer on each. Every stage runs
+in a fresh interpreter, so its peak RSS is its own and not a leftover of an
+earlier stage. Time and memory are reported per stage and per input record,
+and a log-log fit over the scales tells whether each stage scales linearly.
+
+Results are printed as a table and written as JSON. With --compare, the run
+is checked against an earlier JSON result and per-record time or memory
+growth beyond --threshold is reported as a regression (exit code 1).
+
+Corpora are kept in --work-dir and regenerated only when their spec changes.
+
+Usage:
+    python benchmarks/pipeline_scaling.py [--scales 1 2 4 8] [--repeat 3]
+    python benchmarks/pipeline_scaling.py --compare baseline.json [--threshold 0.2]
+"""
+
+import argparse
+import json
+import logging
+import math
+import subprocess
+import sys
+import tempfile
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic_corpus import CorpusSpec, SyntheticCorpusGenerator  # noqa: E402
+
+# Stage name -> corpus count used as its record total
+STAGES = {
+    "process_data": "papers",
+    "csv:papers": "papers",
+    "csv:committee": "committee_members",
+    "csv:citations": "citations",
+    "big_tech": "papers",
+}
+
+# Exponent of time ~ records^k above which a stage counts as superlinear
+SUPERLINEAR_EXPONENT = 1.15
+
+# Corpus description stored next to each generated corpus
+CORPUS_FILE = "corpus.json"
+
+
+def run_stage(stage: str, root: Path, workers: int) -> None:
+    """Run one stage in this process (called in the child interpreter)."""
+    from src.processors.big_tech_analyzer import BigTechAnalyzer
+    from src.processors.csv_generator import CSVGenerator
+    from src.processors.data_reducer import DataReducer
+    from src.utils.run_report import StageTimer, peak_rss_mb
+
+    base_rss = peak_rss_mb()
+
+    with StageTimer(stage) as timer:
+        if stage == "process_data":
+            DataReducer(root, incremental=False).process_all_conferences(workers=workers)
+        elif stage == "big_tech":
+            BigTechAnalyzer(root).generate_all_outputs()
+        else:
+            method = {
+                "csv:papers": CSVGenerator.generate_papers_csv,
+                "csv:committee": CSVGenerator.generate_committee_csv,
+                "csv:citations": CSVGenerator.generate_citations_csv,
+            }[stage]
+            result = method(CSVGenerator(root))
+            if not result.success:
+                raise RuntimeError(result.error)
+
+    metrics = timer.metrics.to_dict()
+    metrics["base_rss_mb"] = base_rss
+    print(json.dumps(metrics))
+
+
+def measure_stage(stage: str, root: Path, workers: int) -> Dict:
+    """
+    Run a stage in a fresh interpreter and collect its metrics.
+
+    Args:
+        stage: Stage name (key of STAGES)
+        root: Project root of the corpus
+        workers: DataReducer worker processes
+
+    Returns:
+        StageMetrics dictionary plus the interpreter's RSS before the stage
+
+    Raises:
+        RuntimeError: If the stage fails
+    """
+    result = subprocess.run(
+        [sys.executable, __file__, "--run-stage", stage, "--root", str(root),
+         "--workers", str(workers)],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{stage} failed: {result.stderr.strip()[-500:]}")
+
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def prepare_corpus(work_dir: Path, spec: CorpusSpec) -> Dict[str, int]:
+    """
+    Generate a corpus for a spec, reusing an existing one with the same spec.
+
+    Args:
+        work_dir: Directory holding one subdirectory per scale
+        spec: Corpus specification
+
+    Returns:
+        Counts of generated records
+    """
+    root = corpus_root(work_dir, spec)
+    corpus_file = root / CORPUS_FILE
+
+    if corpus_file.exists():
+        with open(corpus_file, 'r', encoding='utf-8') as f:
+            corpus = json.load(f)
+        if corpus.get("spec") == asdict(spec):
+            return corpus["counts"]
+
+    print(f"Generating {spec.scale:g}x corpus in {root} ...", flush=True)
+    counts = SyntheticCorpusGenerator(spec).generate(root)
+
+    with open(corpus_file, 'w', encoding='utf-8') as f:
+        json.dump({"spec": asdict(spec), "counts": counts}, f, indent=2)
+
+    return counts
+
+
+def corpus_root(work_dir: Path, spec: CorpusSpec) -> Path:
+    """Directory of the corpus of a spec."""
+    return work_dir / f"scale_{spec.scale:g}_seed_{spec.seed}"
+
+
+def scaling_exponent(points: List[tuple]) -> Optional[float]:
+    """
+    Least-squares slope of log(value) against log(records).
+
+    1.0 means linear growth; 2.0 quadratic.
+
+    Args:
+        points: (records, value) pairs
+
+    Returns:
+        Exponent, or None with fewer than two usable points
+    """
+    points = [(math.log(n), math.log(v)) for n, v in points if n and v and v > 0]
+    if len(points) < 2:
+        return None
+
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    var_x = sum((x - mean_x) ** 2 for x, _ in points)
+    if var_x == 0:
+        return None
+
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / var_x
+
+
+def summarize_scaling(results: List[Dict]) -> Dict[str, Dict]:
+    """Fit time and memory exponents of each stage over the measured scales."""
+    scaling = {}
+
+    for stage in STAGES:
+        rows = [r for r in results if r["stage"] == stage]
+        time_exponent = scaling_exponent([(r["records"], r["wall_s"]) for r in rows])
+        memory_exponent = scaling_exponent([(r["records"], r["stage_rss_mb"]) for r in rows])
+
+        if time_exponent is None:
+            verdict = "n/a"
+        elif time_exponent > SUPERLINEAR_EXPONENT:
+            verdict = "superlinear"
+        else:
+            verdict = "linear"
+
+        scaling[stage] = {
+            "time_exponent": time_exponent,
+            "memory_exponent": memory_exponent,
+            "verdict": verdict,
+        }
+
+    return scaling
+
+
+def compare(results: List[Dict], baseline: Dict, threshold: float,
+            min_time: float) -> List[str]:
+    """
+    Find per-record time and memory regressions against a baseline run.
+
+    Args:
+        results: Current measurements
+        baseline: Earlier benchmark JSON
+        threshold: Allowed relative growth (0.2 = 20%)
+        min_time: Stage times below this many seconds are too noisy to compare
+
+    Returns:
+        Description of each regression
+    """
+    previous = {(r["stage"], r["scale"]): r for r in baseline.get("results", [])}
+    regressions = []
+
+    for row in results:
+        before = previous.get((row["stage"], row["scale"]))
+        if before is None:
+            continue
+
+        checks = [("time", "us_per_record", "us/record", before["wall_s"] >= min_time),
+                  ("memory", "kb_per_record", "KB/record", True)]
+
+        for label, key, unit, comparable in checks:
+            old, new = before.get(key), row.get(key)
+            if not comparable or not old or new is None:
+                continue
+            if new > old * (1 + threshold):
+                regressions.append(
+                    f"{row['stage']} @ {row['scale']:g}x: {label} {old:.2f} -> {new:.2f} "
+                    f"{unit} (+{(new / old - 1) * 100:.0f}%)"
+                )
+
+    return regressions
+
+
+def print_results(results: List[Dict], scaling: Dict[str, Dict]):
+    """Print the measurements and the scaling summary."""
+    print(f"\n{'Stage':15s} {'scale':>6s} {'records':>9s} {'wall s':>8s} {'us/rec':>8s} "
+          f"{'stage MB':>9s} {'KB/rec':>7s}")
+    print("-" * 68)
+
+    for row in results:
+        print(f"{row['stage']:15s} {row['scale']:6g} {row['records']:9d} {row['wall_s']:8.3f} "
+              f"{row['us_per_record']:8.1f} {row['stage_rss_mb']:9.1f} {row['kb_per_record']:7.2f}")
+
+    print(f"\n{'Stage':15s} {'time exp':>9s} {'mem exp':>8s}  scaling")
+    print("-" * 45)
+
+    for stage, fit in scaling.items():
+        time_exp = "-" if fit["time_exponent"] is None else f"{fit['time_exponent']:.2f}"
+        mem_exp = "-" if fit["memory_exponent"] is None else f"{fit['memory_exponent']:.2f}"
+        print(f"{stage:15s} {time_exp:>9s} {mem_exp:>8s}  {fit['verdict']}")
+
+
+def main() -> int:
+    """Run the scaling benchmark."""
+    parser = argparse.ArgumentParser(description="Measure how pipeline stages scale")
+    parser.add_argument("--scales", type=float, nargs="+", default=[1, 2, 4, 8],
+                        help="Corpus scale factors (default: 1 2 4 8)")
+    parser.add_argument("--seed", type=int, default=0, help="Corpus seed (default: 0)")
+    parser.add_argument("--repeat", type=int, default=1,
+                        help="Runs per stage; the fastest is kept (default: 1)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="DataReducer worker processes (default: 1)")
+    parser.add_argument("--stages", nargs="+", choices=list(STAGES), default=list(STAGES),
+                        help="Stages to measure (default: all)")
+    parser.add_argument("--work-dir", type=Path,
+                        default=Path(tempfile.gettempdir()) / "conference_benchmark",
+                        help="Directory the corpora are generated in")
+    parser.add_argument("--output", type=Path,
+                        help="JSON result file (default: outputs/reports/pipeline_scaling_<time>.json)")
+    parser.add_argument("--compare", type=Path, metavar="BASELINE",
+                        help="Earlier JSON result to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Allowed per-record growth before flagging (default: 0.2)")
+    parser.add_argument("--min-time", type=float, default=0.05,
+                        help="Ignore time changes of stages faster than this in the "
+                             "baseline, in seconds (default: 0.05)")
+    parser.add_argument("--run-stage", help=argparse.SUPPRESS)
+    parser.add_argument("--root", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_stage:
+        logging.basicConfig(level=logging.WARNING)
+        run_stage(args.run_stage, args.root, args.workers)
+        return 0
+
+    results = []
+
+    for scale in args.scales:
+        spec = CorpusSpec(scale=scale, seed=args.seed)
+        counts = prepare_corpus(args.work_dir, spec)
+        root = corpus_root(args.work_dir, spec)
+
+        for stage in args.stages:
+            runs = [measure_stage(stage, root, args.workers) for _ in range(args.repeat)]
+            metrics = min(runs, key=lambda m: m["wall_s"])
+            records = counts[STAGES[stage]]
+            stage_rss = max(metrics["peak_rss_mb"] - metrics["base_rss_mb"], 0.0)
+
+            results.append({
+                "stage": stage,
+                "scale": scale,
+                "records": records,
+                "wall_s": metrics["wall_s"],
+                "cpu_s": metrics["cpu_s"],
+                "child_cpu_s": metrics["child_cpu_s"],
+                "peak_rss_mb": metrics["peak_rss_mb"],
+                "stage_rss_mb": stage_rss,
+                "us_per_record": metrics["wall_s"] / records * 1e6,
+                "kb_per_record": stage_rss * 1024 / records,
+            })
+            print(f"  {stage:15s} {scale:g}x  {metrics['wall_s']:.3f}s", flush=True)
+
+    scaling = summarize_scaling(results)
+    print_results(results, scaling)
+
+    output = args.output or (PROJECT_ROOT / "outputs" / "reports" /
+                             f"pipeline_scaling_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump({"seed": args.seed, "workers": args.workers, "repeat": args.repeat,
+                   "results": results, "scaling": scaling}, f, indent=2)
+    print(f"\nResults saved: {output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+        regressions = compare(results, baseline, args.threshold, args.min_time)
+        if regressions:
+            print(f"\nRegressions beyond {args.threshold * 100:.0f}% vs {args.compare}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+
+        print(f"\nNo regressions beyond {args.threshold * 100:.0f}% vs {args.compare}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
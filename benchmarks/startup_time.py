@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Startup-time benchmark for Conference Data Analysis entry points.
+
+Measures how long a fresh interpreter takes to import each entry module and
+whether pycountry_convert gets loaded. Each module is also timed with
+EAGER_PRELOAD imported up front, which reproduces what the former eager
+package __init__ modules pulled in (every processor, pycountry_convert and
+the process pool), so the difference is the saving from lazy imports.
+
+Usage:
+    python benchmarks/startup_time.py [--repeat N]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Entry modules to measure
+ENTRY_MODULES = [
+    "src.processors.big_tech_analyzer",
+    "src.processors.csv_generator",
+    "src.processors.data_reducer",
+    "src.utils.file_manager",
+]
+
+# Modules the eager src.utils / src.processors packages used to import
+EAGER_PRELOAD = [
+    "pycountry_convert",
+    "concurrent.futures.process",
+    "src.processors.data_reducer",
+    "src.processors.csv_generator",
+    "src.processors.big_tech_analyzer",
+]
+
+# Probe run in a fresh interpreter: import, then report timing and loaded modules
+_PROBE = """
+import sys, time
+start = time.perf_counter()
+{preload}import {module}
+elapsed = time.perf_counter() - start
+print(elapsed, int("pycountry_convert" in sys.modules))
+"""
+
+
+def measure_import(module: str, preload: list[str] = (), repeat: int = 10) -> tuple[float, bool]:
+    """
+    Time importing a module in fresh interpreters.
+
+    Args:
+        module: Module to import
+        preload: Modules imported first, inside the timed region (optional)
+        repeat: Number of interpreter launches
+
+    Returns:
+        Tuple of (median import time in ms, whether pycountry_convert loaded)
+    """
+    code = _PROBE.format(module=module,
+                         preload="".join(f"import {name}\n" for name in preload))
+    timings = []
+    loaded = False
+
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        elapsed, pycountry_loaded = result.stdout.split()
+        timings.append(float(elapsed) * 1000)
+        loaded = loaded or pycountry_loaded == "1"
+
+    return statistics.median(timings), loaded
+
+
+def main() -> int:
+    """Run the startup benchmark and print a table."""
+    parser = argparse.ArgumentParser(description="Measure entry-point import time")
+    parser.add_argument("--repeat", type=int, default=10,
+                        help="Interpreter launches per measurement (default: 10)")
+    args = parser.parse_args()
+
+    print(f"{'Module':40s} {'lazy ms':>9s} {'eager ms':>9s} {'saved ms':>9s}  pycountry")
+    print("-" * 80)
+
+    for module in ENTRY_MODULES:
+        lazy_ms, loaded = measure_import(module, repeat=args.repeat)
+        eager_ms, _ = measure_import(module, preload=EAGER_PRELOAD, repeat=args.repeat)
+
+        print(f"{module:40s} {lazy_ms:9.1f} {eager_ms:9.1f} {eager_ms - lazy_ms:9.1f}  "
+              f"{'loaded' if loaded else 'deferred'}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,461 @@
+#!/usr/bin/env python3
+"""
+Synthetic conference corpus generator for scale testing.
+
+Writes crawler-shaped input files into a project tree:
+    CrawlerData/ExtendedCrawlerData/<conf>_extended_data.json
+    CommitteeData/<conf>_committee.json
+    CrawlerData/CitationsCrawlerData/<conf>_citations_data.json
+    CrawlerData/CitationsCrawlerData/IntermediateCitations/<conf>_citations_s2.json
+
+The default CorpusSpec approximates production volume (scale 1); --scale
+multiplies papers, committee members and citations. Output depends only on
+the spec and seed: each conference and file kind draws from its own seeded
+generator, so files are identical across runs, machines and Python hash
+seeds. Extended and citation files are streamed, so memory stays bounded at
+large scales.
+
+Usage:
+    python benchmarks/synthetic_corpus.py OUTPUT_DIR [--scale 10] [--seed 0]
+"""
+
+import argparse
+import random
+import sys
+from dataclasses import dataclass, fields
+from itertools import accumulate
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.config.constants import (  # noqa: E402
+    BIG_TECH_COMPANIES, CONFERENCE_MAPPING, DATA_DIRS
+)
+from src.utils.file_manager import FileManager  # noqa: E402
+
+# Countries of institutions, most frequent first (weights follow the Zipf skew)
+COUNTRIES = [
+    "US", "CN", "DE", "GB", "CH", "FR", "KR", "CA", "JP", "IN", "IL", "NL",
+    "SG", "SE", "IT", "ES", "AU", "HK", "TW", "AT", "BE", "DK", "FI", "PT",
+    "BR", "GR", "IE", "NO", "PL", "CZ", "AE", "SA", "TR", "NZ", "ZA", "MX",
+    "AR", "CL", "EG", "NG", "KE", "VN", "TH", "MY", "ID", "PK", "IR", "RU",
+]
+
+# Non-ISO spellings seen in crawled committee and citation data
+COUNTRY_VARIANTS = {
+    "US": ["USA", "U.S.", "United States"],
+    "GB": ["UK", "U.K.", "United Kingdom"],
+    "KR": ["Korea", "South Korea"],
+    "VN": ["Vietnam", "Viet Nam"],
+    "DE": ["Germany"],
+    "CN": ["China"],
+}
+
+# Values no mapper can resolve
+UNKNOWN_COUNTRIES = ["xx", "Unknown", "N/A", "Earth", "ZZ"]
+
+_SYLLABLES = ["an", "bel", "cor", "da", "el", "fan", "gi", "hu", "ir", "jo", "ka",
+              "li", "mo", "na", "or", "pe", "qui", "ra", "si", "to", "ul", "vi",
+              "wen", "xi", "ya", "zhu"]
+_ACCENTED = ["é", "ü", "ø", "ñ", "ç", "å", "ö", "ł", "ș", "ğ"]
+_CJK = ["王", "李", "张", "刘", "陈", "김", "이", "박", "田中", "佐藤"]
+_TITLE_WORDS = ["scalable", "distributed", "consensus", "cloud", "serverless", "cache",
+                "storage", "network", "scheduling", "fault", "tolerant", "learning",
+                "systems", "efficient", "secure", "edge", "memory", "graph", "stream",
+                "replication", "kernel", "virtual", "datacenter", "latency"]
+
+
+@dataclass
+class CorpusSpec:
+    """Knobs of a synthetic corpus; defaults approximate production volume."""
+    conferences: int = 13
+    start_year: int = 2012
+    end_year: int = 2024
+    papers_per_year: int = 60
+    authors_per_paper: float = 4.5
+    committee_size: int = 50
+    cited_fraction: float = 0.5
+    citations_per_paper: float = 4.0
+    institutions: int = 1500
+    skew: float = 1.1
+    big_tech_rate: float = 0.05
+    missing_authors_rate: float = 0.01
+    missing_institution_rate: float = 0.05
+    missing_country_rate: float = 0.03
+    unknown_country_rate: float = 0.01
+    country_variant_rate: float = 0.05
+    non_ascii_rate: float = 0.15
+    mojibake_rate: float = 0.01
+    messy_title_rate: float = 0.02
+    bom_rate: float = 0.1
+    latin1_rate: float = 0.05
+    s2_citations_rate: float = 0.2
+    scale: float = 1.0
+    seed: int = 0
+
+    def scaled(self, value: float) -> int:
+        """Apply the scale factor to a volume knob."""
+        return max(1, round(value * self.scale))
+
+
+class SyntheticCorpusGenerator:
+    """Generates a deterministic synthetic corpus from a CorpusSpec."""
+
+    def __init__(self, spec: CorpusSpec):
+        """
+        Initialize SyntheticCorpusGenerator.
+
+        Args:
+            spec: Corpus specification
+        """
+        self.spec = spec
+        self.file_manager = FileManager()
+
+        rng = self._rng("pools")
+        self.institutions = self._institution_pool(rng)
+        self._institution_weights = _zipf_cum_weights(len(self.institutions), spec.skew)
+
+    def conference_names(self) -> List[str]:
+        """Names of generated conferences: real ones first, then synthetic."""
+        real = [name for name in dict.fromkeys(c.lower() for c in CONFERENCE_MAPPING)
+                if name != "socc"]
+        extra = [f"synth{i:03d}" for i in range(max(0, self.spec.conferences - len(real)))]
+        return (real + extra)[:self.spec.conferences]
+
+    def years(self) -> List[str]:
+        """Generated years."""
+        return [str(year) for year in range(self.spec.start_year, self.spec.end_year + 1)]
+
+    def generate(self, root: Path) -> Dict[str, int]:
+        """
+        Write the corpus under a project root.
+
+        Args:
+            root: Project root to write CrawlerData/ and CommitteeData/ into
+
+        Returns:
+            Counts of generated files and records
+        """
+        root = Path(root)
+        extended_dir = root / DATA_DIRS["crawler_extended"]
+        committee_dir = root / DATA_DIRS["committee"]
+        citations_dir = root / DATA_DIRS["crawler_citations"]
+
+        counts = {"files": 0, "papers": 0, "committee_members": 0, "citations": 0}
+
+        for conference in self.conference_names():
+            counter = [0]
+            self._write_groups(
+                extended_dir / f"{conference}_extended_data.json",
+                self._paper_groups(conference, counter), conference, "extended"
+            )
+            counts["papers"] += counter[0]
+
+            committee = self._committee(conference)
+            self._write(committee_dir / f"{conference}_committee.json",
+                        committee, conference, "committee")
+            counts["committee_members"] += sum(len(members) for members in committee.values())
+
+            # Some conferences only have the Semantic Scholar fallback file
+            s2 = self._rng(conference, "citations-source").random() < self.spec.s2_citations_rate
+            citation_path = (citations_dir / "IntermediateCitations" / f"{conference}_citations_s2.json"
+                             if s2 else citations_dir / f"{conference}_citations_data.json")
+            counter = [0]
+            self._write_groups(citation_path, self._citation_groups(conference, s2, counter),
+                               conference, "citations")
+            counts["citations"] += counter[0]
+
+            counts["files"] += 3
+
+        return counts
+
+    def sample_papers(self, count: int, year: Optional[str] = None) -> List[Dict]:
+        """
+        Generate papers in memory, e.g. as benchmark payloads.
+
+        Args:
+            count: Number of papers
+            year: Publication year (default: the last generated year)
+
+        Returns:
+            Papers shaped like the extended data
+        """
+        rng = self._rng("sample", "papers")
+        return list(self._papers(rng, year or self.years()[-1], count, [0]))
+
+    def sample_citations(self, count: int, s2: bool = False) -> List[Dict]:
+        """
+        Generate citing papers in memory, e.g. as benchmark payloads.
+
+        Args:
+            count: Number of citing papers
+            s2: Use the Semantic Scholar fallback shape (Affiliations/country)
+
+        Returns:
+            Citing papers shaped like the citation data
+        """
+        rng = self._rng("sample", "citations", str(s2))
+        citations = []
+        while len(citations) < count:
+            citations.extend(self._citations(rng, s2, [0]))
+        return citations[:count]
+
+    # ------------------------------------------------------------------
+    # Records
+    # ------------------------------------------------------------------
+
+    def _paper_groups(self, conference: str, counter: List[int]
+                      ) -> Iterator[Tuple[str, Iterator[Dict]]]:
+        """Yield (year, papers) of a conference's extended data."""
+        for year in self.years():
+            rng = self._rng(conference, "papers", year)
+            count = self.spec.scaled(self.spec.papers_per_year * rng.uniform(0.7, 1.3))
+            yield year, self._papers(rng, year, count, counter)
+
+    def _papers(self, rng: random.Random, year: str, count: int,
+                counter: List[int]) -> Iterator[Dict]:
+        """Yield papers of one year."""
+        spec = self.spec
+
+        for _ in range(count):
+            counter[0] += 1
+
+            if rng.random() < spec.missing_authors_rate:
+                authors = []
+            else:
+                authors = [self._author(rng) for _ in range(_count(rng, spec.authors_per_paper))]
+
+            yield {
+                "Title": self._title(rng),
+                "Year": year,
+                "Authors and Institutions": authors,
+            }
+
+    def _author(self, rng: random.Random, s2: bool = False) -> Dict:
+        """Build one author with institutions (extended or S2 citation shape)."""
+        spec = self.spec
+        institutions = []
+
+        if rng.random() >= spec.missing_institution_rate:
+            for _ in range(1 if rng.random() < 0.85 else 2):
+                name, country = self._institution(rng)
+                institutions.append(self._affiliation(rng, name, country, s2))
+
+        if s2:
+            return {"Name": self._person(rng), "Affiliations": institutions}
+        return {"Name": self._person(rng), "Institutions": institutions}
+
+    def _affiliation(self, rng: random.Random, name: str, country: str, s2: bool) -> Dict:
+        """Build an institution entry, applying missing/variant country quirks."""
+        spec = self.spec
+        roll = rng.random()
+
+        if roll < spec.missing_country_rate:
+            country = rng.choice(["", None])
+        elif roll < spec.missing_country_rate + spec.unknown_country_rate:
+            country = rng.choice(UNKNOWN_COUNTRIES)
+        elif roll < spec.missing_country_rate + spec.unknown_country_rate + spec.country_variant_rate:
+            country = rng.choice(COUNTRY_VARIANTS.get(country, [country]))
+
+        if s2:
+            return {"name": name, "country": country}
+        return {"Institution Name": name, "Country": country}
+
+    def _committee(self, conference: str) -> Dict[str, Dict]:
+        """Build committee data: year -> member -> {institution: country} or country."""
+        spec = self.spec
+        committee = {}
+
+        for year in self.years():
+            rng = self._rng(conference, "committee", year)
+            members = {}
+
+            for i in range(spec.scaled(spec.committee_size * rng.uniform(0.8, 1.2))):
+                roll = rng.random()
+                if roll < spec.missing_institution_rate:
+                    value = {}
+                elif roll < spec.missing_institution_rate + 0.05:
+                    # Some crawls store the country directly
+                    value = self._institution(rng)[1]
+                else:
+                    value = {}
+                    for _ in range(1 if rng.random() < 0.9 else 2):
+                        name, country = self._institution(rng)
+                        value[name] = self._affiliation(rng, name, country, False)["Country"]
+
+                members[f"{self._person(rng)} {i}"] = value
+
+            committee[year] = members
+
+        return committee
+
+    def _citation_groups(self, conference: str, s2: bool, counter: List[int]
+                         ) -> Iterator[Tuple[str, Iterator[Dict]]]:
+        """Yield (cited paper title, citing papers) of a conference."""
+        spec = self.spec
+        rng = self._rng(conference, "citations")
+        cited = spec.scaled(spec.papers_per_year * len(self.years()) * spec.cited_fraction)
+
+        for i in range(cited):
+            yield f"{self._title(rng)} #{i}", self._citations(rng, s2, counter)
+
+    def _citations(self, rng: random.Random, s2: bool, counter: List[int]) -> Iterator[Dict]:
+        """Yield citing papers of one cited paper."""
+        for _ in range(_count(rng, self.spec.citations_per_paper)):
+            counter[0] += 1
+            yield {
+                "Title": self._title(rng),
+                "Authors": [self._author(rng, s2)
+                            for _ in range(_count(rng, self.spec.authors_per_paper))],
+            }
+
+    # ------------------------------------------------------------------
+    # Values
+    # ------------------------------------------------------------------
+
+    def _institution_pool(self, rng: random.Random) -> List[Tuple[str, str]]:
+        """Build (institution, country) pairs; big tech first so skew favors them."""
+        country_weights = _zipf_cum_weights(len(COUNTRIES), self.spec.skew)
+        companies = sorted(BIG_TECH_COMPANIES)
+        big_tech_count = round(self.spec.institutions * self.spec.big_tech_rate)
+        suffixes = ["", " Research", " Inc.", " Labs", " Cloud"]
+
+        pool = []
+        for i in range(self.spec.institutions):
+            country = rng.choices(COUNTRIES, cum_weights=country_weights)[0]
+            if i < big_tech_count:
+                name = companies[i % len(companies)].title() + suffixes[i // len(companies) % 5]
+            else:
+                kind = rng.choice(["University of {}", "{} Institute of Technology",
+                                   "{} University", "{} Research Center"])
+                name = kind.format(self._word(rng).title())
+            pool.append((name, country))
+
+        # Interleave big tech into the head of the distribution
+        rng.shuffle(pool)
+        return pool
+
+    def _institution(self, rng: random.Random) -> Tuple[str, str]:
+        """Draw an institution with Zipf-skewed popularity."""
+        return rng.choices(self.institutions, cum_weights=self._institution_weights)[0]
+
+    def _person(self, rng: random.Random) -> str:
+        """Generate a person name, sometimes non-ASCII or mis-decoded."""
+        first = self._word(rng).title()
+        last = self._word(rng).title()
+        roll = rng.random()
+
+        if roll < self.spec.non_ascii_rate / 2:
+            last = rng.choice(_CJK)
+        elif roll < self.spec.non_ascii_rate:
+            last = last[:2] + rng.choice(_ACCENTED) + last[2:]
+
+        name = f"{first} {last}"
+
+        if rng.random() < self.spec.mojibake_rate:
+            # UTF-8 bytes decoded as latin-1, as produced by broken crawls
+            name = name.encode("utf-8").decode("latin-1")
+
+        return name
+
+    def _title(self, rng: random.Random) -> str:
+        """Generate a paper title, sometimes with quotes, newlines or tabs."""
+        words = rng.sample(_TITLE_WORDS, rng.randint(3, 8))
+        title = " ".join(words).capitalize()
+
+        if rng.random() < self.spec.messy_title_rate:
+            title = rng.choice(['"{}"', "{}\n", "{}\t(extended)", "{}: a “study”"]).format(title)
+
+        return title
+
+    def _word(self, rng: random.Random) -> str:
+        """Generate a pronounceable word."""
+        return "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 3)))
+
+    # ------------------------------------------------------------------
+    # Files
+    # ------------------------------------------------------------------
+
+    def _file_encoding(self, conference: str, kind: str) -> Optional[str]:
+        """Pick the file encoding quirk (None means plain UTF-8)."""
+        roll = self._rng(conference, kind, "encoding").random()
+
+        if roll < self.spec.bom_rate:
+            return "utf-8-sig"
+        if roll < self.spec.bom_rate + self.spec.latin1_rate:
+            return "latin-1"
+        return None
+
+    def _write(self, path: Path, data: Dict, conference: str, kind: str):
+        """Write a JSON file with the file's encoding quirk."""
+        encoding = self._file_encoding(conference, kind)
+
+        if encoding == "latin-1":
+            data = _latin1_safe(data)
+
+        self.file_manager.save_json(path, data, encoding=encoding or "utf-8")
+
+    def _write_groups(self, path: Path, groups: Iterator[Tuple[str, Iterator[Dict]]],
+                      conference: str, kind: str):
+        """Stream a {key: [items]} JSON file with the file's encoding quirk."""
+        encoding = self._file_encoding(conference, kind)
+
+        if encoding == "latin-1":
+            groups = ((_latin1_safe(key), (_latin1_safe(item) for item in items))
+                      for key, items in groups)
+
+        self.file_manager.save_json_stream(path, groups, encoding=encoding or "utf-8")
+
+    def _rng(self, *parts: str) -> random.Random:
+        """Independent generator for one part of the corpus (str seeds are stable)."""
+        return random.Random("/".join([str(self.spec.seed), *parts]))
+
+
+def _zipf_cum_weights(n: int, skew: float) -> List[float]:
+    """Cumulative Zipf weights for ranks 1..n."""
+    return list(accumulate(1.0 / (rank ** skew) for rank in range(1, n + 1)))
+
+
+def _count(rng: random.Random, mean: float) -> int:
+    """Draw a small positive count around a mean (geometric-like spread)."""
+    return max(1, min(round(rng.expovariate(1.0 / mean)) + 1, int(mean * 6) + 1))
+
+
+def _latin1_safe(value):
+    """Replace characters latin-1 cannot encode, recursively."""
+    if isinstance(value, str):
+        return value.encode("latin-1", errors="replace").decode("latin-1")
+    if isinstance(value, dict):
+        return {_latin1_safe(k): _latin1_safe(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_latin1_safe(v) for v in value]
+    return value
+
+
+def main() -> int:
+    """Generate a synthetic corpus from command line knobs."""
+    parser = argparse.ArgumentParser(description="Generate a synthetic conference corpus")
+    parser.add_argument("output", type=Path, help="Project root to write the corpus into")
+
+    defaults = CorpusSpec()
+    for spec_field in fields(CorpusSpec):
+        default = getattr(defaults, spec_field.name)
+        parser.add_argument(
+            f"--{spec_field.name.replace('_', '-')}", type=type(default), default=default,
+            help=f"(default: {default})"
+        )
+
+    args = parser.parse_args()
+    spec = CorpusSpec(**{f.name: getattr(args, f.name) for f in fields(CorpusSpec)})
+
+    counts = SyntheticCorpusGenerator(spec).generate(args.output)
+
+    print(f"Wrote {counts['files']} files to {args.output}: {counts['papers']} papers, "
+          f"{counts['committee_members']} committee members, {counts['citations']} citations")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,19 +5,26 @@ Conference Data Analysis - Main Pipeline
 Processes conference data, generates unified datasets, and creates visualizations.
 
 Usage:
-    python run_full_analysis.py
-
-Pipeline steps:
-1. Process conference data
-2. Generate CSV datasets
-3. Analyze tech company participation
-4. Verify R environment
-5. Generate visualizations
+    python run_full_analysis.py [--workers N] [--force] [--plot-jobs N]
+                                [--plot-backend {subprocess,worker}] [--jobs N]
+                                [--only TASK ...] [--until TASK ...] [--list-tasks]
+                                [--trace-memory] [--trace [PATH]]
+                                [--processed-format {json,binary,both}]
+
+Pipeline tasks (independent tasks run concurrently):
+1. Process conference data                  (process_data)
+2. Generate CSV datasets                    (csv:papers, csv:committee, csv:citations)
+3. Analyze tech company participation       (big_tech)
+4. Verify R environment                     (r_env)
+5. Generate visualizations                  (plot:*)
 """
 
+import os
 import sys
+import argparse
 import logging
 import time
+from contextlib import ExitStack
 from pathlib import Path
 from datetime import datetime
 
@@ -26,7 +33,18 @@ sys.path.insert(0, str(Path(__file__).parent))
 from src.processors.data_reducer import DataReducer
 from src.processors.csv_generator import CSVGenerator
 from src.processors.big_tech_analyzer import BigTechAnalyzer
+from src.utils.corpus import Corpus
 from src.utils.file_manager import setup_project_directories
+from src.utils.manifest import StampStore
+from src.utils.run_report import RunReport
+from src.utils.tracing import enable_tracing
+from src.utils.task_graph import Task, TaskGraph
+from src.visualization.r_environment import RPackageVerifier
+from src.visualization.r_runner import RScriptRunner, find_rscript
+from src.config.constants import (
+    CACHE_FILES, DATA_DIRS, OUTPUT_DIRS, PIPELINE_FILES, PLOT_BACKEND, PLOT_BACKENDS,
+    PLOT_INPUTS, PLOT_OUTPUTS, PLOT_SCRIPTS, PROCESSED_FORMAT, PROCESSED_FORMATS
+)
 
 logging.basicConfig(
     level=logging.INFO,
@@ -34,6 +52,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Tasks that fill or read each kind of Corpus data
+CORPUS_USERS = {
+    "papers": ["process_data", "csv:papers", "big_tech"],
+    "committee": ["csv:committee"],
+    "citations": ["csv:citations"],
+}
+
 
 def print_section_header(text, char="=", width=70):
     """Print formatted section header."""
@@ -43,200 +68,337 @@ def print_section_header(text, char="=", width=70):
     print(f"{line}\n")
 
 
-def print_step_header(step, total, description, width=70):
-    """Print formatted step header."""
-    separator = "-" * width
-    print(f"\nSTEP {step}/{total}: {description}")
-    print(separator)
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Conference Data Analysis pipeline")
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1,
+        help="Worker processes for data processing (default: CPU count)"
+    )
+    parser.add_argument(
+        "--force", action="store_true",
+        help="Reprocess all conferences, regenerate all CSVs and plots and "
+             "re-check R packages, even if unchanged since the last run"
+    )
+    parser.add_argument(
+        "--plot-jobs", type=int, default=os.cpu_count() or 1,
+        help="Plots rendered concurrently (default: CPU count)"
+    )
+    parser.add_argument(
+        "--plot-backend", choices=PLOT_BACKENDS, default=PLOT_BACKEND,
+        help="Render each plot in its own Rscript process or in warm R workers "
+             f"that load libraries once (default: {PLOT_BACKEND})"
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=os.cpu_count() or 1,
+        help="Pipeline tasks run concurrently (default: CPU count)"
+    )
+    parser.add_argument(
+        "--only", action="append", metavar="TASK",
+        help="Run only these tasks (names or globs, e.g. 'plot:*'); repeatable"
+    )
+    parser.add_argument(
+        "--until", action="append", metavar="TASK",
+        help="Run these tasks and everything they depend on; repeatable"
+    )
+    parser.add_argument(
+        "--processed-format", choices=PROCESSED_FORMATS, default=PROCESSED_FORMAT,
+        help="Write ProcessedData as JSON, binary columnar stores (much faster to "
+             f"load downstream) or both (default: {PROCESSED_FORMAT})"
+    )
+    parser.add_argument(
+        "--trace-memory", action="store_true",
+        help="Record peak traced Python memory in the run report (slower)"
+    )
+    parser.add_argument(
+        "--trace", nargs="?", const="", metavar="PATH",
+        help="Write a Chrome trace (open in ui.perfetto.dev) of all pipeline work "
+             "(default path: outputs/reports/trace_<timestamp>.json)"
+    )
+    parser.add_argument(
+        "--list-tasks", action="store_true",
+        help="List pipeline tasks with their dependencies and exit"
+    )
+    return parser.parse_args(argv)
+
+
+def verify_r_environment(project_root, refresh=False):
+    """
+    Locate Rscript and make sure the required R packages are installed.
+
+    Args:
+        project_root: Root directory of project
+        refresh: Re-check packages even if a cached verification is valid
+
+    Returns:
+        Rscript executable
+
+    Raises:
+        RuntimeError: If Rscript cannot be found or packages are missing
+    """
+    rscript = find_rscript()
+
+    if not rscript:
+        raise RuntimeError("Rscript not found - plots will not be generated")
+
+    logger.info(f"R installation found: {rscript}")
+
+    verifier = RPackageVerifier(
+        rscript, project_root / OUTPUT_DIRS["cache"] / CACHE_FILES["r_environment"]
+    )
+    verifier.verify(refresh=refresh)
+
+    return rscript
+
+
+def build_pipeline(project_root, args, report=None, corpus=None, resources=None):
+    """
+    Declare the pipeline as a task graph.
+
+    Tasks are linked through the files they read and write, so CSV
+    generation and Big Tech analysis run side by side once ProcessedData is
+    ready, and each plot starts as soon as its own CSVs exist. The Python
+    stages share one Corpus, so each data file is parsed at most once per run.
+
+    Args:
+        project_root: Root directory of project
+        args: Parsed command line arguments
+        report: Run report receiving per-conference metrics (optional)
+        corpus: Corpus shared by the stages (default: a new one)
+        resources: ExitStack that closes what the tasks open, such as the R
+            runner (optional)
+
+    Returns:
+        TaskGraph of the pipeline
+    """
+    graph = TaskGraph()
+    corpus = corpus or Corpus(project_root)
+    processed_json = f"{DATA_DIRS['processed']}/*_data.json"
+    processed_binary = f"{DATA_DIRS['processed']}/*_data.bin"
+    citations_dir = DATA_DIRS["crawler_citations"]
+    plot_context = {}
+
+    # Code and configuration each kind of output is generated from
+    constants_py = "src/config/constants.py"
+    # Modules that determine what the Python stages read
+    loading_sources = ["src/utils/file_manager.py", "src/utils/json_stream.py",
+                       "src/utils/corpus.py", "src/utils/symbols.py", "src/utils/columnar.py"]
+    csv_sources = ["src/processors/csv_generator.py", "src/utils/continent_mapper.py",
+                   *loading_sources, constants_py]
+    big_tech_sources = ["src/processors/big_tech_analyzer.py", "src/utils/company_matcher.py",
+                        *loading_sources, constants_py]
+    plot_sources = ["src/visualization/plot_utils.R", "src/config/config.R"]
+
+    def process_data():
+        reducer = DataReducer(project_root, report=report, corpus=corpus,
+                              output_format=args.processed_format)
+        stats = reducer.process_all_conferences(workers=args.workers, force=args.force)
+        print(reducer.generate_summary_report(stats))
+        return stats
+
+    def generate_csv(method):
+        def action():
+            result = method(CSVGenerator(project_root, corpus=corpus))
+            # Fail the task so the CSV is not stamped and its plots are skipped
+            if not result.success:
+                raise RuntimeError(f"{result.output_path.name}: {result.error}")
+            logger.info(f"{result.output_path.name}: {result.row_count} records generated")
+            return result
+        return action
+
+    def analyze_big_tech():
+        analyzer = BigTechAnalyzer(project_root, corpus=corpus)
+        result = analyzer.generate_all_outputs()
+        print(analyzer.generate_summary_report(result.yearly))
+        return result
+
+    def check_r():
+        rscript = verify_r_environment(project_root, refresh=args.force)
+        runner = RScriptRunner(rscript, project_root, max_workers=args.plot_jobs,
+                               backend=args.plot_backend)
+        if resources is not None:
+            resources.callback(runner.close)
+        plot_context["runner"] = runner
+        return rscript
+
+    def render(script, description):
+        def action():
+            result = plot_context["runner"].render(script, description)
+            if not result.success:
+                raise RuntimeError(result.error)
+            return result
+        return action
+
+    graph.add(Task(
+        "process_data", process_data,
+        inputs=[f"{DATA_DIRS['crawler_extended']}/*.json"],
+        outputs=[processed_json, processed_binary],
+        description="Calculate predominant continents of papers",
+        records=lambda stats: sum(s.total_papers for s in stats.values())
+    ))
+    graph.add(Task(
+        "csv:papers", generate_csv(CSVGenerator.generate_papers_csv),
+        inputs=[processed_json, processed_binary],
+        outputs=[PIPELINE_FILES["papers_csv"]],
+        sources=csv_sources,
+        records=lambda result: result.row_count,
+        description="Unified papers CSV"
+    ))
+    graph.add(Task(
+        "csv:committee", generate_csv(CSVGenerator.generate_committee_csv),
+        inputs=[f"{DATA_DIRS['committee']}/*_committee.json"],
+        outputs=[PIPELINE_FILES["committee_csv"]],
+        sources=csv_sources,
+        records=lambda result: result.row_count,
+        description="Unified committee CSV"
+    ))
+    graph.add(Task(
+        "csv:citations", generate_csv(CSVGenerator.generate_citations_csv),
+        inputs=[f"{citations_dir}/*_citations_data.json",
+                f"{citations_dir}/IntermediateCitations/*_citations_s2.json"],
+        outputs=[PIPELINE_FILES["citations_csv"]],
+        sources=csv_sources,
+        records=lambda result: result.row_count,
+        description="Unified citations CSV"
+    ))
+    graph.add(Task(
+        "big_tech", analyze_big_tech,
+        inputs=[processed_json, processed_binary],
+        outputs=[PIPELINE_FILES["big_tech_csv"], PIPELINE_FILES["big_tech_continent_csv"]],
+        sources=big_tech_sources,
+        description="Presence of major technology companies",
+        records=lambda result: result.papers_analyzed,
+        critical=False
+    ))
+    graph.add(Task(
+        "r_env", check_r,
+        description="R installation and packages",
+        critical=False
+    ))
+
+    for script, description in PLOT_SCRIPTS:
+        graph.add(Task(
+            "plot:" + script[:-len(".R")].replace("plot_", "", 1), render(script, description),
+            inputs=[PIPELINE_FILES[name] for name in PLOT_INPUTS.get(script, [])],
+            outputs=[f"{OUTPUT_DIRS['plots']}/{pdf}" for pdf in PLOT_OUTPUTS.get(script, [])],
+            after=["r_env"],
+            sources=[f"src/visualization/{script}"] + plot_sources,
+            description=description,
+            critical=False
+        ))
+
+    return graph
+
+
+def corpus_releaser(corpus, selected):
+    """
+    Build a TaskGraph.run() result callback that releases each kind of
+    Corpus data as soon as the last selected task using it is finished, so
+    the plots do not run with the whole corpus still loaded.
+
+    Args:
+        corpus: Corpus shared by the pipeline stages
+        selected: Names of the tasks being run
+
+    Returns:
+        Function taking a TaskResult
+    """
+    pending = {kind: set(users) & set(selected) for kind, users in CORPUS_USERS.items()}
+
+    def on_result(result):
+        for kind, users in pending.items():
+            if result.name in users:
+                users.discard(result.name)
+                if not users:
+                    corpus.release(kind)
+
+    return on_result
 
 
-def main():
+def print_task_summary(results, width=70):
+    """Print status and duration of each pipeline task."""
+    print("Tasks:")
+    print("-" * width)
+
+    for result in results.values():
+        detail = f"  ({result.error[:40]})" if result.error else ""
+        print(f"  {result.name:38s} {result.status:10s} {result.elapsed:7.1f}s{detail}")
+
+
+def main(argv=None):
     """Execute complete analysis pipeline."""
+    args = parse_args(argv)
     start_time = time.time()
     project_root = Path(__file__).parent
-    
+
+    report = RunReport("run_full_analysis", trace_memory=args.trace_memory)
+    tracer = enable_tracing() if args.trace is not None else None
+    corpus = Corpus(project_root)
+    resources = ExitStack()
+    graph = build_pipeline(project_root, args, report, corpus, resources)
+
+    try:
+        selected = graph.select(only=args.only, until=args.until)
+    except ValueError as e:
+        logger.error(str(e))
+        return 2
+
+    if args.list_tasks:
+        for name in selected:
+            deps = ", ".join(sorted(graph.dependencies(name))) or "-"
+            print(f"{name:38s} after: {deps}")
+        return 0
+
     print_section_header("CONFERENCE DATA ANALYSIS PIPELINE v2.0")
     print(f"Execution started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"Working directory: {project_root}\n")
-    
+
     logger.info("Initializing project directories")
     setup_project_directories(project_root)
     logger.info("Directory structure ready")
-    
-    total_steps = 5
-    
-    # Step 1: Data Processing
-    print_step_header(1, total_steps, "DATA PROCESSING")
-    logger.info("Processing extended crawler data")
-    logger.info("Calculating predominant continents for each paper")
-    
-    try:
-        reducer = DataReducer(project_root)
-        stats = reducer.process_all_conferences()
-        
-        summary = reducer.generate_summary_report(stats)
-        print(summary)
-        
-        logger.info("Data processing completed successfully")
-        
-    except Exception as e:
-        logger.error(f"Data processing failed: {e}")
-        return 1
-    
-    # Step 2: CSV Generation
-    print_step_header(2, total_steps, "CSV GENERATION")
-    logger.info("Generating unified CSV files")
-    
-    try:
-        generator = CSVGenerator(project_root)
-        results = generator.generate_all_csvs()
-        
-        for csv_type, result in results.items():
-            if result.success:
-                logger.info(f"{csv_type}: {result.row_count} records generated")
-            else:
-                logger.error(f"{csv_type}: {result.error}")
-                
-        logger.info("CSV generation completed")
-        
-    except Exception as e:
-        logger.error(f"CSV generation failed: {e}")
-        return 1
-    
-    # Step 3: Big Tech Analysis
-    print_step_header(3, total_steps, "BIG TECH ANALYSIS")
-    logger.info("Analyzing presence of major technology companies")
-    
-    try:
-        analyzer = BigTechAnalyzer(project_root)
-        results = analyzer.analyze_all_conferences()
-        analyzer.generate_csv()
-        analyzer.generate_continent_csv()
-        
-        summary = analyzer.generate_summary_report(results)
-        print(summary)
-        
-        logger.info("Big tech analysis completed")
-        
-    except Exception as e:
-        logger.warning(f"Big tech analysis warning: {e}")
-        logger.info("Continuing pipeline execution")
-    
-    # Step 4: R Environment Check
-    print_step_header(4, total_steps, "R ENVIRONMENT VERIFICATION")
-    logger.info("Checking R installation and packages")
-    
-    try:
-        import subprocess
-        
-        r_paths = [
-            r"C:\Program Files\R\R-4.5.1\bin\x64\Rscript.exe",
-            r"C:\Program Files\R\R-4.5.0\bin\x64\Rscript.exe",
-            "Rscript"
-        ]
-        
-        rscript = None
-        for path in r_paths:
-            if Path(path).exists() if path.startswith("C:") else True:
-                rscript = path
-                break
-                
-        if not rscript:
-            logger.warning("Rscript not found - plots will not be generated")
-        else:
-            logger.info(f"R installation found: {rscript}")
-            
-            check_cmd = """
-            required <- c("tidyverse", "ggplot2", "dplyr", "scales", "ggpattern")
-            missing <- required[!(required %in% installed.packages()[,"Package"])]
-            if(length(missing) > 0) {
-                cat("Installing missing packages:", paste(missing, collapse=", "), "\\n")
-                install.packages(missing, repos="https://cloud.r-project.org", quiet=TRUE)
-            } else {
-                cat("All required packages installed\\n")
-            }
-            """
-            
-            result = subprocess.run(
-                [rscript, "-e", check_cmd],
-                capture_output=True,
-                text=True,
-                timeout=300
-            )
-            
-            if result.stdout:
-                logger.info(result.stdout.strip())
-                
-    except Exception as e:
-        logger.warning(f"R verification warning: {e}")
-    
-    logger.info("R environment check completed")
-    
-    # Step 5: Visualization Generation
-    print_step_header(5, total_steps, "VISUALIZATION GENERATION")
-    logger.info("Generating all visualizations")
-    
-    plots_config = [
-        ("plot_papers_distribution.R", "Papers distribution by continent"),
-        ("plot_committee_distribution.R", "Committee distribution by continent"),
-        ("plot_asian_trend.R", "Asian papers trend analysis"),
-        ("plot_citations_distribution.R", "Accepted vs cited papers comparison"),
-        ("plot_gini_simpson.R", "Gini-Simpson diversity index"),
-        ("plot_big_tech_companies_by_year.R", "Big Tech vs Academic papers for each year"),
-        ("plot_big_tech_by_continent.R", "Big Tech by continent"),
-        ("plot_committee_papers_heatmap.R", "Committee vs Papers heatmap (year 2024)"),
-        ("plot_big_tech_companies.R", "Big Tech Companies Analysis"),
-        ("plot_asian_trend_distribution.R", "Asian Papers Distribution Trend"),
-        ("plot_papers_distribution_time_periods.R", "Papers distribution by time periods (2012-2018 vs 2020-2024)"),
-    ]
-    
-    generated_count = 0
-    failed_count = 0
-    
-    for script, description in plots_config:
-        script_path = project_root / "src" / "visualization" / script
-        
-        if not script_path.exists():
-            logger.warning(f"Script not found: {script}")
-            failed_count += 1
-            continue
-            
-        try:
-            logger.info(f"Generating: {description}")
-            
-            result = subprocess.run(
-                [rscript, str(script_path)],
-                cwd=project_root,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                logger.info(f"Successfully generated: {script}")
-                generated_count += 1
-            else:
-                logger.error(f"Failed to generate {script}: {result.stderr[:100]}")
-                failed_count += 1
-                
-        except Exception as e:
-            logger.error(f"Error generating {script}: {str(e)[:100]}")
-            failed_count += 1
-    
-    logger.info(f"Plots generated: {generated_count}/{len(plots_config)}")
-    if failed_count > 0:
-        logger.warning(f"Plots failed: {failed_count}")
-        
-    logger.info("Visualization generation completed")
-    
+
+    stamps = StampStore(project_root / OUTPUT_DIRS["cache"] / CACHE_FILES["task_stamps"],
+                        project_root)
+
+    logger.info(f"Running {len(selected)} task(s) with up to {args.jobs} at a time")
+    # Stops persistent R workers once the plots are done
+    with resources:
+        results = graph.run(selected, max_workers=args.jobs, stamps=stamps,
+                            force=args.force, report=report,
+                            on_result=corpus_releaser(corpus, selected))
+    report_path = report.save(project_root / OUTPUT_DIRS["reports"])
+
+    trace_path = None
+    if tracer is not None:
+        trace_path = tracer.save(
+            Path(args.trace) if args.trace else project_root / OUTPUT_DIRS["reports"] /
+            f"trace_{report.started_at.strftime('%Y%m%d_%H%M%S')}.json"
+        )
+
+    plot_results = [r for name, r in results.items() if name.startswith("plot:")]
+    if plot_results:
+        generated_count = sum(1 for r in plot_results if r.status == "done")
+        current_count = sum(1 for r in plot_results if r.status == "up-to-date")
+        failed_count = len(plot_results) - generated_count - current_count
+        logger.info(f"Plots generated: {generated_count}/{len(plot_results)} "
+                    f"({current_count} up to date)")
+        if failed_count > 0:
+            logger.warning(f"Plots failed: {failed_count}")
+
+    unchanged = [r.name for r in results.values() if r.status == "up-to-date"]
+    if unchanged:
+        logger.info(f"Skipped {len(unchanged)} up-to-date task(s): {', '.join(unchanged)}")
+
     # Pipeline Summary
     elapsed = time.time() - start_time
     minutes = int(elapsed // 60)
     seconds = int(elapsed % 60)
-    
+
     print_section_header("PIPELINE EXECUTION COMPLETED")
-    
-    print("Generated Files:")
+
+    print_task_summary(results)
+
+    print("\nGenerated Files:")
     print("\nProcessed Data:")
     print("  - ProcessedData/*_data.json (13 conferences)")
     print("\nUnified CSVs:")
@@ -251,9 +413,19 @@ def main():
     print("  - outputs/plots/citations_distribution.pdf")
     print("  - outputs/plots/gini_simpson_diversity_index.pdf")
     print(f"\nExecution time: {minutes}m {seconds}s")
+    print(f"Run report: {report_path.relative_to(project_root)}")
+    if trace_path is not None:
+        print(f"Trace: {trace_path} (open in https://ui.perfetto.dev)")
     print("\nResults location: outputs/plots/")
     print("=" * 70)
-    
+
+    # Only failures of critical tasks (data processing, CSVs) fail the run
+    failed = [r.name for r in results.values()
+              if r.status == "failed" and graph.tasks[r.name].critical]
+    if failed:
+        logger.error(f"Pipeline failed: {', '.join(failed)}")
+        return 1
+
     return 0
 
 
@@ -31,6 +31,15 @@ OUTPUT_DIRS = {
     "plots": "outputs/plots",
     "csv": "outputs/csv",
     "reports": "outputs/reports",
+    "cache": "outputs/cache",
+}
+
+# Cache files (relative to OUTPUT_DIRS["cache"])
+CACHE_FILES = {
+    "encodings": "encodings.json",
+    "reduction_manifest": "reduction_manifest.json",
+    "task_stamps": "task_stamps.json",
+    "r_environment": "r_environment.json",
 }
 
 # ============================================================================
@@ -150,6 +159,19 @@ BIG_TECH_COMPANIES = {
     'telefonica', 'telefónica', 'vodafone', 'thales', 'philips'
 }
 
+# Company matcher backend ("aho-corasick" scales to large alias lists, "regex")
+COMPANY_MATCHER_BACKEND = "aho-corasick"
+
+# Maximum number of distinct institutions whose match result is memoized
+INSTITUTION_CACHE_SIZE = 65536
+
+# Fields whose string values are interned when JSON is loaded with a symbol
+# table; other values (titles, author names) are mostly unique and left alone
+INTERNED_FIELDS = frozenset({
+    "Institution Name", "Country", "country", "CountryCode", "Year",
+    "Predominant Continent",
+})
+
 # ============================================================================
 # COUNTRY CODE FIXES
 # ============================================================================
@@ -188,6 +210,74 @@ PLOT_DEFAULTS = {
     "base_font_size": 10,
 }
 
+# Plot scripts in src/visualization rendered by the pipeline (script, description)
+PLOT_SCRIPTS: List[tuple] = [
+    ("plot_papers_distribution.R", "Papers distribution by continent"),
+    ("plot_committee_distribution.R", "Committee distribution by continent"),
+    ("plot_asian_trend.R", "Asian papers trend analysis"),
+    ("plot_citations_distribution.R", "Accepted vs cited papers comparison"),
+    ("plot_gini_simpson.R", "Gini-Simpson diversity index"),
+    ("plot_big_tech_companies_by_year.R", "Big Tech vs Academic papers for each year"),
+    ("plot_big_tech_by_continent.R", "Big Tech by continent"),
+    ("plot_committee_papers_heatmap.R", "Committee vs Papers heatmap (year 2024)"),
+    ("plot_big_tech_companies.R", "Big Tech Companies Analysis"),
+    ("plot_asian_trend_distribution.R", "Asian Papers Distribution Trend"),
+    ("plot_papers_distribution_time_periods.R", "Papers distribution by time periods (2012-2018 vs 2020-2024)"),
+]
+
+# Unified data files produced by the pipeline (relative to project root)
+PIPELINE_FILES: Dict[str, str] = {
+    "papers_csv": "ProcessedData/unifiedPaperData.csv",
+    "committee_csv": "ProcessedData/unifiedCommitteeData.csv",
+    "citations_csv": "ProcessedData/unifiedCitationsData.csv",
+    "big_tech_csv": "outputs/csv/big_tech_analysis.csv",
+    "big_tech_continent_csv": "outputs/csv/big_companies_by_continent_analysis.csv",
+}
+
+# PIPELINE_FILES read by each plot script
+PLOT_INPUTS: Dict[str, List[str]] = {
+    "plot_papers_distribution.R": ["papers_csv"],
+    "plot_committee_distribution.R": ["committee_csv"],
+    "plot_asian_trend.R": ["papers_csv"],
+    "plot_citations_distribution.R": ["papers_csv", "citations_csv"],
+    "plot_gini_simpson.R": ["papers_csv"],
+    "plot_big_tech_companies_by_year.R": ["big_tech_csv"],
+    "plot_big_tech_by_continent.R": ["big_tech_continent_csv", "big_tech_csv"],
+    "plot_committee_papers_heatmap.R": ["papers_csv", "committee_csv"],
+    "plot_big_tech_companies.R": ["big_tech_csv"],
+    "plot_asian_trend_distribution.R": ["papers_csv"],
+    "plot_papers_distribution_time_periods.R": ["papers_csv"],
+}
+
+# PDFs written by each plot script (relative to OUTPUT_DIRS["plots"])
+PLOT_OUTPUTS: Dict[str, List[str]] = {
+    "plot_papers_distribution.R": ["accepted_papers_continent_distribution.pdf"],
+    "plot_committee_distribution.R": ["committee_continent_distribution.pdf"],
+    "plot_asian_trend.R": ["asian_trend.pdf"],
+    "plot_citations_distribution.R": ["citations_distribution.pdf"],
+    "plot_gini_simpson.R": ["gini_simpson_diversity_index.pdf"],
+    "plot_big_tech_companies_by_year.R": ["tech_companies_accepted_papers_by_year.pdf"],
+    "plot_big_tech_by_continent.R": ["tech_companies_by_continent_accepted_papers.pdf"],
+    "plot_committee_papers_heatmap.R": ["2024_papers_vs_committee_continent_gap.pdf"],
+    "plot_big_tech_companies.R": ["tech_companies_accepted_papers.pdf"],
+    "plot_asian_trend_distribution.R": ["asian_trend_distribution.pdf"],
+    "plot_papers_distribution_time_periods.R": ["accepted_papers_continent_distribution_facets.pdf"],
+}
+
+# Per-plot Rscript timeout in seconds
+PLOT_TIMEOUT = 60
+
+# R packages the plot scripts need (verified, never installed, by the pipeline)
+R_REQUIRED_PACKAGES: List[str] = ["tidyverse", "ggplot2", "dplyr", "scales", "ggpattern"]
+
+# Timeout in seconds for the R package probe on a verification cache miss
+R_CHECK_TIMEOUT = 60
+
+# How plots are rendered: "subprocess" (one Rscript per plot) or "worker"
+# (persistent R sessions that load libraries once, see r_worker.R)
+PLOT_BACKENDS = ["subprocess", "worker"]
+PLOT_BACKEND = "subprocess"
+
 # ============================================================================
 # DATA VALIDATION
 # ============================================================================
@@ -207,4 +297,8 @@ CSV_ENCODING = "utf-8"
 JSON_INDENT = 4
 JSON_ENSURE_ASCII = False
 
-
+# Formats DataReducer writes ProcessedData in: "json" ({conf}_data.json),
+# "binary" (a columnar store in {conf}_data.bin, see ColumnarStore.save) or
+# "both". Downstream stages read whichever is present and current
+PROCESSED_FORMATS = ["json", "binary", "both"]
+PROCESSED_FORMAT = "json"
@@ -1,7 +1,28 @@
-"""Data processing modules for Conference Data Analysis."""
+"""Data processing modules for Conference Data Analysis.
 
-from .data_reducer import DataReducer
-from .csv_generator import CSVGenerator
-from .big_tech_analyzer import BigTechAnalyzer
+Processors are imported lazily, so running one processor does not import
+the others and their dependencies.
+"""
+
+import importlib
+
+_EXPORTS = {
+    "DataReducer": ".data_reducer",
+    "CSVGenerator": ".csv_generator",
+    "BigTechAnalyzer": ".big_tech_analyzer",
+}
 
 __all__ = ["DataReducer", "CSVGenerator", "BigTechAnalyzer"]
+
+
+def __getattr__(name):
+    """Import exported classes on first access (PEP 562)."""
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -5,13 +5,19 @@ Analyzes the presence of big tech companies vs. academia in conference papers.
 """
 
 import logging
-import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
-from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Set
+from dataclasses import dataclass, field
 
 from src.utils.file_manager import FileManager
-from src.config.constants import BIG_TECH_COMPANIES, DATA_DIRS
+from src.utils.columnar import ColumnarStore
+from src.utils.corpus import Corpus
+from src.utils.tracing import traced
+from src.utils.company_matcher import build_company_matcher
+from src.config.constants import (
+    BIG_TECH_COMPANIES, COMPANY_MATCHER_BACKEND, INSTITUTION_CACHE_SIZE
+)
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +34,16 @@ class BigTechStats:
     pct_all_none: float = 0.0
 
 
+@dataclass
+class BigTechAnalysisResult:
+    """Outputs of a single classification sweep over all conferences."""
+    yearly: List[Dict] = field(default_factory=list)
+    by_continent: List[Dict] = field(default_factory=list)
+    yearly_csv: Optional[Path] = None
+    continent_csv: Optional[Path] = None
+    papers_analyzed: int = 0
+
+
 class BigTechAnalyzer:
     """
     Analyzes the presence of big tech companies in conference papers.
@@ -38,33 +54,70 @@ class BigTechAnalyzer:
     3. All None (no institution data available)
     """
     
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, matcher_backend: str = COMPANY_MATCHER_BACKEND,
+                 corpus: Optional[Corpus] = None):
         """
         Initialize BigTechAnalyzer.
         
         Args:
             project_root: Root directory of project
+            matcher_backend: Company matcher backend, "aho-corasick" or "regex"
+                (default: COMPANY_MATCHER_BACKEND)
+            corpus: Corpus shared with other stages (default: a private one)
         """
         self.project_root = Path(project_root)
         self.file_manager = FileManager(project_root)
+        self.corpus = corpus or Corpus(self.project_root, self.file_manager)
+        
+        # Build company matcher once for efficient matching
+        self.company_matcher = build_company_matcher(BIG_TECH_COMPANIES, matcher_backend)
+        
+        # Memoize per normalized institution: affiliations repeat across papers
+        # and years, and every analysis on this instance shares the cache
+        self._institution_cache = lru_cache(maxsize=INSTITUTION_CACHE_SIZE)(
+            self._match_institution
+        )
         
-        # Compile regex pattern for efficient matching
-        self.company_pattern = self._compile_company_pattern()
+        # Raw -> normalized institution names. With interned input, the raw
+        # names hit on identity and every occurrence shares one normalized
+        # string, whose hash the match cache then reuses
+        self._normalized: Dict[str, str] = {}
         
-    def _compile_company_pattern(self) -> re.Pattern:
+    def _match_institution(self, institution: str) -> bool:
+        """Run the company matcher on a normalized institution string."""
+        return self.company_matcher.search(institution) is not None
+        
+    def is_big_tech(self, institution: str) -> bool:
         """
-        Compile regex pattern for big tech company matching.
+        Check whether a normalized institution belongs to a big tech company.
+        Results are cached, so each distinct institution is matched once.
         
+        Args:
+            institution: Lowercased, stripped institution name
+            
         Returns:
-            Compiled regex pattern
+            True if the institution matches a big tech company
         """
-        # Escape special regex characters in company names
-        escaped_companies = [re.escape(company) for company in BIG_TECH_COMPANIES]
-        
-        # Create pattern that matches whole words only
-        pattern = r'(?<!\w)(' + '|'.join(escaped_companies) + r')(?!\w)'
-        
-        return re.compile(pattern, re.IGNORECASE)
+        return self._institution_cache(institution)
+        
+    def institution_cache_info(self):
+        """Return hit/miss/size counters of the institution match cache."""
+        return self._institution_cache.cache_info()
+        
+    def _normalize(self, name: str) -> str:
+        """Lowercase and strip an institution name, remembering the result."""
+        normalized = name.lower().strip()
+        if len(self._normalized) < INSTITUTION_CACHE_SIZE:
+            normalized = self._normalized.setdefault(name, normalized)
+        return normalized
+        
+    def _log_institution_cache(self) -> None:
+        """Log institution match cache effectiveness."""
+        info = self.institution_cache_info()
+        lookups = info.hits + info.misses
+        if lookups:
+            logger.info(f"  Institution cache: {info.currsize} distinct, "
+                       f"{info.hits}/{lookups} hits ({info.hits / lookups * 100:.1f}%)")
         
     def extract_institutions(self, paper: Dict) -> List[str]:
         """
@@ -77,6 +130,7 @@ class BigTechAnalyzer:
             List of institution names (may include None)
         """
         institutions = []
+        normalized = self._normalized
         
         authors_institutions = paper.get('Authors and Institutions', {})
         
@@ -97,9 +151,9 @@ class BigTechAnalyzer:
                 if isinstance(inst, dict):
                     inst_name = inst.get('Institution Name', None)
                     if inst_name:
-                        institutions.append(inst_name.lower().strip())
+                        institutions.append(normalized.get(inst_name) or self._normalize(inst_name))
                 elif isinstance(inst, str):
-                    institutions.append(inst.lower().strip())
+                    institutions.append(normalized.get(inst) or self._normalize(inst))
                 else:
                     institutions.append(None)
                     
@@ -128,7 +182,7 @@ class BigTechAnalyzer:
             all_are_none = False
             
             # Check if institution matches any big tech company
-            if self.company_pattern.search(inst):
+            if self.is_big_tech(inst):
                 contains_big_company = True
                 break
                 
@@ -137,14 +191,31 @@ class BigTechAnalyzer:
             
         return 'has_big_company' if contains_big_company else 'no_big_company'
         
+    def classify_papers(self, papers: List[Dict]) -> List[str]:
+        """
+        Classify each paper of a list.
+        
+        Args:
+            papers: List of paper dictionaries
+            
+        Returns:
+            Classification per paper, in order
+        """
+        return [self.classify_paper(self.extract_institutions(paper)) for paper in papers]
+        
+    @traced(category="processor")
     def analyze_conference(self, conference: str, 
-                          papers_by_year: Dict[str, List[Dict]]) -> Dict[str, BigTechStats]:
+                          papers_by_year: Dict[str, List[Dict]],
+                          classifications_by_year: Optional[Dict[str, List[str]]] = None
+                          ) -> Dict[str, BigTechStats]:
         """
         Analyze big tech presence for a conference across all years.
         
         Args:
             conference: Conference name
             papers_by_year: Dictionary mapping year to list of papers
+            classifications_by_year: Precomputed classify_papers() output per
+                year; computed here if None
             
         Returns:
             Dictionary mapping year to statistics
@@ -152,29 +223,28 @@ class BigTechAnalyzer:
         stats_by_year = {}
         
         for year, papers in papers_by_year.items():
-            stats = self._analyze_year(papers)
+            classifications = (classifications_by_year or {}).get(year)
+            stats = self._analyze_year(papers, classifications)
             stats_by_year[year] = stats
             
         return stats_by_year
         
-    def _analyze_year(self, papers: List[Dict]) -> BigTechStats:
+    def _analyze_year(self, papers: List[Dict],
+                      classifications: Optional[List[str]] = None) -> BigTechStats:
         """
         Analyze big tech presence for papers in a single year.
         
         Args:
             papers: List of paper dictionaries
+            classifications: Precomputed classification per paper (optional)
             
         Returns:
             Statistics for the year
         """
         stats = BigTechStats(total_papers=len(papers))
         
-        classifications = []
-        
-        for paper in papers:
-            institutions = self.extract_institutions(paper)
-            classification = self.classify_paper(institutions)
-            classifications.append(classification)
+        if classifications is None:
+            classifications = self.classify_papers(papers)
             
         # Count classifications
         stats.has_big_tech = classifications.count('has_big_company')
@@ -189,6 +259,42 @@ class BigTechAnalyzer:
             
         return stats
         
+    def _yearly_rows(self, conference: str,
+                     stats_by_year: Dict[str, BigTechStats]) -> List[Dict]:
+        """Convert per-year statistics to CSV rows."""
+        return [
+            {
+                'Conference': conference,
+                'Year': year,
+                'pct_has_big': round(stats.pct_has_big, 2),
+                'pct_no_big': round(stats.pct_no_big, 2),
+                'pct_all_none': round(stats.pct_all_none, 2)
+            }
+            for year, stats in stats_by_year.items()
+        ]
+        
+    def _conferences(self) -> List[str]:
+        """
+        List conferences with processed data to analyze.
+        
+        Returns:
+            Conference names, excluding the SoCC duplicate
+            
+        Raises:
+            FileNotFoundError: If ProcessedData directory doesn't exist
+        """
+        if not self.corpus.processed_dir.exists():
+            raise FileNotFoundError(
+                f"ProcessedData directory not found: {self.corpus.processed_dir}"
+            )
+            
+        # Skip SoCC duplicate (use cloud as canonical)
+        return [
+            conference for conference in self.corpus.paper_conferences()
+            if conference.lower() != "socc"
+        ]
+        
+    @traced(category="processor")
     def analyze_all_conferences(self) -> List[Dict]:
         """
         Analyze big tech presence across all conferences.
@@ -196,40 +302,19 @@ class BigTechAnalyzer:
         Returns:
             List of result dictionaries suitable for CSV export
         """
-        processed_dir = self.project_root / DATA_DIRS["processed"]
-        
-        if not processed_dir.exists():
-            raise FileNotFoundError(f"ProcessedData directory not found: {processed_dir}")
-            
         results = []
         
-        # Find all conference data files
-        conferences = self.file_manager.get_conferences_from_directory(
-            processed_dir, "_data.json"
-        )
+        conferences = self._conferences()
         
         logger.info(f"Analyzing {len(conferences)} conferences for big tech presence...")
         
         for conference in conferences:
-            # Skip SoCC duplicate (use cloud as canonical)
-            if conference.lower() == "socc":
-                continue
-                
-            data_file = processed_dir / f"{conference}_data.json"
-            
             try:
-                papers_by_year = self.file_manager.load_json(data_file)
+                papers_by_year = self.corpus.papers(conference)
                 stats_by_year = self.analyze_conference(conference, papers_by_year)
                 
                 # Convert to CSV format
-                for year, stats in stats_by_year.items():
-                    results.append({
-                        'Conference': conference,
-                        'Year': year,
-                        'pct_has_big': round(stats.pct_has_big, 2),
-                        'pct_no_big': round(stats.pct_no_big, 2),
-                        'pct_all_none': round(stats.pct_all_none, 2)
-                    })
+                results.extend(self._yearly_rows(conference, stats_by_year))
                     
                 logger.info(f"  Analyzed: {conference} ({len(stats_by_year)} years)")
                 
@@ -237,8 +322,11 @@ class BigTechAnalyzer:
                 logger.error(f"  Failed to analyze {conference}: {e}")
                 continue
                 
+        self._log_institution_cache()
+        
         return results
         
+    @traced(category="processor")
     def generate_csv(self, output_path: Path = None) -> Path:
         """
         Generate CSV file with big tech analysis results.
@@ -269,14 +357,19 @@ class BigTechAnalyzer:
         
         return output_path
     
+    @traced(category="processor")
     def analyze_by_continent(self, conference: str,
-                            papers_by_year: Dict[str, List[Dict]]) -> List[Dict]:
+                            papers_by_year: Dict[str, List[Dict]],
+                            classifications_by_year: Optional[Dict[str, List[str]]] = None
+                            ) -> List[Dict]:
         """
         Analyze big tech presence by continent for a conference.
         
         Args:
             conference: Conference name
             papers_by_year: Dictionary mapping year to list of papers
+            classifications_by_year: Precomputed classify_papers() output per
+                year; papers are classified here if None
             
         Returns:
             List of results by continent
@@ -284,59 +377,91 @@ class BigTechAnalyzer:
         results = []
         
         for year, papers in papers_by_year.items():
-            continent_stats = {
-                'NA': {'has_big': 0, 'no_big': 0, 'total': 0},
-                'EU': {'has_big': 0, 'no_big': 0, 'total': 0},
-                'AS': {'has_big': 0, 'no_big': 0, 'total': 0},
-                'Other': {'has_big': 0, 'no_big': 0, 'total': 0}
-            }
+            classifications = (classifications_by_year or {}).get(year)
             
-            for paper in papers:
-                # Get predominant continent
-                continent = paper.get('Predominant Continent', 'Unknown')
-                if continent == 'Unknown' or not continent:
-                    continue
-                
-                # Handle if continent is a list (shouldn't be, but just in case)
-                if isinstance(continent, list):
-                    continent = continent[0] if continent else 'Unknown'
-                
-                if not isinstance(continent, str) or continent == 'Unknown':
-                    continue
+            if classifications is not None:
+                classify = classifications.__getitem__
+            else:
+                def classify(index, papers=papers):
+                    return self.classify_paper(self.extract_institutions(papers[index]))
                     
-                continent = continent.upper()
-                if continent not in continent_stats:
-                    continent = 'Other'
-                
-                # Classify paper
-                institutions = self.extract_institutions(paper)
-                classification = self.classify_paper(institutions)
+            results.extend(self._continent_rows(
+                conference, year,
+                [paper.get('Predominant Continent', 'Unknown') for paper in papers],
+                classify
+            ))
+        
+        return results
+        
+    def _continent_rows(self, conference: str, year: str, continents: List,
+                        classify: Callable[[int], str]) -> List[Dict]:
+        """
+        Build the by-continent rows of one conference year.
+        
+        Args:
+            conference: Conference name
+            year: Year
+            continents: Predominant continent value of each paper
+            classify: Returns the classification of the paper at an index;
+                only called for papers with a known continent
+            
+        Returns:
+            List of results by continent
+        """
+        results = []
+        
+        continent_stats = {
+            'NA': {'has_big': 0, 'no_big': 0, 'total': 0},
+            'EU': {'has_big': 0, 'no_big': 0, 'total': 0},
+            'AS': {'has_big': 0, 'no_big': 0, 'total': 0},
+            'Other': {'has_big': 0, 'no_big': 0, 'total': 0}
+        }
+        
+        for index, continent in enumerate(continents):
+            # Get predominant continent
+            if continent == 'Unknown' or not continent:
+                continue
+            
+            # Handle if continent is a list (shouldn't be, but just in case)
+            if isinstance(continent, list):
+                continent = continent[0] if continent else 'Unknown'
+            
+            if not isinstance(continent, str) or continent == 'Unknown':
+                continue
                 
-                if classification == 'has_big_company':
-                    continent_stats[continent]['has_big'] += 1
-                elif classification == 'no_big_company':
-                    continent_stats[continent]['no_big'] += 1
-                    
-                continent_stats[continent]['total'] += 1
+            continent = continent.upper()
+            if continent not in continent_stats:
+                continent = 'Other'
             
-            # Calculate percentages for each continent
-            total_papers = sum(stats['total'] for stats in continent_stats.values())
+            # Classify paper
+            classification = classify(index)
             
-            if total_papers > 0:
-                for continent, stats in continent_stats.items():
-                    if stats['total'] > 0:
-                        pct_big = (stats['has_big'] / total_papers) * 100
-                        pct_no_big = (stats['no_big'] / total_papers) * 100
-                        
-                        results.append({
-                            'Conference': conference,
-                            'Year': year,
-                            'level_2': f'pct_big_{continent.lower()}',
-                            'X0': round(pct_big, 2)
-                        })
+            if classification == 'has_big_company':
+                continent_stats[continent]['has_big'] += 1
+            elif classification == 'no_big_company':
+                continent_stats[continent]['no_big'] += 1
+                
+            continent_stats[continent]['total'] += 1
+        
+        # Calculate percentages for each continent
+        total_papers = sum(stats['total'] for stats in continent_stats.values())
+        
+        if total_papers > 0:
+            for continent, stats in continent_stats.items():
+                if stats['total'] > 0:
+                    pct_big = (stats['has_big'] / total_papers) * 100
+                    pct_no_big = (stats['no_big'] / total_papers) * 100
+                    
+                    results.append({
+                        'Conference': conference,
+                        'Year': year,
+                        'level_2': f'pct_big_{continent.lower()}',
+                        'X0': round(pct_big, 2)
+                    })
         
         return results
     
+    @traced(category="processor")
     def generate_continent_csv(self, output_path: Path = None) -> Path:
         """
         Generate CSV file with big tech analysis by continent.
@@ -352,27 +477,15 @@ class BigTechAnalyzer:
             
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        processed_dir = self.project_root / DATA_DIRS["processed"]
-        
-        if not processed_dir.exists():
-            raise FileNotFoundError(f"ProcessedData directory not found: {processed_dir}")
-        
         results = []
         
-        conferences = self.file_manager.get_conferences_from_directory(
-            processed_dir, "_data.json"
-        )
+        conferences = self._conferences()
         
         logger.info(f"Analyzing {len(conferences)} conferences by continent...")
         
         for conference in conferences:
-            if conference.lower() == "socc":
-                continue
-                
-            data_file = processed_dir / f"{conference}_data.json"
-            
             try:
-                papers_by_year = self.file_manager.load_json(data_file)
+                papers_by_year = self.corpus.papers(conference)
                 continent_results = self.analyze_by_continent(conference, papers_by_year)
                 results.extend(continent_results)
                 
@@ -391,9 +504,192 @@ class BigTechAnalyzer:
         
         logger.info(f"Generated continent analysis CSV: {output_path}")
         logger.info(f"  Total records: {len(results)}")
+        self._log_institution_cache()
         
         return output_path
         
+    @traced(category="processor")
+    def analyze_all(self) -> BigTechAnalysisResult:
+        """
+        Analyze all conferences in a single sweep.
+        Each conference is loaded once and each paper classified once; the
+        classifications feed both the yearly and the by-continent results.
+        
+        Returns:
+            BigTechAnalysisResult with yearly and by-continent rows
+        """
+        result = BigTechAnalysisResult()
+        
+        conferences = self._conferences()
+        
+        logger.info(f"Analyzing {len(conferences)} conferences for big tech presence...")
+        
+        for conference in conferences:
+            try:
+                papers_by_year = self.corpus.papers(conference)
+                
+                classifications_by_year = {
+                    year: self.classify_papers(papers)
+                    for year, papers in papers_by_year.items()
+                }
+                
+                stats_by_year = self.analyze_conference(
+                    conference, papers_by_year, classifications_by_year
+                )
+                continent_results = self.analyze_by_continent(
+                    conference, papers_by_year, classifications_by_year
+                )
+                
+                result.yearly.extend(self._yearly_rows(conference, stats_by_year))
+                result.by_continent.extend(continent_results)
+                result.papers_analyzed += sum(len(c) for c in classifications_by_year.values())
+                
+                logger.info(f"  Analyzed: {conference} ({len(stats_by_year)} years)")
+                
+            except Exception as e:
+                logger.error(f"  Failed to analyze {conference}: {e}")
+                continue
+                
+        self._log_institution_cache()
+        
+        return result
+        
+    @traced(category="processor")
+    def analyze_store(self, store: ColumnarStore) -> BigTechAnalysisResult:
+        """
+        Analyze all conferences of a reduced columnar store in a single sweep.
+        Results match analyze_all() on the same data; each distinct
+        institution is normalized and matched once, by symbol code.
+        
+        Args:
+            store: Columnar store with predominant continents
+            
+        Returns:
+            BigTechAnalysisResult with yearly and by-continent rows
+            
+        Raises:
+            ValueError: If the store has not been reduced
+        """
+        if not store.has_predominant:
+            raise ValueError("Columnar store has no predominant continents; reduce it first")
+            
+        result = BigTechAnalysisResult()
+        big_tech_codes: Dict[int, bool] = {}
+        
+        conferences = [c for c in store.conferences() if c.lower() != "socc"]
+        
+        logger.info(f"Analyzing {len(conferences)} conferences for big tech presence...")
+        
+        for conference in conferences:
+            stats_by_year = {}
+            
+            for _, year, papers in store.groups(conference):
+                classifications = [
+                    self._classify_store_paper(store, paper, big_tech_codes) for paper in papers
+                ]
+                stats_by_year[year] = self._analyze_year(papers, classifications)
+                
+                result.by_continent.extend(self._continent_rows(
+                    conference, year,
+                    [store.predominant(paper) for paper in papers],
+                    classifications.__getitem__
+                ))
+                result.papers_analyzed += len(papers)
+                
+            result.yearly.extend(self._yearly_rows(conference, stats_by_year))
+            logger.info(f"  Analyzed: {conference} ({len(stats_by_year)} years)")
+            
+        self._log_institution_cache()
+        
+        return result
+        
+    def _classify_store_paper(self, store: ColumnarStore, paper: int,
+                              big_tech_codes: Dict[int, bool]) -> str:
+        """
+        Classify a paper of a columnar store, as classify_paper(extract_institutions()).
+        
+        Args:
+            store: Columnar store
+            paper: Paper index
+            big_tech_codes: Memo of institution code -> is big tech
+            
+        Returns:
+            Classification: 'has_big_company', 'no_big_company', or 'all_none'
+        """
+        institution = store.institution
+        all_are_none = True
+        
+        for author in store.authors(paper):
+            for f in store.affiliations(author):
+                code = institution[f]
+                if code < 0:
+                    continue
+                    
+                all_are_none = False
+                
+                is_big = big_tech_codes.get(code)
+                if is_big is None:
+                    is_big = self.is_big_tech(store.symbols.symbol(code).lower().strip())
+                    big_tech_codes[code] = is_big
+                    
+                if is_big:
+                    return 'has_big_company'
+                    
+        return 'all_none' if all_are_none else 'no_big_company'
+        
+    @traced(category="processor")
+    def generate_all_outputs(self, output_path: Path = None,
+                             continent_output_path: Path = None,
+                             store: Optional[ColumnarStore] = None) -> BigTechAnalysisResult:
+        """
+        Generate the yearly and by-continent CSVs from one analysis sweep.
+        
+        Binary ProcessedData is analyzed when every conference has it (see
+        Corpus.paper_store()), JSON otherwise.
+        
+        Args:
+            output_path: Yearly CSV path (default: outputs/csv/big_tech_analysis.csv)
+            continent_output_path: By-continent CSV path
+                (default: outputs/csv/big_companies_by_continent_analysis.csv)
+            store: Reduced columnar store to analyze instead of ProcessedData (optional)
+            
+        Returns:
+            BigTechAnalysisResult including the written CSV paths
+        """
+        csv_dir = self.project_root / "outputs" / "csv"
+        if output_path is None:
+            output_path = csv_dir / "big_tech_analysis.csv"
+        if continent_output_path is None:
+            continent_output_path = csv_dir / "big_companies_by_continent_analysis.csv"
+            
+        if store is None:
+            store = self.corpus.paper_store()
+            
+        result = self.analyze_all() if store is None else self.analyze_store(store)
+        
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        self.file_manager.save_csv(
+            output_path,
+            result.yearly,
+            fieldnames=['Conference', 'Year', 'pct_has_big', 'pct_no_big', 'pct_all_none']
+        )
+        logger.info(f"Generated big tech analysis CSV: {output_path}")
+        logger.info(f"  Total records: {len(result.yearly)}")
+        
+        continent_output_path.parent.mkdir(parents=True, exist_ok=True)
+        self.file_manager.save_csv(
+            continent_output_path,
+            result.by_continent,
+            fieldnames=['Conference', 'Year', 'level_2', 'X0']
+        )
+        logger.info(f"Generated continent analysis CSV: {continent_output_path}")
+        logger.info(f"  Total records: {len(result.by_continent)}")
+        
+        result.yearly_csv = output_path
+        result.continent_csv = continent_output_path
+        
+        return result
+        
     def generate_summary_report(self, results: List[Dict]) -> str:
         """
         Generate summary report of big tech analysis.
@@ -459,12 +755,11 @@ def main():
     try:
         logger.info("Starting big tech company analysis...")
         
-        # Generate CSV
-        output_path = analyzer.generate_csv()
+        # Generate CSVs from a single classification sweep
+        result = analyzer.generate_all_outputs()
         
-        # Load results and print summary
-        results = analyzer.file_manager.load_csv(output_path)
-        summary = analyzer.generate_summary_report(results)
+        # Print summary
+        summary = analyzer.generate_summary_report(result.yearly)
         print("\n" + summary)
         
         logger.info("Big tech analysis completed successfully!")
@@ -9,7 +9,10 @@ from typing import Dict, List, Optional
 from dataclasses import dataclass
 
 from src.utils.file_manager import FileManager
+from src.utils.columnar import ColumnarStore
 from src.utils.continent_mapper import ContinentMapper
+from src.utils.corpus import Corpus
+from src.utils.tracing import traced
 from src.config.constants import DATA_DIRS
 
 logger = logging.getLogger(__name__)
@@ -27,23 +30,31 @@ class CSVGenerationResult:
 class CSVGenerator:
     """Generates unified CSV files from JSON data sources."""
     
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, corpus: Optional[Corpus] = None):
         """
         Initialize CSVGenerator.
         
         Args:
             project_root: Root directory of project
+            corpus: Corpus shared with other stages (default: a private one)
         """
         self.project_root = Path(project_root)
         self.file_manager = FileManager(project_root)
+        self.corpus = corpus or Corpus(self.project_root, self.file_manager)
         self.continent_mapper = ContinentMapper()
         
-    def generate_papers_csv(self, output_path: Optional[Path] = None) -> CSVGenerationResult:
+    @traced(category="processor")
+    def generate_papers_csv(self, output_path: Optional[Path] = None,
+                            store: Optional[ColumnarStore] = None) -> CSVGenerationResult:
         """
-        Generate unified papers CSV from ProcessedData JSON files.
+        Generate unified papers CSV from ProcessedData files.
+        
+        Binary ProcessedData is read when every conference has it (see
+        Corpus.paper_store()), JSON otherwise.
         
         Args:
             output_path: Output CSV path (default: ProcessedData/unifiedPaperData.csv)
+            store: Reduced columnar store to read instead of ProcessedData (optional)
             
         Returns:
             CSVGenerationResult with generation details
@@ -52,40 +63,21 @@ class CSVGenerator:
             output_path = self.project_root / DATA_DIRS["processed"] / "unifiedPaperData.csv"
             
         try:
-            processed_dir = self.project_root / DATA_DIRS["processed"]
-            
-            if not processed_dir.exists():
+            if store is None:
+                store = self.corpus.paper_store()
+                
+            if store is not None:
+                all_rows = self._store_paper_rows(store)
+            elif not self.corpus.processed_dir.exists():
                 return CSVGenerationResult(
                     output_path=output_path,
                     row_count=0,
                     success=False,
                     error="ProcessedData directory not found"
                 )
+            else:
+                all_rows = self._processed_paper_rows()
                 
-            # Collect all papers
-            all_rows = []
-            
-            for json_file in processed_dir.glob("*_data.json"):
-                # Skip SoCC duplicates (use cloud_data.json as canonical)
-                if json_file.stem.startswith("socc_"):
-                    continue
-                    
-                conference = json_file.stem.replace("_data", "")
-                data = self.file_manager.load_json(json_file)
-                
-                # Process each year
-                for year, papers in data.items():
-                    for paper in papers:
-                        continents = paper.get("Predominant Continent", [])
-                        continent = continents[0] if continents else None
-                        
-                        all_rows.append({
-                            "Conference": conference,
-                            "Year": year,
-                            "Title": paper.get("Title", ""),
-                            "Predominant Continent": continent
-                        })
-                        
             # Save CSV
             self.file_manager.save_csv(
                 output_path,
@@ -110,6 +102,57 @@ class CSVGenerator:
                 error=str(e)
             )
             
+    def _processed_paper_rows(self) -> List[Dict]:
+        """Build papers CSV rows from ProcessedData."""
+        all_rows = []
+        
+        for conference in self.corpus.paper_conferences():
+            # Skip SoCC duplicates (use cloud_data.json as canonical)
+            if _is_socc_duplicate(conference):
+                continue
+                
+            data = self.corpus.papers(conference)
+            
+            # Process each year
+            for year, papers in data.items():
+                for paper in papers:
+                    continents = paper.get("Predominant Continent", [])
+                    continent = continents[0] if continents else None
+                    
+                    all_rows.append({
+                        "Conference": conference,
+                        "Year": year,
+                        "Title": paper.get("Title", ""),
+                        "Predominant Continent": continent
+                    })
+                    
+        return all_rows
+        
+    def _store_paper_rows(self, store: ColumnarStore) -> List[Dict]:
+        """Build papers CSV rows from a reduced columnar store."""
+        if not store.has_predominant:
+            raise ValueError("Columnar store has no predominant continents; reduce it first")
+            
+        all_rows = []
+        
+        for conference, year, papers in store.groups():
+            # Skip SoCC duplicates (use cloud_data.json as canonical)
+            if _is_socc_duplicate(conference):
+                continue
+                
+            for paper in papers:
+                continents = store.predominant(paper)
+                
+                all_rows.append({
+                    "Conference": conference,
+                    "Year": year,
+                    "Title": store.title(paper),
+                    "Predominant Continent": continents[0] if continents else None
+                })
+                
+        return all_rows
+        
+    @traced(category="processor")
     def generate_committee_csv(self, output_path: Optional[Path] = None) -> CSVGenerationResult:
         """
         Generate unified committee CSV from CommitteeData JSON files.
@@ -124,9 +167,7 @@ class CSVGenerator:
             output_path = self.project_root / DATA_DIRS["processed"] / "unifiedCommitteeData.csv"
             
         try:
-            committee_dir = self.project_root / DATA_DIRS["committee"]
-            
-            if not committee_dir.exists():
+            if not self.corpus.committee_dir.exists():
                 return CSVGenerationResult(
                     output_path=output_path,
                     row_count=0,
@@ -134,12 +175,14 @@ class CSVGenerator:
                     error="CommitteeData directory not found"
                 )
                 
-            # Collect all committee members
+            # Collect all committee members, with their countries resolved
+            # to continents in one batch at the end
             all_rows = []
+            all_countries = []
+            country_spans = []
             
-            for json_file in committee_dir.glob("*_committee.json"):
-                conference = json_file.stem.replace("_committee", "")
-                data = self.file_manager.load_json(json_file)
+            for conference in self.corpus.committee_conferences():
+                data = self.corpus.committee(conference)
                 
                 # Process each year
                 for year, members in data.items():
@@ -161,23 +204,25 @@ class CSVGenerator:
                         # Format institutions
                         institutions_str = ";".join([i for i in institution_list if i]) or None
                         
-                        # Convert countries to continents
-                        continents = set()
-                        for country in countries:
-                            continent = self.continent_mapper.country_to_continent(country)
-                            if continent:
-                                continents.add(continent)
-                                
-                        continent_str = ";".join(sorted(continents)) if continents else None
+                        start = len(all_countries)
+                        all_countries.extend(countries)
+                        country_spans.append((start, len(all_countries)))
                         
                         all_rows.append({
                             "Conference": conference,
                             "Year": year,
                             "Name": member_name,
                             "Institution": institutions_str,
-                            "Continent": continent_str
+                            "Continent": None
                         })
                         
+            # Convert countries to continents
+            all_continents = self.continent_mapper.country_to_continent_many(all_countries)
+            
+            for row, (start, end) in zip(all_rows, country_spans):
+                continents = {c for c in all_continents[start:end] if c}
+                row["Continent"] = ";".join(sorted(continents)) if continents else None
+                
             # Save CSV
             self.file_manager.save_csv(
                 output_path,
@@ -202,6 +247,7 @@ class CSVGenerator:
                 error=str(e)
             )
             
+    @traced(category="processor")
     def generate_citations_csv(self, output_path: Optional[Path] = None) -> CSVGenerationResult:
         """
         Generate unified citations CSV from CitationsCrawlerData.
@@ -216,9 +262,7 @@ class CSVGenerator:
             output_path = self.project_root / DATA_DIRS["processed"] / "unifiedCitationsData.csv"
             
         try:
-            citations_dir = self.project_root / DATA_DIRS["crawler_citations"]
-            
-            if not citations_dir.exists():
+            if not self.corpus.citations_dir.exists():
                 return CSVGenerationResult(
                     output_path=output_path,
                     row_count=0,
@@ -226,35 +270,15 @@ class CSVGenerator:
                     error="CitationsCrawlerData directory not found"
                 )
                 
-            # Find all conferences with citation data
-            conferences = set()
-            
-            # Check main directory
-            for file in citations_dir.glob("*_citations_data.json"):
-                conferences.add(file.stem.replace("_citations_data", ""))
-                
-            # Check intermediate directory
-            intermediate_dir = citations_dir / "IntermediateCitations"
-            if intermediate_dir.exists():
-                for file in intermediate_dir.glob("*_citations_s2.json"):
-                    conferences.add(file.stem.replace("_citations_s2", ""))
-                    
-            # Process each conference
+            # Process each conference with crawled or fallback citation data
             all_rows = []
             
-            for conference in sorted(conferences):
-                # Try primary file first, then fallback
-                primary = citations_dir / f"{conference}_citations_data.json"
-                fallback = intermediate_dir / f"{conference}_citations_s2.json"
+            for conference in self.corpus.citation_conferences():
+                citation_file = self.corpus.citations_path(conference)
                 
-                citation_file = primary if primary.exists() else fallback
-                
-                if not citation_file.exists():
-                    continue
-                    
                 # Load JSON with tolerant encoding; skip invalid/empty files
                 try:
-                    data = self.file_manager.load_json(citation_file)
+                    data = self.corpus.citations(conference)
                 except Exception as e:
                     logger.warning(f"Skipping citation file due to read/parse error: {citation_file} ({e})")
                     continue
@@ -265,7 +289,11 @@ class CSVGenerator:
                 # Count papers by continent
                 continent_counts: Dict[str, int] = {}
                 
-                # Process citations
+                # Process citations: gather every citation's countries, then
+                # resolve them to continents in one batch for the whole file
+                all_countries = []
+                country_spans = []
+                
                 if isinstance(data, dict):
                     for _, citing_list in data.items():
                         if not isinstance(citing_list, list):
@@ -275,12 +303,19 @@ class CSVGenerator:
                             if not isinstance(citation, dict):
                                 continue
                                 
-                            # Extract continents from authors
-                            continents = self._extract_continents_from_citation(citation)
+                            start = len(all_countries)
+                            all_countries.extend(self._extract_countries_from_citation(citation))
+                            country_spans.append((start, len(all_countries)))
                             
-                            for continent in continents:
-                                continent_counts[continent] = continent_counts.get(continent, 0) + 1
-                                
+                all_continents = self.continent_mapper.country_to_continent_many(all_countries)
+                
+                for start, end in country_spans:
+                    # Unique continents per citation
+                    continents = {c for c in all_continents[start:end] if c}
+                    
+                    for continent in continents:
+                        continent_counts[continent] = continent_counts.get(continent, 0) + 1
+                        
                 # Add to rows
                 for continent, count in continent_counts.items():
                     all_rows.append({
@@ -315,11 +350,18 @@ class CSVGenerator:
             
     def _extract_continents_from_citation(self, citation: Dict) -> set:
         """Extract unique continents from citation authors."""
-        continents = set()
+        countries = self._extract_countries_from_citation(citation)
+        continents = self.continent_mapper.country_to_continent_many(countries)
+        
+        return {continent for continent in continents if continent}
+        
+    def _extract_countries_from_citation(self, citation: Dict) -> List:
+        """Extract raw country values of all citation author institutions."""
+        countries = []
         
         authors = citation.get("Authors", [])
         if not isinstance(authors, list):
-            return continents
+            return countries
             
         for author in authors:
             if not isinstance(author, dict):
@@ -337,16 +379,13 @@ class CSVGenerator:
                     continue
                     
                 # Try different field names for country
-                country = (inst.get("Country") or 
-                          inst.get("country") or 
-                          inst.get("CountryCode"))
-                          
-                continent = self.continent_mapper.country_to_continent(country)
-                if continent:
-                    continents.add(continent)
-                    
-        return continents
+                countries.append(inst.get("Country") or 
+                                 inst.get("country") or 
+                                 inst.get("CountryCode"))
+                                 
+        return countries
         
+    @traced(category="processor")
     def generate_all_csvs(self) -> Dict[str, CSVGenerationResult]:
         """
         Generate all unified CSV files.
@@ -369,6 +408,14 @@ class CSVGenerator:
         return results
 
 
+def _is_socc_duplicate(conference: str) -> bool:
+    """
+    Whether a conference's ProcessedData duplicates cloud_data.json.
+    Same test as on the file stem ("socc_data", "socc_*_data"): case-sensitive.
+    """
+    return f"{conference}_data".startswith("socc_")
+
+
 def main():
     """Main entry point for CSV generator."""
     import sys
@@ -4,13 +4,24 @@ Processes extended crawler data into reduced/processed format.
 """
 
 import logging
+import sys
+import tracemalloc
 from pathlib import Path
-from typing import Dict, List, Optional
-from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from dataclasses import dataclass, asdict
 
+from src.utils import columnar, continent_mapper, file_manager, json_stream
 from src.utils.file_manager import FileManager
+from src.utils.columnar import ColumnarStore
 from src.utils.continent_mapper import ContinentMapper
-from src.config.constants import DATA_DIRS
+from src.utils.corpus import Corpus
+from src.utils.manifest import FileManifest, sources_digest
+from src.utils.run_report import RunReport, StageMetrics, StageTimer
+from src.utils.tracing import disable_tracing, enable_tracing, get_tracer, traced
+from src.config import constants
+from src.config.constants import (
+    DATA_DIRS, OUTPUT_DIRS, CACHE_FILES, PROCESSED_FORMAT, PROCESSED_FORMATS, VERSION
+)
 
 logger = logging.getLogger(__name__)
 
@@ -22,22 +33,74 @@ class ProcessingStats:
     papers_with_continent: int = 0
     papers_without_sufficient_data: int = 0
     unknown_countries: int = 0
+    
+    def merge(self, other: "ProcessingStats") -> None:
+        """Accumulate another stats object into this one."""
+        self.total_papers += other.total_papers
+        self.papers_with_continent += other.papers_with_continent
+        self.papers_without_sufficient_data += other.papers_without_sufficient_data
+        self.unknown_countries += other.unknown_countries
 
 
 class DataReducer:
     """
     Processes extended crawler data into reduced format with essential fields.
     Calculates predominant continent for each paper.
+    
+    In streaming mode, conferences are read and written one paper at a time,
+    so peak memory depends on the largest paper rather than the largest
+    conference.
+    
+    In incremental mode, a manifest records each conference's input hash,
+    size, mtime and the reducer code version; conferences whose inputs and
+    code are unchanged are skipped on re-runs.
+    
+    With a run report, loading, reducing and saving each conference are
+    measured as stages "process_data/<conference>/<step>".
+    
+    Output is written as JSON ({conference}_data.json), as a binary columnar
+    store ({conference}_data.bin) or both, depending on output_format.
     """
     
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, streaming: bool = False,
+                 incremental: bool = True, report: Optional[RunReport] = None,
+                 corpus: Optional[Corpus] = None,
+                 output_format: str = PROCESSED_FORMAT, keep_stores: bool = False):
         """
         Initialize DataReducer.
         
         Args:
             project_root: Root directory of project
+            streaming: Stream papers from input to output instead of
+                loading whole conferences (default: False)
+            incremental: Skip conferences whose input and code are unchanged
+                since the last run (default: True)
+            report: Run report receiving per-conference stage metrics (optional)
+            corpus: Corpus that reduced conferences are registered in, so
+                later stages skip re-reading them; conferences reduced by
+                worker processes are registered as columnar stores (optional)
+            output_format: "json", "binary" or "both" (default: PROCESSED_FORMAT)
+            keep_stores: Keep each reduced conference as a ColumnarStore in
+                `stores`, whatever the output format (default: False)
+            
+        Raises:
+            ValueError: If output_format is unknown
         """
+        if output_format not in PROCESSED_FORMATS:
+            raise ValueError(f"Unknown output format: {output_format} "
+                             f"(expected one of {', '.join(PROCESSED_FORMATS)})")
+            
         self.project_root = Path(project_root)
+        self.streaming = streaming
+        self.incremental = incremental
+        self.report = report
+        self.corpus = corpus
+        self.output_format = output_format
+        self.write_json = output_format in ("json", "both")
+        self.write_binary = output_format in ("binary", "both")
+        self.keep_stores = keep_stores
+        self.stores: Dict[str, ColumnarStore] = {}
+        self.skipped_conferences: List[str] = []
         self.file_manager = FileManager(project_root)
         self.continent_mapper = ContinentMapper()
         
@@ -106,38 +169,169 @@ class DataReducer:
         total_stats = ProcessingStats()
         
         for year, papers in extended_data.items():
-            year_papers = []
-            
-            for paper in papers:
-                processed_paper, paper_stats = self.process_paper(paper, year)
-                year_papers.append(processed_paper)
-                
-                # Accumulate stats
-                total_stats.total_papers += paper_stats.total_papers
-                total_stats.papers_with_continent += paper_stats.papers_with_continent
-                total_stats.papers_without_sufficient_data += paper_stats.papers_without_sufficient_data
-                total_stats.unknown_countries += paper_stats.unknown_countries
-                
-            data_per_year[year] = year_papers
+            data_per_year[year] = list(self._reduce_papers(papers, year, total_stats))
             
             # Log year stats
             year_total = len(papers)
             if year_total > 0:
                 logger.debug(f"  Year {year}: {year_total} papers processed")
                 
-        # Log conference summary
+        self._log_conference_summary(total_stats)
+            
+        return data_per_year, total_stats
+        
+    def process_conference_stream(self, conference: str,
+                                  year_groups: Iterable[Tuple[str, Iterable[Dict]]],
+                                  total_stats: ProcessingStats
+                                  ) -> Iterator[Tuple[str, Iterator[Dict]]]:
+        """
+        Lazily process papers streamed as (year, papers) groups.
+        
+        Args:
+            conference: Conference name
+            year_groups: Iterable of (year, iterable of papers)
+            total_stats: Stats object updated as papers are consumed
+            
+        Yields:
+            Tuples of (year, iterator over processed papers)
+        """
+        logger.info(f"Processing conference (streaming): {conference}")
+        
+        for year, papers in year_groups:
+            yield year, self._reduce_papers(papers, year, total_stats)
+            
+    def _reduce_papers(self, papers: Iterable[Dict], year: str,
+                       total_stats: ProcessingStats) -> Iterator[Dict]:
+        """
+        Process papers of one year, accumulating stats into total_stats.
+        
+        Args:
+            papers: Papers of the year
+            year: Publication year
+            total_stats: Stats object to accumulate into
+            
+        Yields:
+            Processed paper dictionaries
+        """
+        for paper in papers:
+            processed_paper, paper_stats = self.process_paper(paper, year)
+            total_stats.merge(paper_stats)
+            yield processed_paper
+            
+    def _log_conference_summary(self, total_stats: ProcessingStats) -> None:
+        """Log the share of papers with continent data for a conference."""
         if total_stats.total_papers > 0:
             sufficient_data_pct = (total_stats.papers_with_continent / 
                                   total_stats.total_papers * 100)
             logger.info(f"  Total: {total_stats.total_papers} papers, "
                        f"{sufficient_data_pct:.1f}% with continent data")
+                       
+    @traced(category="processor")
+    def process_conference_file(self, conference: str, input_path: Path,
+                                output_path: Path) -> ProcessingStats:
+        """
+        Load, process and save a single conference.
+        
+        Args:
+            conference: Conference name
+            input_path: Extended crawler data file
+            output_path: Processed JSON file; the binary file is written
+                next to it with a .bin suffix
             
-        return data_per_year, total_stats
+        Returns:
+            Processing stats for the conference
+        """
+        stage = f"process_data/{conference}"
+        binary_path = output_path.with_suffix(".bin")
+        store = ColumnarStore() if self.write_binary or self.keep_stores else None
+        
+        if self.streaming:
+            stats = ProcessingStats()
+            
+            # Loading, reducing and saving are interleaved: one stage
+            with self._stage(f"{stage}/stream") as timer:
+                groups = self.process_conference_stream(
+                    conference, self.file_manager.iter_json_groups(input_path), stats
+                )
+                if not self.write_json:
+                    store.add_conference(conference, groups)
+                else:
+                    if store is not None:
+                        groups = store.tee_conference(conference, groups)
+                    self.file_manager.save_json_stream(output_path, groups)
+                if self.write_binary:
+                    store.save(binary_path)
+                timer.records = stats.total_papers
+                
+            self._log_conference_summary(stats)
+        else:
+            with self._stage(f"{stage}/load") as timer:
+                extended_data = self.file_manager.load_json(input_path)
+                timer.records = sum(len(papers) for papers in extended_data.values())
+                
+            with self._stage(f"{stage}/reduce") as timer:
+                processed_data, stats = self.process_conference(conference, extended_data)
+                timer.records = stats.total_papers
+                
+            with self._stage(f"{stage}/save", records=stats.total_papers):
+                if self.write_json:
+                    self.file_manager.save_json(output_path, processed_data)
+                if store is not None:
+                    store.add_conference(conference, processed_data.items())
+                if self.write_binary:
+                    store.save(binary_path)
+                
+            if self.corpus is not None and self.write_json:
+                self.corpus.put(output_path, processed_data)
+                
+        if self.corpus is not None and self.write_binary:
+            self.corpus.put(binary_path, store)
+        if self.keep_stores:
+            self.stores[conference] = store
+            
+        for path in self.output_paths(output_path):
+            logger.info(f"Saved: {path.name}")
         
-    def process_all_conferences(self) -> Dict[str, ProcessingStats]:
+        return stats
+        
+    def output_paths(self, output_path: Path) -> List[Path]:
+        """
+        Files written for a conference in the configured format.
+        
+        Args:
+            output_path: Processed JSON file of the conference
+            
+        Returns:
+            The JSON and/or binary file paths
+        """
+        paths = []
+        if self.write_json:
+            paths.append(output_path)
+        if self.write_binary:
+            paths.append(output_path.with_suffix(".bin"))
+        return paths
+        
+    def _stage(self, name: str, records: Optional[int] = None) -> StageTimer:
+        """Measure a stage, recording it in the run report if there is one."""
+        if self.report is not None:
+            return self.report.stage(name, records)
+        return StageTimer(name, records)
+        
+    @traced(category="processor")
+    def process_all_conferences(self, workers: int = 1,
+                                force: bool = False) -> Dict[str, ProcessingStats]:
         """
         Process all conferences from ExtendedCrawlerData to ProcessedData.
         
+        Unchanged conferences are skipped in incremental mode; their stats come
+        from the manifest and their names are listed in skipped_conferences.
+        
+        Args:
+            workers: Number of worker processes. Conferences are independent,
+                so with workers > 1 they are reduced in parallel; output files
+                and stats are identical to the serial run (default: 1)
+            force: Reprocess every conference even if unchanged (default: False)
+        
         Returns:
             Dictionary of conference -> stats
         """
@@ -160,25 +354,83 @@ class DataReducer:
             
         logger.info(f"Found {len(conferences)} conferences to process")
         
+        jobs = [
+            (conference,
+             extended_dir / f"{conference}_extended_data.json",
+             output_dir / f"{conference}_data.json")
+            for conference in conferences
+        ]
+        
+        self.skipped_conferences = []
+        
+        if not self.incremental:
+            return self._process_jobs(jobs, workers)
+            
+        manifest = FileManifest(
+            self.project_root / OUTPUT_DIRS["cache"] / CACHE_FILES["reduction_manifest"]
+        )
+        code_version = reduction_code_version()
+        
+        cached_stats = {}
+        pending = []
+        
+        for job in jobs:
+            conference, input_path, output_path = job
+            entry = manifest.get(conference)
+            
+            outputs_exist = all(path.exists() for path in self.output_paths(output_path))
+            
+            if (not force and entry and "stats" in entry and outputs_exist
+                    and manifest.is_fresh(conference, input_path, code_version)):
+                cached_stats[conference] = ProcessingStats(**entry["stats"])
+                self.skipped_conferences.append(conference)
+            else:
+                pending.append(job)
+                
+        if self.skipped_conferences:
+            logger.info(f"Skipping {len(self.skipped_conferences)} unchanged conferences: "
+                       f"{', '.join(self.skipped_conferences)}")
+            
+        processed_stats = self._process_jobs(pending, workers)
+        
+        for conference, input_path, _ in pending:
+            if conference in processed_stats:
+                manifest.record(conference, input_path, code_version,
+                                stats=asdict(processed_stats[conference]))
+            else:
+                manifest.discard(conference)
+        manifest.save()
+        
+        # Keep conference order regardless of which were skipped
+        return {
+            conference: cached_stats.get(conference) or processed_stats[conference]
+            for conference, _, _ in jobs
+            if conference in cached_stats or conference in processed_stats
+        }
+        
+    def _process_jobs(self, jobs: List[Tuple[str, Path, Path]],
+                      workers: int) -> Dict[str, ProcessingStats]:
+        """
+        Process conference jobs serially or with a process pool.
+        
+        Args:
+            jobs: List of (conference, input_path, output_path)
+            workers: Maximum number of worker processes
+            
+        Returns:
+            Dictionary of conference -> stats for successful jobs
+        """
+        if workers > 1 and len(jobs) > 1:
+            return self._process_parallel(jobs, workers)
+            
         # Process each conference
         all_stats = {}
         
-        for conference in conferences:
-            input_path = extended_dir / f"{conference}_extended_data.json"
-            output_path = output_dir / f"{conference}_data.json"
-            
+        for conference, input_path, output_path in jobs:
             try:
-                # Load extended data
-                extended_data = self.file_manager.load_json(input_path)
-                
-                # Process conference
-                processed_data, stats = self.process_conference(conference, extended_data)
-                
-                # Save processed data
-                self.file_manager.save_json(output_path, processed_data)
-                logger.info(f"Saved: {output_path.name}")
-                
-                all_stats[conference] = stats
+                all_stats[conference] = self.process_conference_file(
+                    conference, input_path, output_path
+                )
                 
             except Exception as e:
                 logger.error(f"Failed to process {conference}: {e}")
@@ -186,6 +438,65 @@ class DataReducer:
                 
         return all_stats
         
+    def _process_parallel(self, jobs: List[Tuple[str, Path, Path]],
+                          workers: int) -> Dict[str, ProcessingStats]:
+        """
+        Fan conference jobs out to a process pool and merge their stats.
+        
+        Args:
+            jobs: List of (conference, input_path, output_path)
+            workers: Maximum number of worker processes
+            
+        Returns:
+            Dictionary of conference -> stats, in job order
+        """
+        # Deferred: multiprocessing is only needed on this path
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        
+        workers = min(workers, len(jobs))
+        logger.info(f"Processing conferences with {workers} worker processes")
+        
+        all_stats = {}
+        
+        # Spawn rather than fork: the pipeline starts this pool from a task
+        # thread while other threads may hold locks (logging, I/O), which a
+        # forked child would inherit in their locked state
+        context = multiprocessing.get_context("spawn")
+        
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                 initializer=_init_worker_logging,
+                                 initargs=(logging.getLogger().getEffectiveLevel(),
+                                           tracemalloc.is_tracing())) as executor:
+            futures = [
+                (conference, executor.submit(
+                    _process_conference_worker, self.project_root, self.streaming,
+                    conference, input_path, output_path, self.report is not None,
+                    get_tracer() is not None, self.output_format, self.corpus is not None
+                ))
+                for conference, input_path, output_path in jobs
+            ]
+            
+            # Collect in submission order so results match the serial path
+            for conference, future in futures:
+                try:
+                    all_stats[conference], metrics, events, store = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to process {conference}: {e}")
+                    continue
+                    
+                # The reduced data is handed back as a compact store, so later
+                # stages need not re-parse the file the worker wrote
+                if store is not None:
+                    self.corpus.put_papers_store(conference, store)
+                    
+                for stage_metrics in metrics:
+                    self.report.add(stage_metrics)
+                if events:
+                    get_tracer().extend(events)
+                    
+        return all_stats
+        
     def generate_summary_report(self, stats: Dict[str, ProcessingStats]) -> str:
         """
         Generate summary report of processing results.
@@ -213,8 +524,9 @@ class DataReducer:
             pct = (conf_stats.papers_with_continent / conf_stats.total_papers * 100 
                    if conf_stats.total_papers > 0 else 0)
             
+            unchanged = " (unchanged)" if conference in self.skipped_conferences else ""
             lines.append(f"{conference:15s}: {conf_stats.total_papers:4d} papers, "
-                        f"{pct:5.1f}% with continent")
+                        f"{pct:5.1f}% with continent{unchanged}")
                         
         lines.extend([
             "",
@@ -228,9 +540,75 @@ class DataReducer:
         return "\n".join(lines)
 
 
+def reduction_code_version() -> str:
+    """
+    Version of the code that determines reduced output.
+    Changes whenever the reducer, its helpers or the constants change.
+    """
+    return sources_digest(
+        [Path(module.__file__) for module in
+         (sys.modules[__name__], columnar, continent_mapper, file_manager, json_stream,
+          constants)],
+        salt=VERSION
+    )
+
+
+def _init_worker_logging(level: int, trace_memory: bool = False) -> None:
+    """
+    Configure logging in a spawned worker, which does not inherit the parent's.
+    With trace_memory, tracemalloc is started too, so the stage metrics the
+    worker returns carry its own traced peak.
+    """
+    logging.basicConfig(level=level, format='%(levelname)s - %(message)s')
+    if trace_memory:
+        tracemalloc.start()
+
+
+def _process_conference_worker(project_root: Path, streaming: bool, conference: str,
+                               input_path: Path, output_path: Path, collect_metrics: bool = False,
+                               trace: bool = False, output_format: str = PROCESSED_FORMAT,
+                               return_store: bool = False
+                               ) -> Tuple[ProcessingStats, List[StageMetrics], List[Dict],
+                                          Optional[ColumnarStore]]:
+    """
+    Reduce one conference inside a worker process.
+    
+    Returns stats plus the stage metrics and trace events recorded in the
+    worker, for the parent to merge, and with return_store the reduced
+    conference as a ColumnarStore (None otherwise).
+    """
+    report = RunReport(conference) if collect_metrics else None
+    
+    # Start from an empty tracer: a reused worker still holds the events of
+    # its previous job
+    disable_tracing()
+    tracer = enable_tracing() if trace else None
+    
+    reducer = DataReducer(project_root, streaming=streaming, report=report,
+                          output_format=output_format, keep_stores=return_store)
+    stats = reducer.process_conference_file(conference, input_path, output_path)
+    # Pool workers exit without running atexit handlers
+    reducer.file_manager.encoding_registry.save()
+    
+    return (stats, report.stages if report else [],
+            disable_tracing().events if tracer else [], reducer.stores.get(conference))
+
+
 def main():
     """Main entry point for data reducer."""
-    import sys
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Reduce extended crawler data")
+    parser.add_argument("--streaming", action="store_true",
+                        help="Stream papers instead of loading whole conferences")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Number of conferences processed in parallel (default: 1)")
+    parser.add_argument("--force", action="store_true",
+                        help="Reprocess all conferences, even unchanged ones")
+    parser.add_argument("--format", choices=PROCESSED_FORMATS, default=PROCESSED_FORMAT,
+                        help="Write processed data as JSON, binary columnar stores or "
+                             f"both (default: {PROCESSED_FORMAT})")
+    args = parser.parse_args()
     
     # Setup logging
     logging.basicConfig(
@@ -242,11 +620,11 @@ def main():
     project_root = Path(__file__).parent.parent.parent
     
     # Process all conferences
-    reducer = DataReducer(project_root)
+    reducer = DataReducer(project_root, streaming=args.streaming, output_format=args.format)
     
     try:
         logger.info("Starting data reduction process...")
-        stats = reducer.process_all_conferences()
+        stats = reducer.process_all_conferences(workers=args.workers, force=args.force)
         
         # Print summary
         summary = reducer.generate_summary_report(stats)
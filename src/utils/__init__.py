@@ -1,8 +1,33 @@
-"""Utility modules for Conference Data Analysis."""
+"""Utility modules for Conference Data Analysis.
 
-from .file_manager import FileManager
-from .continent_mapper import ContinentMapper
+Exports are resolved lazily so that importing one utility does not pull in
+the dependencies of the others (e.g. pycountry_convert for ContinentMapper).
+"""
 
-__all__ = ["FileManager", "ContinentMapper"]
+import importlib
 
+_EXPORTS = {
+    "FileManager": ".file_manager",
+    "Corpus": ".corpus",
+    "ColumnarStore": ".columnar",
+    "SymbolTable": ".symbols",
+    "ContinentMapper": ".continent_mapper",
+    "TaskGraph": ".task_graph",
+    "Task": ".task_graph",
+}
 
+__all__ = ["FileManager", "Corpus", "ColumnarStore", "SymbolTable", "ContinentMapper",
+           "TaskGraph", "Task"]
+
+
+def __getattr__(name):
+    """Import exported classes on first access (PEP 562)."""
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,564 @@
+"""
+Columnar paper store for Conference Data Analysis project.
+Holds papers, authors and affiliations as flat typed arrays (a struct of
+arrays) instead of nested dicts. Rows are linked by CSR-style offset arrays,
+and repeated strings (institutions, countries, continents, conferences,
+years) are stored as SymbolTable codes.
+
+Layout, for paper p, author a and affiliation f:
+    authors of p         author_offsets[p] .. author_offsets[p + 1]
+    affiliations of a    affiliation_offsets[a] .. affiliation_offsets[a + 1]
+    institution of f     institution[f]  (code, MISSING or NULL)
+    country of f         country[f]      (code, MISSING if no "Country" key)
+    title of p           titles[title_offsets[p]:title_offsets[p + 1]] (UTF-8)
+    predominant of p     continents[continent_offsets[p]:continent_offsets[p + 1]]
+
+An affiliation costs 8 bytes and an author 4, against a few hundred bytes
+for the equivalent dicts and strings. Author names and fields the
+processors do not read are not kept.
+
+Stores are saved in a binary file: a pickle (protocol 5) of the symbols and
+group index whose columns are passed out-of-band and written after it as
+raw, aligned buffers, so loading is a few memory copies instead of parsing.
+A store can also be loaded memory-mapped, with its columns read in place
+from the page cache, which processes mapping the same file share.
+"""
+
+import logging
+import mmap
+import os
+import pickle
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.utils.file_manager import FileManager
+from src.utils.symbols import MISSING, NULL, SymbolTable
+
+logger = logging.getLogger(__name__)
+
+# Binary file layout: magic, header length, buffer count, buffer lengths,
+# pickled header, then each column buffer starting at an aligned offset
+_MAGIC = b"CDASTORE"
+_FORMAT_VERSION = 1
+_ALIGNMENT = 64
+
+# Array columns, in file order
+_COLUMNS = ("paper_conference", "paper_year", "title_offsets", "titles", "author_offsets",
+            "continent_offsets", "continents", "affiliation_offsets", "institution", "country")
+
+
+def _aligned(offset: int) -> int:
+    """Round an offset up to the buffer alignment."""
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+class ColumnarStore:
+    """
+    Papers of one or more conferences in columnar form.
+
+    Papers are appended by (conference, year) group, so each group is a
+    contiguous range of paper indices; queries return those ranges.
+    """
+
+    def __init__(self, symbols: Optional[SymbolTable] = None):
+        """
+        Initialize an empty ColumnarStore.
+
+        Args:
+            symbols: Symbol table to intern strings into (default: a new one);
+                share one between stores to make their codes comparable
+        """
+        self.symbols = symbols or SymbolTable()
+
+        # Papers
+        self.paper_conference = array('i')
+        self.paper_year = array('i')
+        self.title_offsets = array('Q', [0])
+        self.titles = bytearray()
+        self.author_offsets = array('I', [0])
+        self.continent_offsets = array('I', [0])
+        self.continents = array('i')
+
+        # Authors
+        self.affiliation_offsets = array('I', [0])
+
+        # Affiliations
+        self.institution = array('i')
+        self.country = array('i')
+
+        # (conference code, year code, first paper, end paper) per group
+        self._groups: List[Tuple[int, int, int, int]] = []
+        self._papers_without_predominant = 0
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_directory(cls, directory: Path | str, suffix: str = "_extended_data.json",
+                       conferences: Optional[Iterable[str]] = None,
+                       file_manager: Optional[FileManager] = None,
+                       stream: bool = False,
+                       symbols: Optional[SymbolTable] = None) -> "ColumnarStore":
+        """
+        Build a store from the "{year: [paper, ...]}" files of a directory.
+
+        Works for extended crawler data and ProcessedData alike; only the
+        latter has predominant continents.
+
+        Args:
+            directory: Directory of conference files
+            suffix: File name suffix after the conference name
+            conferences: Conferences to load (default: every matching file)
+            file_manager: FileManager used for loading (default: a new one)
+            stream: Parse files incrementally, holding one paper at a time
+                (slower, but peak memory does not grow with file size)
+            symbols: Symbol table to intern into (default: a new one)
+
+        Returns:
+            ColumnarStore of the conferences, in sorted order
+        """
+        directory = Path(directory)
+        file_manager = file_manager or FileManager()
+        store = cls(symbols)
+
+        if conferences is None:
+            conferences = [path.name[:-len(suffix)] for path in directory.glob(f"*{suffix}")]
+
+        for conference in sorted(conferences):
+            path = directory / f"{conference}{suffix}"
+            if stream:
+                store.add_conference(conference, file_manager.iter_json_groups(path))
+            else:
+                store.add_conference(conference, file_manager.load_json(path).items())
+
+        logger.info(f"Columnar store: {len(store)} papers, {store.num_authors} authors, "
+                    f"{store.num_affiliations} affiliations from {directory}")
+        return store
+
+    def add_conference(self, conference: str,
+                       groups: Iterable[Tuple[str, Iterable[Dict]]]) -> None:
+        """
+        Append the papers of a conference.
+
+        Args:
+            conference: Conference name
+            groups: Iterable of (year, iterable of paper dicts)
+        """
+        for _, papers in self.tee_conference(conference, groups):
+            for _ in papers:
+                pass
+
+    def tee_conference(self, conference: str, groups: Iterable[Tuple[str, Iterable[Dict]]]
+                       ) -> Iterator[Tuple[str, Iterator[Dict]]]:
+        """
+        Pass (year, papers) groups through, appending each paper as it goes by.
+
+        Lets a stream of papers be written elsewhere (e.g. with
+        FileManager.save_json_stream()) and stored in the same pass. Each
+        group must be consumed before the next is requested.
+
+        Args:
+            conference: Conference name
+            groups: Iterable of (year, iterable of paper dicts)
+
+        Yields:
+            Tuples of (year, iterator over the group's papers)
+        """
+        conference_code = self.symbols.intern(conference)
+
+        for year, papers in groups:
+            year_code = self.symbols.intern(str(year))
+            start = len(self.paper_conference)
+
+            yield year, self._tee_papers(conference_code, year_code, papers)
+
+            self._groups.append((conference_code, year_code, start, len(self.paper_conference)))
+
+    def _tee_papers(self, conference_code: int, year_code: int,
+                    papers: Iterable[Dict]) -> Iterator[Dict]:
+        """Append papers while yielding them on."""
+        for paper in papers:
+            self.add_paper(conference_code, year_code, paper)
+            yield paper
+
+    def extend(self, other: "ColumnarStore") -> None:
+        """
+        Append all papers of another store.
+
+        Codes are translated into this store's symbol table unless both
+        share one.
+
+        Args:
+            other: Store to append
+        """
+        table = None
+        if other.symbols is not self.symbols:
+            # Negative indices map the sentinels to themselves
+            table = [self.symbols.intern(symbol) for symbol in other.symbols] + [NULL, MISSING]
+
+        def translate(codes):
+            return codes if table is None else map(table.__getitem__, codes)
+
+        def shifted(offsets, base):
+            return map(base.__add__, offsets[1:])
+
+        papers, titles = len(self), len(self.titles)
+
+        self.paper_conference.extend(translate(other.paper_conference))
+        self.paper_year.extend(translate(other.paper_year))
+        self.titles += other.titles
+        self.title_offsets.extend(shifted(other.title_offsets, titles))
+        self.author_offsets.extend(shifted(other.author_offsets, self.num_authors))
+        self.continent_offsets.extend(shifted(other.continent_offsets, len(self.continents)))
+        self.continents.extend(translate(other.continents))
+        self.affiliation_offsets.extend(shifted(other.affiliation_offsets, self.num_affiliations))
+        self.institution.extend(translate(other.institution))
+        self.country.extend(translate(other.country))
+
+        for conference, year, start, end in other._groups:
+            if table is not None:
+                conference, year = table[conference], table[year]
+            self._groups.append((conference, year, start + papers, end + papers))
+        self._papers_without_predominant += other._papers_without_predominant
+
+    def add_paper(self, conference_code: int, year_code: int, paper: Dict) -> int:
+        """
+        Append one paper.
+
+        Institutions follow BigTechAnalyzer.extract_institutions(): a dict
+        without a name is MISSING (ignored), a bare string is a name without
+        country, and any other value is NULL (counted as "no institution").
+
+        Args:
+            conference_code: Symbol code of the conference
+            year_code: Symbol code of the year
+            paper: Paper dict (extended or processed format)
+
+        Returns:
+            Index of the paper
+        """
+        intern, encode = self.symbols.intern, self.symbols.encode
+        institution, country = self.institution, self.country
+
+        title = paper.get("Title", "")
+        if isinstance(title, str):
+            self.titles += title.encode('utf-8', 'surrogatepass')
+        self.title_offsets.append(len(self.titles))
+
+        authors = paper.get("Authors and Institutions") or []
+        for author in authors if isinstance(authors, list) else []:
+            if not isinstance(author, dict):
+                continue
+
+            for inst in author.get("Institutions") or []:
+                if isinstance(inst, dict):
+                    name = inst.get("Institution Name")
+                    institution.append(intern(name) if name and isinstance(name, str) else MISSING)
+                    country.append(encode(inst["Country"]) if "Country" in inst else MISSING)
+                elif isinstance(inst, str):
+                    institution.append(intern(inst))
+                    country.append(MISSING)
+                else:
+                    institution.append(NULL)
+                    country.append(MISSING)
+
+            self.affiliation_offsets.append(len(institution))
+
+        self.author_offsets.append(len(self.affiliation_offsets) - 1)
+
+        predominant = paper.get("Predominant Continent")
+        if predominant is None:
+            self._papers_without_predominant += 1
+        else:
+            values = predominant if isinstance(predominant, list) else [predominant]
+            self.continents.extend(encode(value) for value in values)
+        self.continent_offsets.append(len(self.continents))
+
+        self.paper_conference.append(conference_code)
+        self.paper_year.append(year_code)
+        return len(self.paper_conference) - 1
+
+    def set_predominant(self, continents: Iterable[List[str]]) -> None:
+        """
+        Replace the predominant continents of all papers.
+
+        Args:
+            continents: Continent codes of each paper, in paper order
+        """
+        offsets = array('I', [0])
+        codes = array('i')
+
+        for paper_continents in continents:
+            codes.extend(self.symbols.encode(value) for value in paper_continents)
+            offsets.append(len(codes))
+
+        if len(offsets) != len(self.continent_offsets):
+            raise ValueError(f"Expected continents of {len(self)} papers, got {len(offsets) - 1}")
+
+        self.continent_offsets, self.continents = offsets, codes
+        self._papers_without_predominant = 0
+
+    # ------------------------------------------------------------------
+    # Binary files
+    # ------------------------------------------------------------------
+
+    def save(self, path: Path | str) -> None:
+        """
+        Save the store to a binary file.
+        The file is written to a temporary path and moved into place on success.
+
+        Args:
+            path: Output file path
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + '.tmp')
+
+        buffers: List[pickle.PickleBuffer] = []
+        header = pickle.dumps({
+            "version": _FORMAT_VERSION,
+            "byteorder": sys.byteorder,
+            "symbols": list(self.symbols),
+            "groups": self._groups,
+            "papers_without_predominant": self._papers_without_predominant,
+            "columns": {
+                name: (memoryview(getattr(self, name)).format,
+                       pickle.PickleBuffer(getattr(self, name)))
+                for name in _COLUMNS
+            },
+        }, protocol=5, buffer_callback=buffers.append)
+
+        views = [buffer.raw() for buffer in buffers]
+        prefix = _MAGIC + struct.pack(f"<QQ{len(views)}Q", len(header), len(views),
+                                      *(view.nbytes for view in views))
+
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(prefix)
+                f.write(header)
+                for view in views:
+                    f.write(bytes(_aligned(f.tell()) - f.tell()))
+                    f.write(view)
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        logger.debug(f"Saved columnar store to {path}")
+
+    @classmethod
+    def load(cls, path: Path | str, mmap_columns: bool = False) -> "ColumnarStore":
+        """
+        Load a store saved with save().
+
+        With mmap_columns, the file is memory-mapped and the columns are
+        read-only memoryviews into it instead of private arrays: nothing is
+        copied, pages are read on first access, and processes loading the
+        same file share them. Such a store can be queried, extended into
+        another store and saved, but not appended to. The map stays valid
+        if the file is replaced on disk (save() writes a new file).
+
+        Args:
+            path: Binary store file
+            mmap_columns: Map the file instead of reading it (default: False)
+
+        Returns:
+            ColumnarStore with its own symbol table
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            ValueError: If the file is not a store of this format and platform
+        """
+        path = Path(path)
+
+        if not path.exists():
+            raise FileNotFoundError(f"Store file not found: {path}")
+
+        if mmap_columns:
+            with open(path, 'rb') as f:
+                # The views keep the map alive; it is unmapped once they are gone
+                data = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        else:
+            data = memoryview(path.read_bytes())
+
+        state, buffers = cls._parse(path, data)
+
+        store = cls(SymbolTable.from_symbols(state["symbols"]))
+
+        for name, (typecode, buffer) in state["columns"].items():
+            if mmap_columns:
+                column = buffer.cast(typecode)
+            elif typecode == 'B':
+                column = bytearray(buffer)
+            else:
+                column = array(typecode)
+                column.frombytes(buffer)
+            setattr(store, name, column)
+
+        store._groups = state["groups"]
+        store._papers_without_predominant = state["papers_without_predominant"]
+
+        logger.debug(f"Loaded columnar store from {path}")
+        return store
+
+    @staticmethod
+    def _parse(path: Path, data: memoryview) -> Tuple[Dict, List[memoryview]]:
+        """Split a binary store file into its unpickled header and column buffers."""
+        prefix = len(_MAGIC) + 16
+        if data[:len(_MAGIC)] != _MAGIC or len(data) < prefix:
+            raise ValueError(f"Not a columnar store file: {path}")
+
+        header_length, count = struct.unpack_from("<QQ", data, len(_MAGIC))
+        lengths = struct.unpack_from(f"<{count}Q", data, prefix)
+        offset = prefix + 8 * count
+        header = data[offset:offset + header_length]
+        offset += header_length
+
+        buffers = []
+        for length in lengths:
+            offset = _aligned(offset)
+            buffers.append(data[offset:offset + length])
+            offset += length
+
+        state = pickle.loads(header, buffers=buffers)
+        if state.get("version") != _FORMAT_VERSION or state.get("byteorder") != sys.byteorder:
+            raise ValueError(f"Unsupported columnar store file: {path}")
+        return state, buffers
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.paper_conference)
+
+    @property
+    def num_authors(self) -> int:
+        """Number of authors (non-dict author entries are not stored)."""
+        return len(self.affiliation_offsets) - 1
+
+    @property
+    def num_affiliations(self) -> int:
+        """Number of author-institution links."""
+        return len(self.institution)
+
+    @property
+    def has_predominant(self) -> bool:
+        """Whether every paper has predominant continents (reduced data)."""
+        return self._papers_without_predominant == 0
+
+    def conferences(self) -> List[str]:
+        """Conferences in the store, in insertion order."""
+        codes = dict.fromkeys(conference for conference, _, _, _ in self._groups)
+        return [self.symbols.symbol(code) for code in codes]
+
+    def groups(self, conference: Optional[str] = None,
+               year: Optional[str] = None) -> Iterator[Tuple[str, str, range]]:
+        """
+        Iterate (conference, year) groups, optionally filtered.
+
+        Args:
+            conference: Only this conference (optional)
+            year: Only this year (optional)
+
+        Yields:
+            Tuples of (conference, year, range of paper indices)
+        """
+        conference_code = self.symbols.code(conference) if conference is not None else None
+        year_code = self.symbols.code(str(year)) if year is not None else None
+
+        if (conference is not None and conference_code is None) or \
+                (year is not None and year_code is None):
+            return
+
+        for conf, yr, start, end in self._groups:
+            if conference_code is not None and conf != conference_code:
+                continue
+            if year_code is not None and yr != year_code:
+                continue
+            yield self.symbols.symbol(conf), self.symbols.symbol(yr), range(start, end)
+
+    def select(self, conference: Optional[str] = None, year: Optional[str] = None) -> List[int]:
+        """Indices of the papers of a conference and/or year."""
+        return [i for _, _, papers in self.groups(conference, year) for i in papers]
+
+    def title(self, paper: int) -> str:
+        """Title of a paper."""
+        start, end = self.title_offsets[paper], self.title_offsets[paper + 1]
+        return str(self.titles[start:end], 'utf-8', 'surrogatepass')
+
+    def predominant(self, paper: int) -> List[Optional[str]]:
+        """Predominant continents of a paper (empty if unknown or not reduced)."""
+        symbol = self.symbols.symbol
+        return [symbol(code) for code in
+                self.continents[self.continent_offsets[paper]:self.continent_offsets[paper + 1]]]
+
+    def authors(self, paper: int) -> range:
+        """Author indices of a paper."""
+        return range(self.author_offsets[paper], self.author_offsets[paper + 1])
+
+    def affiliations(self, author: int) -> range:
+        """Affiliation indices of an author."""
+        return range(self.affiliation_offsets[author], self.affiliation_offsets[author + 1])
+
+    def paper(self, index: int) -> Dict:
+        """
+        Materialize a paper as a dict in the processed data format.
+
+        Fields the store does not keep (author names, extra keys) are absent.
+
+        Args:
+            index: Paper index
+
+        Returns:
+            Paper dictionary
+        """
+        symbol = self.symbols.symbol
+        authors = []
+
+        for author in self.authors(index):
+            institutions = []
+            for f in self.affiliations(author):
+                if self.institution[f] == NULL:
+                    institutions.append(None)
+                    continue
+                inst = {}
+                if self.institution[f] >= 0:
+                    inst["Institution Name"] = symbol(self.institution[f])
+                if self.country[f] != MISSING:
+                    inst["Country"] = symbol(self.country[f])
+                institutions.append(inst)
+            authors.append({"Institutions": institutions})
+
+        return {
+            "Title": self.title(index),
+            "Year": symbol(self.paper_year[index]),
+            "Predominant Continent": self.predominant(index),
+            "Authors and Institutions": authors,
+        }
+
+    def memory_usage(self) -> Dict[str, int]:
+        """
+        Approximate memory held by the store, in bytes.
+
+        Returns:
+            Bytes per part: "papers", "authors", "affiliations", "titles",
+            "symbols" and "total"
+        """
+        def size(*columns):
+            return sum(column.itemsize * len(column) for column in columns)
+
+        usage = {
+            "papers": size(self.paper_conference, self.paper_year, self.title_offsets,
+                           self.author_offsets, self.continent_offsets, self.continents),
+            "authors": size(self.affiliation_offsets),
+            "affiliations": size(self.institution, self.country),
+            "titles": len(self.titles),
+            "symbols": sum(sys.getsizeof(symbol) for symbol in self.symbols),
+        }
+        usage["total"] = sum(usage.values())
+        return usage
@@ -0,0 +1,178 @@
+"""
+Company name matching utilities for Conference Data Analysis project.
+Finds whole-word occurrences of known company names in institution strings.
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+def _is_word_char(char: str) -> bool:
+    """Match the regex \\w definition for a single character."""
+    return char.isalnum() or char == '_'
+
+
+class CompanyMatcher:
+    """
+    Base class for company matchers.
+
+    A match is a case-insensitive occurrence of a company name that is not
+    preceded or followed by a word character (same as regex (?<!\\w)...(?!\\w)).
+    """
+
+    def __init__(self, companies: Iterable[str]):
+        """
+        Initialize matcher.
+
+        Args:
+            companies: Company names to look for
+        """
+        self.companies = sorted({c.lower() for c in companies if c})
+
+    def search(self, text: str) -> Optional[str]:
+        """
+        Find a company name in text.
+
+        Args:
+            text: Institution string
+
+        Returns:
+            A matching company name (lowercase), or None
+        """
+        raise NotImplementedError
+
+
+class RegexCompanyMatcher(CompanyMatcher):
+    """Matches with a single alternation regex over all company names."""
+
+    def __init__(self, companies: Iterable[str]):
+        """
+        Initialize matcher.
+
+        Args:
+            companies: Company names to look for
+        """
+        super().__init__(companies)
+        self.pattern = self._compile_company_pattern()
+
+    def _compile_company_pattern(self) -> re.Pattern:
+        """
+        Compile regex pattern for big tech company matching.
+
+        Returns:
+            Compiled regex pattern
+        """
+        # Escape special regex characters in company names
+        escaped_companies = [re.escape(company) for company in self.companies]
+
+        # Create pattern that matches whole words only
+        pattern = r'(?<!\w)(' + '|'.join(escaped_companies) + r')(?!\w)'
+
+        return re.compile(pattern, re.IGNORECASE)
+
+    def search(self, text: str) -> Optional[str]:
+        """Find a company name in text (see CompanyMatcher.search)."""
+        match = self.pattern.search(text)
+        return match.group(1).lower() if match else None
+
+
+class AhoCorasickCompanyMatcher(CompanyMatcher):
+    """
+    Matches with an Aho-Corasick automaton over all company names.
+
+    Scanning is linear in the length of the text plus the number of raw
+    occurrences, independent of how many company names are configured.
+    """
+
+    def __init__(self, companies: Iterable[str]):
+        """
+        Initialize matcher and build the automaton.
+
+        Args:
+            companies: Company names to look for
+        """
+        super().__init__(companies)
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.output: List[Tuple[str, ...]] = [()]
+        self._build()
+
+    def _build(self) -> None:
+        """Build the trie, then failure links and merged outputs breadth-first."""
+        for company in self.companies:
+            state = 0
+            for char in company:
+                next_state = self.goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][char] = next_state
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(())
+                state = next_state
+            self.output[state] += (company,)
+
+        queue = list(self.goto[0].values())
+        for state in queue:
+            for char, child in self.goto[state].items():
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(char, 0)
+
+                # Names ending here also include names ending at the fail state
+                self.output[child] += self.output[self.fail[child]]
+                queue.append(child)
+
+    def search(self, text: str) -> Optional[str]:
+        """Find a company name in text (see CompanyMatcher.search)."""
+        goto, fail, output = self.goto, self.fail, self.output
+        text = text.lower()
+        length = len(text)
+        state = 0
+
+        for end, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            if not output[state]:
+                continue
+            if end + 1 < length and _is_word_char(text[end + 1]):
+                continue
+
+            for company in output[state]:
+                start = end - len(company) + 1
+                if start == 0 or not _is_word_char(text[start - 1]):
+                    return company
+
+        return None
+
+
+# Available matcher backends by name
+MATCHER_BACKENDS = {
+    "regex": RegexCompanyMatcher,
+    "aho-corasick": AhoCorasickCompanyMatcher,
+}
+
+
+def build_company_matcher(companies: Iterable[str],
+                          backend: str = "aho-corasick") -> CompanyMatcher:
+    """
+    Create a company matcher.
+
+    Args:
+        companies: Company names to look for
+        backend: Matcher backend name (see MATCHER_BACKENDS)
+
+    Returns:
+        CompanyMatcher instance
+
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    if backend not in MATCHER_BACKENDS:
+        raise ValueError(f"Unknown company matcher backend: {backend} "
+                         f"(available: {', '.join(MATCHER_BACKENDS)})")
+
+    return MATCHER_BACKENDS[backend](companies)
@@ -1,23 +1,93 @@
 """
 Continent mapping utilities for Conference Data Analysis project.
 Handles country to continent conversion with special case handling.
+
+pycountry_convert (and its large country tables) is imported on first use,
+so importing this module stays cheap for code paths that never map countries.
 """
 
+import importlib
 import logging
-from typing import Optional, List, Set, Dict
-import pycountry_convert as pc
+import string
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, List, Sequence, Set, Dict, Tuple
 
 from src.config.constants import COUNTRY_CODE_FIXES, CONTINENT_GROUPS
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of distinct country strings memoized on the slow path
+_COUNTRY_CACHE_SIZE = 4096
+
+
+def _pycountry_convert():
+    """Import pycountry_convert on first use."""
+    return importlib.import_module("pycountry_convert")
+
+
+@lru_cache(maxsize=None)
+def continent_lookup_tables() -> Tuple[Mapping[str, str], Mapping[str, str]]:
+    """
+    Build the immutable country -> continent lookup tables (once per process).
+    
+    Returns:
+        Tuple of (alpha2_table, country_table):
+        - alpha2_table maps exactly the ISO Alpha-2 codes pycountry_convert
+          accepts (case-sensitive) to their continent code
+        - country_table additionally maps every case variant of those codes
+          and the COUNTRY_CODE_FIXES keys, i.e. what country_to_continent()
+          resolves without name lookup
+    """
+    pc = _pycountry_convert()
+    alpha2_table = {}
+    
+    for first in string.ascii_uppercase:
+        for second in string.ascii_uppercase:
+            code = first + second
+            try:
+                alpha2_table[code] = pc.country_alpha2_to_continent_code(code)
+            except KeyError:
+                continue
+                
+    country_table = {}
+    
+    for code, continent in alpha2_table.items():
+        for variant in {code, code.lower(), code[0] + code[1].lower(), code[0].lower() + code[1]}:
+            country_table[variant] = continent
+            
+    # Fixes take precedence, as in normalize_alpha2()
+    for name, code in COUNTRY_CODE_FIXES.items():
+        if code in alpha2_table:
+            country_table[name] = alpha2_table[code]
+            
+    return MappingProxyType(alpha2_table), MappingProxyType(country_table)
+
 
 class ContinentMapper:
-    """Handles country to continent code conversion with robust error handling."""
+    """
+    Handles country to continent code conversion with robust error handling.
+    
+    Lookups go through precomputed tables (see continent_lookup_tables());
+    only strings that are not plain codes, such as country names, take the
+    slower conversion path, and those results are memoized.
+    """
     
     def __init__(self):
         """Initialize ContinentMapper with country code fixes."""
         self.country_fixes = COUNTRY_CODE_FIXES
+        self._resolve_continent = lru_cache(maxsize=_COUNTRY_CACHE_SIZE)(
+            self._resolve_continent_uncached
+        )
+        
+    def __getattr__(self, name: str):
+        """Build the lookup tables on first access, then keep them as attributes."""
+        if name in ("alpha2_continents", "country_continents"):
+            self.alpha2_continents, self.country_continents = continent_lookup_tables()
+            return self.__dict__[name]
+            
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
         
     def normalize_alpha2(self, code: Optional[str]) -> Optional[str]:
         """
@@ -64,6 +134,7 @@ class ContinentMapper:
             return self.country_fixes[name]
             
         # Try pycountry_convert
+        pc = _pycountry_convert()
         try:
             return pc.country_name_to_country_alpha2(name)
         except Exception:
@@ -107,11 +178,7 @@ class ContinentMapper:
         if not alpha2 or not isinstance(alpha2, str):
             return None
             
-        try:
-            return pc.country_alpha2_to_continent_code(alpha2)
-        except Exception:
-            logger.debug(f"Could not convert country code to continent: {alpha2}")
-            return None
+        return self.alpha2_continents.get(alpha2)
             
     def country_to_continent(self, country: Optional[str]) -> Optional[str]:
         """
@@ -123,8 +190,65 @@ class ContinentMapper:
         Returns:
             Continent code or None
         """
+        if isinstance(country, str):
+            continent = self.country_continents.get(country)
+            if continent is not None:
+                return continent
+            return self._resolve_continent(country)
+            
+        return None
+        
+    def country_to_continent_many(self, values: Sequence[Any]) -> Any:
+        """
+        Convert many countries (codes or names) to continent codes at once.
+        
+        Values are factorized first: each distinct value is resolved once and
+        the results are scattered back to every position.
+        
+        Args:
+            values: Sequence of countries; a list, tuple, NumPy array or
+                pandas Series
+            
+        Returns:
+            Continent codes (or None) in input order: a pandas Series with the
+            same index for Series input, an object array of the same shape for
+            NumPy input, and a list otherwise
+        """
+        np = sys.modules.get("numpy")
+        is_ndarray = np is not None and isinstance(values, np.ndarray)
+        is_series = not is_ndarray and hasattr(values, "index") and hasattr(values, "to_numpy")
+        
+        if is_ndarray:
+            items = values.ravel().tolist()
+        elif is_series:
+            items = values.tolist()
+        else:
+            items = list(values)
+            
+        try:
+            uniques = dict.fromkeys(items)
+        except TypeError:
+            # Unhashable values (malformed data): resolve one by one
+            results = [self.country_to_continent(value) for value in items]
+        else:
+            lookup = {value: self.country_to_continent(value) for value in uniques}
+            results = [lookup[value] for value in items]
+            
+        if is_ndarray:
+            return np.array(results, dtype=object).reshape(values.shape)
+        if is_series:
+            return type(values)(results, index=values.index, name=values.name, dtype=object)
+        return results
+        
+    def _resolve_continent_uncached(self, country: str) -> Optional[str]:
+        """Resolve a country string that missed the lookup table."""
         alpha2 = self.country_to_alpha2(country)
-        return self.alpha2_to_continent(alpha2)
+        continent = self.alpha2_to_continent(alpha2)
+        
+        if alpha2 and continent is None:
+            logger.debug(f"Could not convert country code to continent: {alpha2}")
+            
+        return continent
         
     def group_continent(self, continent_code: Optional[str]) -> str:
         """
@@ -187,6 +311,7 @@ class ContinentMapper:
         continent_count: Dict[str, int] = {}
         no_inst_data = 0
         unknown_country = 0
+        alpha2_continents = self.alpha2_continents
         
         for author in authors:
             if not isinstance(author, dict):
@@ -198,24 +323,21 @@ class ContinentMapper:
                 no_inst_data += 1
                 continue
                 
-            # Get unique countries for this author
-            unique_countries = set()
+            # Get unique countries for this author, in first-seen order so
+            # ties come out the same in every process (set order follows
+            # the per-process string hash seed)
+            unique_countries: Dict[str, None] = {}
             for inst in institutions:
                 if isinstance(inst, dict) and "Country" in inst:
-                    unique_countries.add(inst["Country"])
+                    unique_countries[inst["Country"]] = None
                     
-            # Convert to continents
+            # Convert to continents (only exact ISO codes are in the table)
             for country in unique_countries:
-                if not country or not isinstance(country, str) or len(country.strip()) != 2:
+                continent = alpha2_continents.get(country)
+                if continent is None:
                     unknown_country += 1
                     continent = "Unknown"
-                else:
-                    try:
-                        continent = pc.country_alpha2_to_continent_code(country)
-                    except Exception:
-                        unknown_country += 1
-                        continent = "Unknown"
-                        
+                    
                 continent_count[continent] = continent_count.get(continent, 0) + 1
                 
         # Find max count
@@ -0,0 +1,364 @@
+"""
+Corpus catalog for Conference Data Analysis project.
+Holds the reduced papers, committees and citations of a project once per
+process, so pipeline stages running together share one parse of each file
+instead of reloading it.
+"""
+
+import functools
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.config.constants import DATA_DIRS
+from src.utils.columnar import ColumnarStore
+from src.utils.file_manager import FileManager
+from src.utils.manifest import file_signature
+from src.utils.symbols import SymbolTable
+
+logger = logging.getLogger(__name__)
+
+# File name suffix of each kind of data
+_SUFFIXES = {
+    "papers": "_data.json",
+    "papers_binary": "_data.bin",
+    "committee": "_committee.json",
+    "citations": "_citations_data.json",
+}
+
+# Binary stores are mapped rather than read: their pages stay in the shared
+# page cache and only the merged store is private to the process
+_load_store = functools.partial(ColumnarStore.load, mmap_columns=True)
+
+# Semantic Scholar fallback for conferences without crawled citations
+_CITATIONS_FALLBACK_DIR = "IntermediateCitations"
+_CITATIONS_FALLBACK_SUFFIX = "_citations_s2.json"
+
+
+class Corpus:
+    """
+    Catalog of a project's conference data, loaded lazily per conference.
+
+    Each file is parsed at most once while it is unchanged on disk: entries
+    are keyed on the file's size/mtime signature, so a file rewritten by an
+    earlier stage is reloaded. Loading is thread-safe and concurrent requests
+    for the same file wait for a single load.
+
+    Returned data is shared between all callers and must be treated as
+    read-only. Repeated strings in it (institutions, countries, years, ...)
+    are interned into the corpus' SymbolTable while loading, so each
+    distinct value is held once and has an integer code in ``symbols``.
+    """
+
+    def __init__(self, project_root: Path, file_manager: Optional[FileManager] = None,
+                 symbols: Optional[SymbolTable] = None):
+        """
+        Initialize Corpus.
+
+        Args:
+            project_root: Root directory of project
+            file_manager: FileManager whose encoding registry is shared
+                (default: the project's)
+            symbols: Symbol table to intern loaded strings into (default: a
+                new one); share it with a ColumnarStore to reuse its codes
+        """
+        self.project_root = Path(project_root)
+        self.symbols = symbols or SymbolTable()
+        self.file_manager = FileManager(
+            self.project_root,
+            file_manager.encoding_registry if file_manager is not None else None,
+            symbols=self.symbols,
+        )
+        self.processed_dir = self.project_root / DATA_DIRS["processed"]
+        self.committee_dir = self.project_root / DATA_DIRS["committee"]
+        self.citations_dir = self.project_root / DATA_DIRS["crawler_citations"]
+
+        self._entries: Dict[Path, Tuple[Dict[str, int], Any]] = {}
+        self._loading: Dict[Path, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._stores: Dict[str, Tuple[Path, Dict[str, int], ColumnarStore]] = {}
+        self._merged_store: Optional[Tuple[List[ColumnarStore], ColumnarStore]] = None
+        self.loads = 0
+        self.hits = 0
+
+    # ------------------------------------------------------------------
+    # Catalog
+    # ------------------------------------------------------------------
+
+    def paper_conferences(self) -> List[str]:
+        """Conferences with reduced paper data (JSON or binary), sorted."""
+        conferences = set(self._conferences(self.processed_dir, _SUFFIXES["papers"]))
+        conferences.update(self._conferences(self.processed_dir, _SUFFIXES["papers_binary"]))
+        return sorted(conferences)
+
+    def committee_conferences(self) -> List[str]:
+        """Conferences with committee data, sorted."""
+        return self._conferences(self.committee_dir, _SUFFIXES["committee"])
+
+    def citation_conferences(self) -> List[str]:
+        """Conferences with crawled or Semantic Scholar citation data, sorted."""
+        conferences = set(self._conferences(self.citations_dir, _SUFFIXES["citations"]))
+        conferences.update(self._conferences(self.citations_dir / _CITATIONS_FALLBACK_DIR,
+                                             _CITATIONS_FALLBACK_SUFFIX))
+        return sorted(conferences)
+
+    def papers_path(self, conference: str) -> Path:
+        """Reduced paper data file of a conference."""
+        return self.processed_dir / f"{conference}{_SUFFIXES['papers']}"
+
+    def papers_binary_path(self, conference: str) -> Path:
+        """Reduced paper data of a conference as a binary columnar store."""
+        return self.processed_dir / f"{conference}{_SUFFIXES['papers_binary']}"
+
+    def has_binary_papers(self, conference: str) -> bool:
+        """Whether a conference's binary paper data exists and is not older than its JSON."""
+        binary = self.papers_binary_path(conference)
+        if not binary.exists():
+            return False
+        json_path = self.papers_path(conference)
+        return not json_path.exists() or binary.stat().st_mtime_ns >= json_path.stat().st_mtime_ns
+
+    def committee_path(self, conference: str) -> Path:
+        """Committee data file of a conference."""
+        return self.committee_dir / f"{conference}{_SUFFIXES['committee']}"
+
+    def citations_path(self, conference: str) -> Path:
+        """Citation data file of a conference: crawled if present, else Semantic Scholar."""
+        primary = self.citations_dir / f"{conference}{_SUFFIXES['citations']}"
+        if primary.exists():
+            return primary
+        return self.citations_dir / _CITATIONS_FALLBACK_DIR / f"{conference}{_CITATIONS_FALLBACK_SUFFIX}"
+
+    # ------------------------------------------------------------------
+    # Data
+    # ------------------------------------------------------------------
+
+    def papers(self, conference: str) -> Dict[str, List[Dict]]:
+        """
+        Reduced papers of a conference, from its JSON file.
+
+        Binary stores do not keep every paper field (see
+        ColumnarStore.paper()), so conferences reduced to binary only are
+        not materialized from them; read those through paper_store().
+
+        Args:
+            conference: Conference name
+
+        Returns:
+            Dictionary of year -> papers
+
+        Raises:
+            FileNotFoundError: If the conference has no reduced JSON data
+        """
+        path = self.papers_path(conference)
+        if not path.exists() and self.has_binary_papers(conference):
+            raise FileNotFoundError(
+                f"{conference} was reduced to binary only ({self.papers_binary_path(conference).name}); "
+                f"use paper_store() or reduce with --processed-format json or both"
+            )
+        return self._get(path)
+
+    def paper_store(self, conferences: Optional[List[str]] = None) -> Optional[ColumnarStore]:
+        """
+        Reduced papers of several conferences as one columnar store, taken
+        from stores registered with put_papers_store() or read from binary
+        files.
+
+        Args:
+            conferences: Conferences to include (default: all with paper data)
+
+        Returns:
+            Store in conference order, with codes in the corpus' symbol
+            table, or None if any conference has neither
+        """
+        if conferences is None:
+            conferences = self.paper_conferences()
+
+        parts = [self._paper_store_part(conference) for conference in conferences]
+        if not parts or any(part is None for part in parts):
+            return None
+
+        # Stages reading the same conferences share one merged store
+        with self._lock:
+            merged = self._merged_store
+        if merged is not None and len(merged[0]) == len(parts) and \
+                all(a is b for a, b in zip(merged[0], parts)):
+            return merged[1]
+
+        store = ColumnarStore(self.symbols)
+        for part in parts:
+            store.extend(part)
+
+        with self._lock:
+            self._merged_store = (parts, store)
+        return store
+
+    def committee(self, conference: str) -> Dict[str, Dict]:
+        """
+        Committee of a conference.
+
+        Args:
+            conference: Conference name
+
+        Returns:
+            Dictionary of year -> member -> institutions
+
+        Raises:
+            FileNotFoundError: If the conference has no committee data
+        """
+        return self._get(self.committee_path(conference), self._load_committee)
+
+    def citations(self, conference: str) -> Dict[str, List[Dict]]:
+        """
+        Citations of a conference's papers.
+
+        Args:
+            conference: Conference name
+
+        Returns:
+            Dictionary of cited paper -> citing papers
+
+        Raises:
+            FileNotFoundError: If the conference has no citation data
+        """
+        # Citation files are the largest JSON the pipeline reads whole
+        return self._get(self.citations_path(conference), self.file_manager.load_json_groups)
+
+    def put_papers_store(self, conference: str, store: ColumnarStore) -> None:
+        """
+        Register the reduced papers of a conference, just written to its
+        JSON and/or binary file, as a columnar store. paper_store() uses it
+        for as long as that file is unchanged.
+
+        Args:
+            conference: Conference name
+            store: Reduced store of the conference
+        """
+        path = self.papers_path(conference)
+        if not path.exists():
+            path = self.papers_binary_path(conference)
+        with self._lock:
+            self._stores[conference] = (path, file_signature(path), store)
+
+    def put(self, path: Path, data: Any) -> None:
+        """
+        Register data that was just written to a file, so later stages use
+        it without parsing the file.
+
+        Args:
+            path: File the data was saved to
+            data: The saved data, as it would be loaded (JSON-compatible data,
+                or a ColumnarStore for binary files)
+        """
+        path = Path(path)
+        with self._lock:
+            self._entries[path] = (file_signature(path), data)
+
+    def release(self, kind: str) -> None:
+        """
+        Drop the loaded data of one kind once no stage needs it any more.
+        It is loaded again if requested later.
+
+        Args:
+            kind: "papers" (including columnar stores), "committee" or "citations"
+        """
+        directory = {
+            "papers": self.processed_dir,
+            "committee": self.committee_dir,
+            "citations": self.citations_dir,
+        }[kind]
+
+        with self._lock:
+            released = [path for path in self._entries if directory in path.parents]
+            for path in released:
+                del self._entries[path]
+                self._loading.pop(path, None)
+            if kind == "papers":
+                released.extend(entry[0] for entry in self._stores.values())
+                self._stores.clear()
+                self._merged_store = None
+
+        if released:
+            logger.debug(f"Corpus released {len(released)} {kind} file(s)")
+
+    def clear(self) -> None:
+        """Drop all loaded data."""
+        with self._lock:
+            self._entries.clear()
+            self._stores.clear()
+            self._merged_store = None
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _conferences(self, directory: Path, suffix: str) -> List[str]:
+        """List conferences from the file names of a directory."""
+        if not directory.is_dir():
+            return []
+        return sorted(path.name[:-len(suffix)] for path in directory.glob(f"*{suffix}"))
+
+    def _load_committee(self, path: Path) -> Dict[str, Dict]:
+        """
+        Load committee data, interning its country values. These are keyed
+        by member or institution name, so the JSON load hook, which interns
+        by field name, leaves them alone.
+        """
+        data = self.file_manager.load_json(path)
+        canonical = self.symbols.canonical
+
+        for members in data.values():
+            if not isinstance(members, dict):
+                continue
+            for member, institutions in members.items():
+                if isinstance(institutions, dict):
+                    for institution, country in institutions.items():
+                        if type(country) is str:
+                            institutions[institution] = canonical(country)
+                elif type(institutions) is str:
+                    members[member] = canonical(institutions)
+
+        return data
+
+    def _paper_store_part(self, conference: str) -> Optional[ColumnarStore]:
+        """Registered or binary store of a conference, if current (None otherwise)."""
+        with self._lock:
+            entry = self._stores.get(conference)
+        if entry is not None:
+            path, signature, store = entry
+            if path.exists() and file_signature(path) == signature:
+                return store
+
+        if self.has_binary_papers(conference):
+            return self._get(self.papers_binary_path(conference), _load_store)
+        return None
+
+    def _get(self, path: Path, load: Optional[Callable[[Path], Any]] = None) -> Any:
+        """
+        Return the data of a file, loading it once under a per-file lock if
+        absent or changed. Files are loaded as JSON unless another loader is given.
+        """
+        if not path.exists():
+            raise FileNotFoundError(f"Data file not found: {path}")
+
+        with self._lock:
+            file_lock = self._loading.setdefault(path, threading.Lock())
+
+        with file_lock:
+            signature = file_signature(path)
+
+            with self._lock:
+                entry = self._entries.get(path)
+                if entry is not None and entry[0] == signature:
+                    self.hits += 1
+                    return entry[1]
+
+            data = (load or self.file_manager.load_json)(path)
+
+            with self._lock:
+                self._entries[path] = (signature, data)
+                self.loads += 1
+
+            logger.debug(f"Corpus loaded {path.name}")
+            return data
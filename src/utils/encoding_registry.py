@@ -0,0 +1,197 @@
+"""
+Encoding registry for Conference Data Analysis project.
+Remembers which text encoding decoded each input file so later loads
+(and later pipeline stages) can decode once without probing.
+"""
+
+import atexit
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: saves are merged but not locked
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Process-wide registries by sidecar path (see EncodingRegistry.shared())
+_shared: Dict[Path, "EncodingRegistry"] = {}
+_shared_lock = threading.Lock()
+
+
+class EncodingRegistry:
+    """
+    Per-file encoding records, persisted as a JSON sidecar.
+
+    Entries are keyed by absolute file path and are only trusted while the
+    file's size and modification time are unchanged.
+
+    New entries are kept in memory and written by save(). Saving merges
+    them into the sidecar under a file lock, so processes sharing it keep
+    each other's entries, and drops entries of files that changed or no
+    longer exist. Registries obtained with shared() are saved at exit.
+    """
+
+    def __init__(self, registry_path: Optional[Path] = None):
+        """
+        Initialize EncodingRegistry.
+
+        Args:
+            registry_path: JSON file to persist entries in. If None, entries
+                are only kept in memory.
+        """
+        self.registry_path = Path(registry_path) if registry_path else None
+        self.entries: Dict[str, Dict] = self._load()
+        self._dirty: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, registry_path: Path) -> "EncodingRegistry":
+        """
+        Get the process-wide registry persisted at a path.
+
+        Every caller asking for the same sidecar gets the same instance, and
+        pending entries of all shared registries are saved once at exit.
+
+        Args:
+            registry_path: JSON file to persist entries in
+
+        Returns:
+            Shared EncodingRegistry
+        """
+        key = Path(registry_path).resolve()
+
+        with _shared_lock:
+            registry = _shared.get(key)
+            if registry is None:
+                registry = _shared[key] = cls(key)
+        return registry
+
+    def _load(self) -> Dict[str, Dict]:
+        """Load persisted entries, ignoring a missing or corrupt registry."""
+        if self.registry_path is None or not self.registry_path.exists():
+            return {}
+
+        try:
+            with open(self.registry_path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+            return entries if isinstance(entries, dict) else {}
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable encoding registry {self.registry_path}: {e}")
+            return {}
+
+    @staticmethod
+    def _key_and_signature(path: Path) -> tuple[str, Dict]:
+        """Return the registry key and current size/mtime signature of a file."""
+        stat = path.stat()
+        return str(path.resolve()), {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def get(self, path: Path | str) -> Optional[str]:
+        """
+        Look up the recorded encoding of a file.
+
+        Args:
+            path: File path
+
+        Returns:
+            Encoding name, or None if unknown or the file changed since
+        """
+        key, signature = self._key_and_signature(Path(path))
+        entry = self.entries.get(key)
+
+        if not entry:
+            return None
+        if any(entry.get(field) != value for field, value in signature.items()):
+            return None
+
+        return entry.get("encoding")
+
+    def record(self, path: Path | str, encoding: str) -> None:
+        """
+        Record the encoding that decoded a file.
+
+        Args:
+            path: File path
+            encoding: Encoding name
+        """
+        key, signature = self._key_and_signature(Path(path))
+        entry = {"encoding": encoding, **signature}
+
+        with self._lock:
+            if self.entries.get(key) == entry:
+                return
+
+            self.entries[key] = entry
+            self._dirty[key] = entry
+
+    def save(self) -> None:
+        """Merge the entries recorded since the last save into the persisted registry."""
+        if self.registry_path is None:
+            return
+
+        with self._lock:
+            dirty, self._dirty = self._dirty, {}
+        if not dirty:
+            return
+
+        try:
+            self.registry_path.parent.mkdir(parents=True, exist_ok=True)
+
+            with self._file_lock():
+                # Re-read so concurrent processes don't drop each other's entries
+                merged = self._load()
+                merged.update(dirty)
+                merged = {key: entry for key, entry in merged.items() if self._is_current(key, entry)}
+
+                tmp_path = self.registry_path.with_name(
+                    f"{self.registry_path.name}.{os.getpid()}.tmp"
+                )
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(merged, f, indent=2)
+                os.replace(tmp_path, self.registry_path)
+
+        except OSError as e:
+            logger.debug(f"Could not persist encoding registry {self.registry_path}: {e}")
+            return
+
+        with self._lock:
+            self.entries = {**merged, **self._dirty}
+
+    @staticmethod
+    def _is_current(key: str, entry: Dict) -> bool:
+        """Whether an entry still describes the file at its path."""
+        try:
+            stat = os.stat(key)
+        except OSError:
+            return False
+        return entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Hold an exclusive lock on the registry's lock file (where supported)."""
+        if fcntl is None:
+            yield
+            return
+
+        lock_path = self.registry_path.with_name(self.registry_path.name + ".lock")
+        with open(lock_path, 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+@atexit.register
+def _save_shared() -> None:
+    """Save the pending entries of every shared registry."""
+    with _shared_lock:
+        registries = list(_shared.values())
+    for registry in registries:
+        registry.save()
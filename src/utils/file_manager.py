@@ -3,35 +3,195 @@ File management utilities for Conference Data Analysis project.
 Handles all file I/O operations including JSON and CSV files.
 """
 
+import codecs
 import json
+import mmap
 import os
 import csv
+from contextlib import ExitStack
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
 import logging
 
+from src.utils.json_stream import iter_json_groups
+from src.utils.encoding_registry import EncodingRegistry
+from src.utils.symbols import SymbolTable
+from src.utils.tracing import traced
+from src.config.constants import OUTPUT_DIRS, CACHE_FILES
+
 logger = logging.getLogger(__name__)
 
 
+class _DecodingReader:
+    """
+    Text stream over a binary file that settles its encoding while reading.
+
+    Decoding starts with the first candidate encoding. If it fails while
+    only ASCII has been read, the next candidate takes over from the start
+    of the failing chunk, which gives the same text as decoding the whole
+    file with it. If it fails later, the rest of the file is decoded with
+    the next candidate and the file is flagged as mixed.
+    """
+
+    def __init__(self, f: BinaryIO, encodings: List[str], name: Optional[str] = None):
+        """
+        Initialize reader.
+
+        Args:
+            f: Binary file (or memory map) positioned at the start
+            encodings: Encodings to try, in order (the last should never fail)
+            name: File name for messages (default: f.name)
+        """
+        self.f = f
+        self.name = name or f.name
+        self.encoding = encodings[0]
+        self.mixed = False
+        self._fallbacks = list(encodings[1:])
+        self._decoder = codecs.getincrementaldecoder(self.encoding)()
+        self._ascii_only = True
+
+    def read(self, size: int = -1) -> str:
+        """Read and decode about `size` bytes ("" at end of file)."""
+        while True:
+            raw = self.f.read(size)
+            text = self._decode(raw, final=not raw or size < 0)
+            self._ascii_only = self._ascii_only and raw.isascii()
+
+            if text or not raw:
+                return text
+
+    def _decode(self, raw: bytes, final: bool) -> str:
+        """Decode a chunk, moving on to the next encoding where it fails."""
+        try:
+            return self._decoder.decode(raw, final)
+        except UnicodeDecodeError as e:
+            if not self._fallbacks:
+                raise
+
+            prefix = ""
+            if self._ascii_only:
+                raw = e.object
+            else:
+                # Text before the error is already valid in the current encoding
+                prefix = codecs.decode(e.object[:e.start], self.encoding)
+                raw = e.object[e.start:]
+                self.mixed = True
+
+            previous, self.encoding = self.encoding, self._fallbacks.pop(0)
+            self._decoder = codecs.getincrementaldecoder(self.encoding)()
+            if self.mixed:
+                logger.warning(f"{self.name}: not valid {previous} after byte "
+                               f"{self.f.tell() - len(raw)}; decoding the rest as {self.encoding}")
+            return prefix + self._decode(raw, final)
+
+
 class FileManager:
     """Centralized file management for JSON and CSV operations."""
     
-    def __init__(self, project_root: Optional[Path] = None):
+    def __init__(self, project_root: Optional[Path] = None,
+                 encoding_registry: Optional[EncodingRegistry] = None,
+                 symbols: Optional[SymbolTable] = None):
         """
         Initialize FileManager.
         
         Args:
             project_root: Root directory of the project. If None, uses current working directory.
+            encoding_registry: Registry of detected file encodings. If None, the
+                project's shared registry under its cache directory is used (an
+                in-memory one when no project_root is given).
+            symbols: Symbol table to intern repeated strings (institutions,
+                countries, years, ...) into while loading JSON. If None, loaded
+                strings are not interned.
         """
         self.project_root = project_root or Path.cwd()
         
+        if encoding_registry is None:
+            if project_root is not None:
+                encoding_registry = EncodingRegistry.shared(
+                    Path(project_root) / OUTPUT_DIRS["cache"] / CACHE_FILES["encodings"]
+                )
+            else:
+                encoding_registry = EncodingRegistry()
+        self.encoding_registry = encoding_registry
+        
+        self.symbols = symbols
+        self._object_hook = symbols.json_object_hook() if symbols is not None else None
+        
+    def _encoding_candidates(self, path: Path, head: bytes, encoding: str) -> List[str]:
+        """
+        Order the encodings to try for a file.
+        A registry hit comes first, then a BOM-indicated encoding, then the
+        caller's preference, with latin-1 as the always-succeeding fallback.
+        
+        Args:
+            path: Path to file
+            head: Leading bytes of the file (at least 3 for BOM detection)
+            encoding: Preferred encoding
+            
+        Returns:
+            Unique encoding names in the order to try
+        """
+        candidates = []
+        
+        known = self.encoding_registry.get(path)
+        if known:
+            candidates.append(known)
+            
+        has_bom = head.startswith(codecs.BOM_UTF8)
+        if has_bom:
+            candidates.append('utf-8-sig')
+            
+        candidates.append(encoding)
+        
+        # Without a BOM, utf-8-sig decodes exactly like utf-8
+        if not has_bom and codecs.lookup(encoding).name != 'utf-8':
+            candidates.append('utf-8-sig')
+            
+        candidates.append('latin-1')
+        
+        return list(dict.fromkeys(candidates))
+        
+    def decode_bytes(self, path: Path | str, raw: bytes,
+                     encoding: str = 'utf-8') -> str:
+        """
+        Decode a file's contents, probing only when its encoding is unknown.
+        The encoding that worked is recorded in the encoding registry.
+        
+        Args:
+            path: Path the bytes were read from
+            raw: File contents
+            encoding: Preferred encoding (default: utf-8)
+            
+        Returns:
+            Decoded text
+        """
+        path = Path(path)
+        last_error: UnicodeDecodeError | None = None
+        
+        for enc in self._encoding_candidates(path, raw[:3], encoding):
+            try:
+                text = raw.decode(enc)
+            except UnicodeDecodeError as e:
+                last_error = e
+                continue
+                
+            self.encoding_registry.record(path, enc)
+            logger.debug(f"Decoded {path} with encoding {enc}")
+            return text
+            
+        raise last_error
+        
+    @traced(category="io")
     def load_json(self, path: Path | str, encoding: str = 'utf-8') -> Dict | List:
         """
         Load JSON file.
         
+        The file is read once; its encoding comes from the encoding registry
+        or is detected on the in-memory buffer (BOM, then validity check).
+        
         Args:
             path: Path to JSON file
-            encoding: File encoding (default: utf-8)
+            encoding: Preferred file encoding (default: utf-8)
             
         Returns:
             Parsed JSON data
@@ -45,26 +205,97 @@ class FileManager:
         if not path.exists():
             raise FileNotFoundError(f"JSON file not found: {path}")
             
-        # Try multiple decoders to handle mixed encodings in crawled data
-        encodings_to_try = [encoding, 'utf-8-sig', 'latin-1']
-        last_error: Exception | None = None
-        for enc in encodings_to_try:
-            try:
-                with open(path, 'r', encoding=enc) as f:
-                    data = json.load(f)
-                    logger.debug(f"Loaded JSON from {path} with encoding {enc}")
-                    return data
-            except UnicodeDecodeError as e:
-                last_error = e
-                continue
-            except json.JSONDecodeError as e:
-                # If bytes read fine but JSON is invalid, fail fast
-                logger.error(f"Invalid JSON in {path}: {e}")
-                raise
-        # If we exhausted decoders due to Unicode errors, raise the last one
-        if last_error:
-            raise last_error
+        text = self.decode_bytes(path, path.read_bytes(), encoding)
+        
+        try:
+            data = json.loads(text, object_hook=self._object_hook)
+        except json.JSONDecodeError as e:
+            logger.error(f"Invalid JSON in {path}: {e}")
+            raise
+            
+        logger.debug(f"Loaded JSON from {path}")
+        return data
+        
+    def iter_json_groups(self, path: Path | str, encoding: str = 'utf-8',
+                         mapped: bool = False) -> Iterator[Tuple[str, Iterator[Any]]]:
+        """
+        Stream a "{key: [item, ...]}" JSON file group by group.
+        Only one item is held in memory at a time. The encoding comes from
+        the encoding registry or is settled while streaming (see
+        _DecodingReader), so the file is read only once.
+        
+        Args:
+            path: Path to JSON file
+            encoding: Preferred file encoding (default: utf-8)
+            mapped: Memory-map the file and decode chunks straight from the
+                page cache instead of reading them into buffers
+            
+        Yields:
+            Tuples of (key, iterator over the key's items)
+            
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            json.JSONDecodeError: If file is not valid JSON
+        """
+        path = Path(path)
+        
+        if not path.exists():
+            raise FileNotFoundError(f"JSON file not found: {path}")
+            
+        with ExitStack() as stack:
+            f = stack.enter_context(open(path, 'rb'))
+            head = f.read(3)
+            f.seek(0)
+            
+            source = f
+            # Empty files cannot be mapped
+            if mapped and head:
+                source = stack.enter_context(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+                
+            reader = _DecodingReader(source, self._encoding_candidates(path, head, encoding),
+                                     name=f.name)
+            logger.debug(f"Streaming JSON from {path} with encoding {reader.encoding}")
+            yield from iter_json_groups(reader, object_hook=self._object_hook)
+            
+        if not reader.mixed:
+            self.encoding_registry.record(path, reader.encoding)
+            
+    @traced(category="io")
+    def load_json_groups(self, path: Path | str, encoding: str = 'utf-8') -> Dict[str, List]:
+        """
+        Load a "{key: [item, ...]}" JSON file through a memory map.
+        
+        Gives the same result as load_json(), but the file is decoded and
+        parsed chunk by chunk from the map, so neither its bytes nor its
+        decoded text are copied whole into memory.
+        
+        Args:
+            path: Path to JSON file
+            encoding: Preferred file encoding (default: utf-8)
             
+        Returns:
+            Dictionary of key -> list of items
+        """
+        groups = self.iter_json_groups(path, encoding, mapped=True)
+        return {key: list(items) for key, items in groups}
+        
+    def iter_json_records(self, path: Path | str,
+                          encoding: str = 'utf-8') -> Iterator[Tuple[str, Any]]:
+        """
+        Stream (key, item) pairs, e.g. (year, paper), from a JSON file.
+        
+        Args:
+            path: Path to JSON file
+            encoding: Preferred file encoding (default: utf-8)
+            
+        Yields:
+            Tuples of (key, item)
+        """
+        for key, items in self.iter_json_groups(path, encoding):
+            for item in items:
+                yield key, item
+                
+    @traced(category="io")
     def save_json(self, path: Path | str, data: Dict | List, 
                   encoding: str = 'utf-8', indent: int = 4) -> None:
         """
@@ -83,6 +314,65 @@ class FileManager:
             json.dump(data, f, ensure_ascii=False, indent=indent)
             logger.debug(f"Saved JSON to {path}")
             
+        self.encoding_registry.record(path, encoding)
+            
+    @traced(category="io")
+    def save_json_stream(self, path: Path | str,
+                         groups: Iterable[Tuple[str, Iterable[Any]]],
+                         encoding: str = 'utf-8', indent: int = 4) -> None:
+        """
+        Save "{key: [item, ...]}" data to JSON while it is being produced.
+        Output is byte-identical to save_json() on the equivalent dict.
+        The file is written to a temporary path and moved into place on success.
+        
+        Args:
+            path: Output file path
+            groups: Iterable of (key, iterable of items)
+            encoding: File encoding (default: utf-8)
+            indent: JSON indentation (default: 4)
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + '.tmp')
+        
+        outer = ' ' * indent
+        inner = outer * 2
+        
+        try:
+            with open(tmp_path, 'w', encoding=encoding) as f:
+                f.write('{')
+                first_group = True
+                
+                for key, items in groups:
+                    if not first_group:
+                        f.write(',')
+                    f.write(f"\n{outer}{json.dumps(key, ensure_ascii=False)}: [")
+                    first_group = False
+                    
+                    first_item = True
+                    for item in items:
+                        text = json.dumps(item, ensure_ascii=False, indent=indent)
+                        if not first_item:
+                            f.write(',')
+                        f.write(f"\n{inner}" + text.replace('\n', f"\n{inner}"))
+                        first_item = False
+                        
+                    if not first_item:
+                        f.write(f"\n{outer}")
+                    f.write(']')
+                    
+                if not first_group:
+                    f.write('\n')
+                f.write('}')
+                
+            os.replace(tmp_path, path)
+            self.encoding_registry.record(path, encoding)
+            logger.debug(f"Saved streamed JSON to {path}")
+            
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+                
     def load_csv(self, path: Path | str, encoding: str = 'utf-8') -> List[Dict]:
         """
         Load CSV file as list of dictionaries.
@@ -105,6 +395,7 @@ class FileManager:
             logger.debug(f"Loaded {len(data)} rows from {path}")
             return data
             
+    @traced(category="io")
     def save_csv(self, path: Path | str, data: List[Dict], 
                  fieldnames: Optional[List[str]] = None,
                  encoding: str = 'utf-8') -> None:
@@ -221,6 +512,7 @@ def setup_project_directories(project_root: Path) -> None:
         "outputs/csv",
         "outputs/reports",
         "outputs/temp",
+        "outputs/cache",
     ]
     
     for directory in directories:
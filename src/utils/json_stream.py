@@ -0,0 +1,236 @@
+"""
+Incremental JSON reading utilities for Conference Data Analysis project.
+Streams the records of large "{key: [record, ...]}" JSON documents (crawler
+output keyed by year) without materializing the whole document in memory.
+"""
+
+import json
+from typing import Any, Callable, Dict, Iterator, Optional, TextIO, Tuple
+
+# Default number of characters pulled from the underlying stream per read
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = " \t\n\r"
+
+# Characters that can continue a number; valid JSON never has one right
+# after a complete value
+_NUMBER_CHARS = "0123456789.eE+-"
+
+# Bare literals the decoder accepts; a proper prefix of one may be cut off
+_LITERALS = ("true", "false", "null", "NaN", "Infinity", "-Infinity")
+
+
+class _TextScanner:
+    """Sliding-window scanner over a text stream, refilled on demand."""
+
+    def __init__(self, fp: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 object_hook: Optional[Callable[[Dict], Any]] = None):
+        """
+        Initialize scanner.
+
+        Args:
+            fp: Text stream to read from
+            chunk_size: Minimum number of characters read per refill
+            object_hook: Applied to every decoded object, as in json.loads()
+        """
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder(object_hook=object_hook)
+        self.buf = ""
+        self.pos = 0
+        self.offset = 0  # Absolute position of buf[0] in the stream
+        self.eof = False
+
+    def _fill(self) -> bool:
+        """
+        Read more text, dropping the consumed part of the buffer.
+        Reads at least as much as is currently buffered so that
+        retrying a large value stays linear overall.
+
+        Returns:
+            False if the stream is exhausted
+        """
+        if self.eof:
+            return False
+
+        pending = self.buf[self.pos:]
+        chunk = self.fp.read(max(self.chunk_size, len(pending)))
+
+        self.offset += self.pos
+        self.buf = pending + chunk
+        self.pos = 0
+
+        if not chunk:
+            self.eof = True
+            return False
+        return True
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        """Build a decode error annotated with the absolute stream offset."""
+        return json.JSONDecodeError(
+            f"{message} (at char {self.offset + self.pos})", self.buf, self.pos
+        )
+
+    def peek(self) -> str:
+        """
+        Return the next non-whitespace character without consuming it.
+
+        Returns:
+            Next significant character, or "" at end of stream
+        """
+        while True:
+            buf, pos = self.buf, self.pos
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            self.pos = pos
+
+            if pos < len(buf):
+                return buf[pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        """Consume the next significant character, which must be `char`."""
+        if self.peek() != char:
+            raise self._error(f"Expecting '{char}'")
+        self.pos += 1
+
+    def decode_value(self) -> Any:
+        """
+        Decode the next complete JSON value, refilling until it fits.
+
+        Returns:
+            Decoded Python value
+        """
+        self.peek()
+
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError as e:
+                # Refill only if the value may just be cut by the window, so
+                # malformed input fails without reading the rest of the stream
+                if not self._may_be_truncated(e) or not self._fill():
+                    raise self._error(f"Invalid JSON value: {e.msg}")
+                continue
+
+            # A number cut by the window edge decodes as a shorter number
+            # ("1.5e10" read as "1.5" or "1.5e1"), so unless the value is
+            # clearly followed by something else, refill and retry
+            if (end == len(self.buf) or self.buf[end] in _NUMBER_CHARS) and self._fill():
+                continue
+
+            self.pos = end
+            return value
+
+    def _may_be_truncated(self, error: json.JSONDecodeError) -> bool:
+        """Whether a decode error could go away with more text after the buffer."""
+        if error.msg.startswith("Unterminated string"):
+            return True
+
+        tail = self.buf[error.pos:]
+        if error.msg.startswith("Invalid \\uXXXX escape"):
+            # Only an escape the string's closing quote does not follow yet
+            return '"' not in tail
+
+        # Nothing, part of a number or part of a literal left at the window edge
+        return (all(char in _NUMBER_CHARS for char in tail) or
+                any(literal.startswith(tail) for literal in _LITERALS))
+
+    def iter_array(self) -> Iterator[Any]:
+        """
+        Yield the elements of the JSON array starting at the current position.
+
+        Yields:
+            Decoded array elements, one at a time
+        """
+        self.expect("[")
+
+        if self.peek() == "]":
+            self.pos += 1
+            return
+
+        while True:
+            yield self.decode_value()
+
+            char = self.peek()
+            self.pos += 1
+            if char == "]":
+                return
+            if char != ",":
+                self.pos -= 1
+                raise self._error("Expecting ',' delimiter")
+
+
+def iter_json_groups(fp: TextIO,
+                     chunk_size: int = DEFAULT_CHUNK_SIZE,
+                     object_hook: Optional[Callable[[Dict], Any]] = None
+                     ) -> Iterator[Tuple[str, Iterator[Any]]]:
+    """
+    Stream a JSON object whose values are arrays, group by group.
+
+    Each group's items iterator must be consumed (or abandoned) before the
+    next group is requested; any unread items are skipped automatically.
+    Empty arrays still produce a group, so keys are never lost.
+
+    Args:
+        fp: Text stream positioned at the start of the document
+        chunk_size: Minimum number of characters read per refill
+        object_hook: Applied to every decoded object, as in json.loads()
+
+    Yields:
+        Tuples of (key, iterator over that key's array items)
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+        ValueError: If a top-level value is not an array
+    """
+    scanner = _TextScanner(fp, chunk_size, object_hook)
+    scanner.expect("{")
+
+    if scanner.peek() == "}":
+        scanner.pos += 1
+    else:
+        while True:
+            if scanner.peek() != '"':
+                raise scanner._error("Expecting property name enclosed in double quotes")
+            key = scanner.decode_value()
+            scanner.expect(":")
+
+            if scanner.peek() != "[":
+                raise ValueError(f"Expected an array for key {key!r}")
+
+            items = scanner.iter_array()
+            yield key, items
+
+            # Skip whatever the consumer left unread
+            for _ in items:
+                pass
+
+            char = scanner.peek()
+            scanner.pos += 1
+            if char == "}":
+                break
+            if char != ",":
+                scanner.pos -= 1
+                raise scanner._error("Expecting ',' delimiter")
+
+    if scanner.peek() != "":
+        raise scanner._error("Extra data")
+
+
+def iter_json_records(fp: TextIO,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Tuple[str, Any]]:
+    """
+    Stream (key, item) pairs from a JSON object whose values are arrays.
+
+    Args:
+        fp: Text stream positioned at the start of the document
+        chunk_size: Minimum number of characters read per refill
+
+    Yields:
+        Tuples of (key, array item), e.g. (year, paper)
+    """
+    for key, items in iter_json_groups(fp, chunk_size):
+        for item in items:
+            yield key, item
@@ -0,0 +1,322 @@
+"""
+Build manifest utilities for Conference Data Analysis project.
+Records what each generated output was built from, so unchanged inputs
+can be detected and their processing skipped on re-runs.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bytes read per hashing step
+_HASH_CHUNK_SIZE = 1 << 20
+
+
+def file_digest(path: Path | str) -> str:
+    """
+    Compute the SHA-256 hex digest of a file's contents.
+
+    Args:
+        path: File path
+
+    Returns:
+        Hex digest string
+    """
+    digest = hashlib.sha256()
+
+    with open(path, 'rb') as f:
+        while chunk := f.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def sources_digest(paths: Iterable[Path | str], salt: str = "") -> str:
+    """
+    Compute a combined digest of several source files, e.g. to version code.
+
+    Args:
+        paths: Files whose contents define the version
+        salt: Extra string mixed into the digest (e.g. a version number)
+
+    Returns:
+        Short hex digest string
+    """
+    digest = hashlib.sha256(salt.encode('utf-8'))
+
+    for path in paths:
+        path = Path(path)
+        digest.update(path.name.encode('utf-8'))
+        digest.update(file_digest(path).encode('ascii') if path.exists() else b"missing")
+
+    return digest.hexdigest()[:16]
+
+
+def file_signature(path: Path | str) -> Dict[str, int]:
+    """Return the cheap size/mtime signature of a file."""
+    stat = Path(path).stat()
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _load_json_dict(path: Path) -> Dict:
+    """Load a JSON object, ignoring a missing or corrupt file."""
+    if not path.exists():
+        return {}
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable manifest {path}: {e}")
+        return {}
+
+
+def _save_json_atomic(path: Path, data: Dict) -> None:
+    """Write a JSON object via a temporary file and rename."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+class FileManifest:
+    """
+    JSON-backed mapping of entry name -> build record.
+
+    A record stores the input's digest, size and mtime plus the code version
+    that produced the output, along with arbitrary extra fields.
+    """
+
+    def __init__(self, manifest_path: Path):
+        """
+        Initialize FileManifest.
+
+        Args:
+            manifest_path: JSON file the manifest is persisted in
+        """
+        self.manifest_path = Path(manifest_path)
+        self.entries: Dict[str, Dict] = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        """Load persisted entries, ignoring a missing or corrupt manifest."""
+        return _load_json_dict(self.manifest_path)
+
+    def is_fresh(self, name: str, input_path: Path, code_version: str) -> bool:
+        """
+        Check whether an entry was built from the current input and code.
+
+        Size and mtime are compared first; the content hash is only computed
+        when they differ (e.g. the file was touched or re-copied).
+
+        Args:
+            name: Entry name
+            input_path: Input file of the entry
+            code_version: Version of the code that builds the output
+
+        Returns:
+            True if the recorded build is still valid
+        """
+        entry = self.entries.get(name)
+
+        if not entry or entry.get("code_version") != code_version:
+            return False
+        if not input_path.exists():
+            return False
+
+        signature = file_signature(input_path)
+        if all(entry.get(field) == value for field, value in signature.items()):
+            return True
+
+        if entry.get("size") != signature["size"]:
+            return False
+        if entry.get("sha256") != file_digest(input_path):
+            return False
+
+        # Same content, new mtime: refresh so the next check is cheap
+        entry.update(signature)
+        return True
+
+    def get(self, name: str) -> Optional[Dict]:
+        """Return the recorded entry, if any."""
+        return self.entries.get(name)
+
+    def record(self, name: str, input_path: Path, code_version: str, **extra) -> None:
+        """
+        Record a successful build of an entry.
+
+        Args:
+            name: Entry name
+            input_path: Input file the output was built from
+            code_version: Version of the code that built it
+            **extra: Additional JSON-serializable fields to store
+        """
+        self.entries[name] = {
+            "input": str(input_path),
+            "sha256": file_digest(input_path),
+            **file_signature(input_path),
+            "code_version": code_version,
+            **extra,
+        }
+
+    def discard(self, name: str) -> None:
+        """Forget an entry."""
+        self.entries.pop(name, None)
+
+    def save(self) -> None:
+        """Persist the manifest atomically."""
+        _save_json_atomic(self.manifest_path, self.entries)
+
+
+class StampStore:
+    """
+    Make-style stamps for generated outputs.
+
+    A stamp stores the fingerprint of everything an output was built from
+    (input files, generating code, configuration) together with the
+    size/mtime of the outputs, so a build can be skipped while neither side
+    has changed. File digests are cached by size/mtime, so checking an
+    unchanged tree does not re-hash it.
+    """
+
+    def __init__(self, stamp_path: Path, root: Path):
+        """
+        Initialize StampStore.
+
+        Args:
+            stamp_path: JSON file the stamps are persisted in
+            root: Directory relative paths and glob patterns are resolved against
+        """
+        self.stamp_path = Path(stamp_path)
+        self.root = Path(root)
+        self._lock = threading.Lock()
+
+        data = _load_json_dict(self.stamp_path)
+        self.stamps: Dict[str, Dict] = data.get("stamps", {})
+        self.digests: Dict[str, Dict] = data.get("digests", {})
+
+    def expand(self, patterns: Iterable[str]) -> List[Path]:
+        """
+        Resolve paths and glob patterns to existing files.
+
+        Args:
+            patterns: Paths or glob patterns relative to root
+
+        Returns:
+            Sorted list of matching files
+        """
+        files = set()
+
+        for pattern in patterns:
+            if any(char in pattern for char in "*?["):
+                files.update(p for p in self.root.glob(pattern) if p.is_file())
+            elif (self.root / pattern).is_file():
+                files.add(self.root / pattern)
+
+        return sorted(files)
+
+    def fingerprint(self, inputs: Iterable[str], sources: Iterable[str] = (),
+                    salt: str = "") -> str:
+        """
+        Fingerprint the files an output is built from.
+
+        Missing inputs are part of the fingerprint, so an input appearing or
+        disappearing invalidates the stamp.
+
+        Args:
+            inputs: Input paths or glob patterns relative to root
+            sources: Code and configuration files relative to root
+            salt: Extra string mixed into the fingerprint
+
+        Returns:
+            Hex digest string
+        """
+        digest = hashlib.sha256(salt.encode('utf-8'))
+
+        for label, patterns in (("input", list(inputs)), ("source", list(sources))):
+            for pattern in patterns:
+                digest.update(f"{label}:{pattern}\n".encode('utf-8'))
+
+            for path in self.expand(patterns):
+                relative = path.relative_to(self.root).as_posix()
+                digest.update(f"{relative}={self._cached_digest(path)}\n".encode('utf-8'))
+
+        return digest.hexdigest()
+
+    def is_current(self, name: str, fingerprint: str, outputs: Iterable[str]) -> bool:
+        """
+        Check whether outputs were built from the given fingerprint and are untouched.
+
+        Args:
+            name: Stamp name (e.g. task name)
+            fingerprint: Current fingerprint of the build inputs
+            outputs: Output paths relative to root
+
+        Returns:
+            True if the build can be skipped
+        """
+        stamp = self.stamps.get(name)
+
+        if not stamp or stamp.get("fingerprint") != fingerprint:
+            return False
+
+        recorded = stamp.get("outputs", {})
+        outputs = list(outputs)
+        if set(recorded) != set(outputs):
+            return False
+
+        for output in outputs:
+            path = self.root / output
+            if not path.is_file() or file_signature(path) != recorded[output]:
+                return False
+
+        return True
+
+    def record(self, name: str, fingerprint: str, outputs: Iterable[str]) -> None:
+        """
+        Record a successful build.
+
+        Args:
+            name: Stamp name
+            fingerprint: Fingerprint the outputs were built from
+            outputs: Output paths relative to root (must exist)
+        """
+        signatures = {output: file_signature(self.root / output) for output in outputs}
+
+        with self._lock:
+            self.stamps[name] = {"fingerprint": fingerprint, "outputs": signatures}
+
+    def discard(self, name: str) -> None:
+        """Forget a stamp, forcing the next build."""
+        with self._lock:
+            self.stamps.pop(name, None)
+
+    def save(self) -> None:
+        """Persist the stamps atomically."""
+        with self._lock:
+            _save_json_atomic(self.stamp_path, {"stamps": self.stamps, "digests": self.digests})
+
+    def _cached_digest(self, path: Path) -> str:
+        """Return a file's SHA-256, reusing the cached value while size/mtime match."""
+        key = str(path.resolve())
+        signature = file_signature(path)
+
+        with self._lock:
+            cached = self.digests.get(key)
+            if cached and all(cached.get(f) == v for f, v in signature.items()):
+                return cached["sha256"]
+
+        sha256 = file_digest(path)
+
+        with self._lock:
+            self.digests[key] = {**signature, "sha256": sha256}
+
+        return sha256
@@ -0,0 +1,232 @@
+"""
+Run report utilities for Conference Data Analysis project.
+Measures wall time, CPU time, memory and throughput of pipeline stages and
+writes them as a machine-readable JSON report.
+"""
+
+import json
+import logging
+import os
+import platform
+import sys
+import threading
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from src.config.constants import VERSION
+from src.utils.tracing import get_tracer
+
+logger = logging.getLogger(__name__)
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process so far, in MiB (None if unavailable)."""
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def py_peak_mb() -> Optional[float]:
+    """Peak traced Python memory of this process so far, in MiB (None if not tracing)."""
+    if not tracemalloc.is_tracing():
+        return None
+    return tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+
+
+def children_cpu_s() -> float:
+    """CPU seconds used by terminated child processes (0 if unavailable)."""
+    if resource is None:
+        return 0.0
+
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+@dataclass
+class StageMetrics:
+    """
+    Measurements of one stage.
+
+    cpu_s is the CPU time of the thread that ran the stage; child_cpu_s is
+    the CPU time of child processes (worker pools, Rscript) that finished
+    during it. peak_rss_mb and py_peak_mb are the process high-water marks
+    (RSS and tracemalloc) when the stage ended. The tracemalloc peak is never
+    reset, so concurrent and nested stages cannot skew each other's values;
+    a stage raised the peak if its value is above the previous stage's.
+    Stages run in worker processes report that worker's marks (see pid).
+    """
+    name: str
+    status: str = "done"
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+    child_cpu_s: float = 0.0
+    peak_rss_mb: Optional[float] = None
+    py_peak_mb: Optional[float] = None
+    records: Optional[int] = None
+    pid: int = 0
+
+    @property
+    def records_per_sec(self) -> Optional[float]:
+        """Throughput, if a record count is known."""
+        if self.records is None or self.wall_s <= 0:
+            return None
+        return self.records / self.wall_s
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        data = asdict(self)
+        data["records_per_sec"] = self.records_per_sec
+        return data
+
+
+class StageTimer:
+    """
+    Context manager measuring one stage.
+
+    Set `records` inside the block to report throughput. A block that raises
+    is recorded with status "failed". When tracing is enabled, the stage is
+    also recorded as a trace span.
+    """
+
+    def __init__(self, name: str, records: Optional[int] = None,
+                 report: Optional["RunReport"] = None):
+        """
+        Initialize StageTimer.
+
+        Args:
+            name: Stage name (sub-steps use "stage/step")
+            records: Number of records processed (optional, can be set later)
+            report: Report the metrics are added to (optional)
+        """
+        self.name = name
+        self.records = records
+        self.status = "done"
+        self.report = report
+        self.metrics: Optional[StageMetrics] = None
+
+    def __enter__(self) -> "StageTimer":
+        self._start_ns = time.time_ns()
+        self._wall = time.perf_counter()
+        self._cpu = time.thread_time()
+        self._children = children_cpu_s()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.metrics = StageMetrics(
+            name=self.name,
+            status="failed" if exc_type else self.status,
+            wall_s=time.perf_counter() - self._wall,
+            cpu_s=time.thread_time() - self._cpu,
+            child_cpu_s=children_cpu_s() - self._children,
+            peak_rss_mb=peak_rss_mb(),
+            py_peak_mb=py_peak_mb(),
+            records=self.records,
+            pid=os.getpid(),
+        )
+
+        if self.report is not None:
+            self.report.add(self.metrics)
+
+        tracer = get_tracer()
+        if tracer is not None:
+            tracer.add_span(self.name, "stage", self._start_ns, time.time_ns(),
+                            {"status": self.metrics.status, "records": self.records})
+
+        return False
+
+
+class RunReport:
+    """Collects stage metrics of a run and saves them as JSON."""
+
+    def __init__(self, name: str = "pipeline", trace_memory: bool = False):
+        """
+        Initialize RunReport.
+
+        Args:
+            name: Name of the run
+            trace_memory: Track Python allocation peaks with tracemalloc
+                (adds noticeable overhead)
+        """
+        self.name = name
+        self.stages: List[StageMetrics] = []
+        self.started_at = datetime.now()
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+        self._children = children_cpu_s()
+        self._lock = threading.Lock()
+
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def stage(self, name: str, records: Optional[int] = None) -> StageTimer:
+        """
+        Measure a stage; use as a context manager.
+
+        Args:
+            name: Stage name
+            records: Number of records processed (optional)
+
+        Returns:
+            StageTimer adding its metrics to this report on exit
+        """
+        return StageTimer(name, records, report=self)
+
+    def add(self, metrics: StageMetrics) -> None:
+        """Add metrics measured elsewhere (e.g. in a worker process)."""
+        with self._lock:
+            self.stages.append(metrics)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the report to a JSON-serializable dictionary."""
+        with self._lock:
+            stages = [metrics.to_dict() for metrics in self.stages]
+
+        return {
+            "run": {
+                "name": self.name,
+                "version": VERSION,
+                "started_at": self.started_at.isoformat(timespec="seconds"),
+                "wall_s": time.perf_counter() - self._wall,
+                "cpu_s": time.process_time() - self._cpu,
+                "child_cpu_s": children_cpu_s() - self._children,
+                "peak_rss_mb": peak_rss_mb(),
+                "py_peak_mb": py_peak_mb(),
+                "trace_memory": tracemalloc.is_tracing(),
+                "argv": sys.argv,
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+            },
+            "stages": stages,
+        }
+
+    def save(self, reports_dir: Path) -> Path:
+        """
+        Write the report as JSON.
+
+        Args:
+            reports_dir: Directory to write into
+
+        Returns:
+            Path of the written report
+        """
+        reports_dir = Path(reports_dir)
+        reports_dir.mkdir(parents=True, exist_ok=True)
+
+        path = reports_dir / f"run_report_{self.started_at.strftime('%Y%m%d_%H%M%S')}.json"
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+        logger.info(f"Run report saved: {path}")
+        return path
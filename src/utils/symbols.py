@@ -0,0 +1,158 @@
+"""
+Symbol table utilities for Conference Data Analysis project.
+Maps repeated strings (institutions, countries, continents, conference
+names) to dense integer codes, so they can be stored in compact arrays and
+compared as integers.
+"""
+
+import threading
+from typing import Any, Callable, Collection, Dict, Iterator, List, Optional
+
+from src.config.constants import INTERNED_FIELDS
+
+# Sentinel codes: key absent, and value present but not a string
+MISSING = -1
+NULL = -2
+
+
+class SymbolTable:
+    """
+    Bidirectional string <-> integer code mapping.
+
+    Codes are assigned densely from 0 in first-seen order and never change,
+    so arrays indexed by code (e.g. per-institution flags) stay valid as the
+    table grows. Interning is thread-safe.
+    """
+
+    def __init__(self):
+        """Initialize an empty SymbolTable."""
+        self._codes: Dict[str, int] = {}
+        self._symbols: List[str] = []
+        self._strings: Dict[str, str] = {}  # Each symbol mapped to itself
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_symbols(cls, symbols: List[str]) -> "SymbolTable":
+        """
+        Build a table whose codes are the positions in a list of distinct strings.
+
+        Args:
+            symbols: Strings in code order, e.g. a saved table's
+
+        Returns:
+            SymbolTable
+        """
+        table = cls()
+        table._symbols = list(symbols)
+        table._codes = dict(zip(table._symbols, range(len(table._symbols))))
+        table._strings = dict(zip(table._symbols, table._symbols))
+        return table
+
+    def intern(self, value: str) -> int:
+        """
+        Return the code of a string, assigning one if it is new.
+
+        Args:
+            value: String to intern
+
+        Returns:
+            Integer code
+        """
+        code = self._codes.get(value)
+        if code is not None:
+            return code
+
+        with self._lock:
+            code = self._codes.get(value)
+            if code is None:
+                code = len(self._symbols)
+                self._symbols.append(value)
+                self._strings[value] = value
+                self._codes[value] = code
+            return code
+
+    def canonical(self, value: str) -> str:
+        """
+        Return the table's shared instance of a string, interning it if new.
+
+        Equal strings loaded from different places become one object, which
+        saves memory and lets comparisons and dict lookups succeed on
+        identity with an already computed hash.
+
+        Args:
+            value: String to intern
+
+        Returns:
+            The shared string equal to value
+        """
+        string = self._strings.get(value)
+        if string is None:
+            string = self._symbols[self.intern(value)]
+        return string
+
+    def json_object_hook(self, fields: Collection[str] = INTERNED_FIELDS
+                         ) -> Callable[[Dict], Dict]:
+        """
+        Build a json.loads() object_hook interning string values as they load.
+
+        String values of the given fields (and string items of list values
+        there) are interned; other values are left alone. Keys are left
+        alone too, as the JSON decoder already shares repeated keys within
+        a document.
+
+        Args:
+            fields: Keys whose values are interned
+
+        Returns:
+            Function interning the values of a decoded object in place
+        """
+        # Runs for every JSON object, so the lookups are bound locally
+        canonical, lookup = self.canonical, self._strings.get
+
+        def hook(obj: Dict[str, Any]) -> Dict[str, Any]:
+            for key, value in obj.items():
+                if key not in fields:
+                    continue
+                if type(value) is str:
+                    obj[key] = lookup(value) or canonical(value)
+                elif type(value) is list:
+                    obj[key] = [canonical(v) if type(v) is str else v for v in value]
+            return obj
+
+        return hook
+
+    def encode(self, value: object) -> int:
+        """
+        Intern a JSON value: strings get their code, anything else (None,
+        numbers) NULL. MISSING is left for callers to mark absent keys.
+
+        Args:
+            value: Value to encode
+
+        Returns:
+            Integer code or NULL
+        """
+        return self.intern(value) if isinstance(value, str) else NULL
+
+    def code(self, value: str) -> Optional[int]:
+        """Return the code of a string without interning it (None if unknown)."""
+        return self._codes.get(value)
+
+    def symbol(self, code: int) -> Optional[str]:
+        """Return the string of a code (None for the NULL/MISSING sentinels)."""
+        return self._symbols[code] if code >= 0 else None
+
+    def __getstate__(self) -> List[str]:
+        return self._symbols
+
+    def __setstate__(self, symbols: List[str]) -> None:
+        self.__dict__.update(SymbolTable.from_symbols(symbols).__dict__)
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    def __contains__(self, value: object) -> bool:
+        return value in self._codes
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._symbols)
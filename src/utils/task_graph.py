@@ -0,0 +1,312 @@
+"""
+Task graph scheduler for Conference Data Analysis project.
+Runs pipeline tasks in dependency order, executing independent tasks
+concurrently, with make-like target selection.
+"""
+
+import fnmatch
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from src.utils.manifest import StampStore
+from src.utils.run_report import RunReport, StageTimer
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Task:
+    """
+    A unit of pipeline work.
+
+    A task depends on every task producing one of its inputs, plus the tasks
+    named in `after`. Inputs and outputs are artifact names (file paths or
+    glob patterns relative to the project root). Tasks listing `sources`
+    (the code and configuration that generate their outputs) are skipped
+    while their inputs, sources and outputs are unchanged since the last
+    successful run. `records` counts the records a run processed from the
+    action's return value, for throughput reporting.
+    """
+    name: str
+    action: Callable[[], Any]
+    inputs: List[str] = field(default_factory=list)
+    outputs: List[str] = field(default_factory=list)
+    after: List[str] = field(default_factory=list)
+    sources: List[str] = field(default_factory=list)
+    description: str = ""
+    critical: bool = True
+    records: Optional[Callable[[Any], Optional[int]]] = None
+
+
+@dataclass
+class TaskResult:
+    """Result from running (or skipping) a task."""
+    name: str
+    status: str
+    value: Any = None
+    error: Optional[str] = None
+    elapsed: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        return self.status in ("done", "up-to-date")
+
+
+class TaskGraph:
+    """Directed acyclic graph of tasks linked through their artifacts."""
+
+    def __init__(self):
+        """Initialize an empty TaskGraph."""
+        self.tasks: Dict[str, Task] = {}
+        self._producers: Dict[str, str] = {}
+
+    def add(self, task: Task) -> Task:
+        """
+        Add a task to the graph.
+
+        Args:
+            task: Task to add
+
+        Returns:
+            The added task
+
+        Raises:
+            ValueError: If the name is taken or an output already has a producer
+        """
+        if task.name in self.tasks:
+            raise ValueError(f"Duplicate task: {task.name}")
+
+        for output in task.outputs:
+            if output in self._producers:
+                raise ValueError(f"{output} is produced by both "
+                                 f"{self._producers[output]} and {task.name}")
+
+        self.tasks[task.name] = task
+        for output in task.outputs:
+            self._producers[output] = task.name
+
+        return task
+
+    def dependencies(self, name: str) -> Set[str]:
+        """
+        Get the tasks a task directly depends on.
+
+        Args:
+            name: Task name
+
+        Returns:
+            Names of upstream tasks
+        """
+        task = self.tasks[name]
+        deps = {self._producers[i] for i in task.inputs if i in self._producers}
+        deps.update(task.after)
+        deps.discard(name)
+
+        unknown = deps - self.tasks.keys()
+        if unknown:
+            raise ValueError(f"Task {name} depends on unknown task(s): {', '.join(sorted(unknown))}")
+
+        return deps
+
+    def match(self, patterns: Iterable[str]) -> List[str]:
+        """
+        Resolve task names or glob patterns (e.g. "plot:*").
+
+        Args:
+            patterns: Task names or patterns
+
+        Returns:
+            Matching task names in graph order
+
+        Raises:
+            ValueError: If a pattern matches no task
+        """
+        selected = set()
+
+        for pattern in patterns:
+            matches = fnmatch.filter(self.tasks, pattern)
+            if not matches:
+                raise ValueError(f"No task matches '{pattern}' "
+                                 f"(available: {', '.join(self.tasks)})")
+            selected.update(matches)
+
+        return [name for name in self.tasks if name in selected]
+
+    def select(self, only: Optional[Iterable[str]] = None,
+               until: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Select the tasks to run.
+
+        Args:
+            only: Run just these tasks; their upstream outputs are assumed current
+            until: Run these tasks and everything upstream of them
+
+        Returns:
+            Selected task names in topological order (all tasks by default)
+        """
+        if not only and not until:
+            return self.topological_order(self.tasks)
+
+        selected = set(self.match(only or []))
+
+        if until:
+            stack = self.match(until)
+            while stack:
+                name = stack.pop()
+                if name not in selected:
+                    selected.add(name)
+                    stack.extend(self.dependencies(name))
+
+        return self.topological_order(selected)
+
+    def topological_order(self, names: Iterable[str]) -> List[str]:
+        """
+        Order tasks so that each comes after its dependencies.
+
+        Args:
+            names: Task names to order
+
+        Returns:
+            Ordered task names (ties keep graph insertion order)
+
+        Raises:
+            ValueError: If the tasks contain a dependency cycle
+        """
+        names = set(names)
+        order = []
+        state: Dict[str, int] = {}  # 1 = visiting, 2 = done
+
+        def visit(name: str, path: List[str]):
+            if state.get(name) == 2:
+                return
+            if state.get(name) == 1:
+                raise ValueError(f"Dependency cycle: {' -> '.join(path + [name])}")
+
+            state[name] = 1
+            for dep in sorted(self.dependencies(name) & names, key=list(self.tasks).index):
+                visit(dep, path + [name])
+            state[name] = 2
+            order.append(name)
+
+        for name in self.tasks:
+            if name in names:
+                visit(name, [])
+
+        return order
+
+    def run(self, names: Optional[List[str]] = None, max_workers: int = 1,
+            stamps: Optional[StampStore] = None, force: bool = False,
+            report: Optional[RunReport] = None,
+            on_result: Optional[Callable[[TaskResult], None]] = None) -> Dict[str, TaskResult]:
+        """
+        Run tasks, starting each one as soon as its dependencies are done.
+
+        Tasks downstream of a failed task are skipped. Dependencies outside
+        `names` are assumed to be up to date.
+
+        Args:
+            names: Tasks to run (default: all)
+            max_workers: Maximum number of tasks running at once
+            stamps: Stamp store enabling up-to-date checks (optional)
+            force: Run tasks even if their stamps are current
+            report: Run report receiving one stage per task (optional)
+            on_result: Called with each task's result as soon as it is
+                final (done, up-to-date, failed or skipped), on the thread
+                calling run() (optional)
+
+        Returns:
+            TaskResult per task, in topological order
+        """
+        order = self.topological_order(self.tasks if names is None else names)
+        selected = set(order)
+        waiting = {name: self.dependencies(name) & selected for name in order}
+        results: Dict[str, TaskResult] = {}
+        running = {}
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            while waiting or running:
+                ready = [name for name in order
+                         if name in waiting and waiting[name] <= results.keys()]
+
+                for name in ready:
+                    failed = sorted(d for d in waiting.pop(name) if not results[d].success)
+
+                    if failed:
+                        results[name] = TaskResult(name, "skipped",
+                                                   error=f"Upstream failed: {', '.join(failed)}")
+                        logger.warning(f"Skipping {name}: upstream failed ({', '.join(failed)})")
+                        if on_result is not None:
+                            on_result(results[name])
+                    else:
+                        future = executor.submit(self._run_task, self.tasks[name],
+                                                 stamps, force, report)
+                        running[future] = name
+
+                if not running:
+                    if ready:
+                        continue
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    results[running.pop(future)] = result
+                    if on_result is not None:
+                        on_result(result)
+
+        if stamps is not None:
+            stamps.save()
+
+        return {name: results[name] for name in order}
+
+    def _run_task(self, task: Task, stamps: Optional[StampStore] = None,
+                  force: bool = False, report: Optional[RunReport] = None) -> TaskResult:
+        """Run one task as a measured stage."""
+        with StageTimer(task.name, report=report) as timer:
+            result = self._execute(task, stamps, force, timer)
+            timer.status = result.status
+
+        return result
+
+    def _execute(self, task: Task, stamps: Optional[StampStore], force: bool,
+                 timer: StageTimer) -> TaskResult:
+        """Run one task unless it is up to date, capturing its value or error."""
+        start = time.perf_counter()
+        fingerprint = None
+
+        if stamps is not None and task.sources:
+            fingerprint = stamps.fingerprint(task.inputs, task.sources)
+
+            if not force and stamps.is_current(task.name, fingerprint, task.outputs):
+                logger.info(f"Up to date: {task.name}")
+                return TaskResult(task.name, "up-to-date", elapsed=time.perf_counter() - start)
+
+        logger.info(f"Starting {task.name}" + (f": {task.description}" if task.description else ""))
+
+        try:
+            value = task.action()
+            if task.records is not None:
+                timer.records = task.records(value)
+        except Exception as e:
+            elapsed = time.perf_counter() - start
+            log = logger.error if task.critical else logger.warning
+            log(f"Task {task.name} failed after {elapsed:.1f}s: {e}")
+            if fingerprint is not None:
+                stamps.discard(task.name)
+            return TaskResult(task.name, "failed", error=str(e), elapsed=elapsed)
+
+        if fingerprint is not None:
+            missing = [o for o in task.outputs if not (stamps.root / o).is_file()]
+            if missing:
+                logger.warning(f"Task {task.name} did not write {', '.join(missing)}; "
+                               f"it will run again next time")
+                stamps.discard(task.name)
+            else:
+                stamps.record(task.name, fingerprint, task.outputs)
+
+        elapsed = time.perf_counter() - start
+        logger.info(f"Finished {task.name} ({elapsed:.1f}s)")
+        return TaskResult(task.name, "done", value=value, elapsed=elapsed)
@@ -0,0 +1,187 @@
+"""
+Tracing utilities for Conference Data Analysis project.
+Records spans of pipeline work and exports them in the Chrome Trace Event
+Format, which can be opened in Perfetto (ui.perfetto.dev) or
+chrome://tracing to see concurrency and stragglers.
+
+Tracing is off by default; spans cost a single check until enable_tracing()
+is called. Timestamps come from time.time_ns(), so spans recorded in worker
+processes line up with those of the parent.
+"""
+
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class Tracer:
+    """Collects trace events of one process."""
+
+    def __init__(self):
+        """Initialize an empty Tracer."""
+        self.events: List[Dict[str, Any]] = []
+        self.thread_names: Dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def add_span(self, name: str, category: str, start_ns: int, end_ns: int,
+                 args: Optional[Dict[str, Any]] = None,
+                 pid: Optional[int] = None, tid: Optional[int] = None) -> None:
+        """
+        Record a completed span ("X" event).
+
+        Args:
+            name: Span name
+            category: Event category (e.g. "processor", "rscript")
+            start_ns: Start time from time.time_ns()
+            end_ns: End time from time.time_ns()
+            args: Extra fields shown with the event (optional)
+            pid: Process id (default: current process)
+            tid: Thread id (default: current thread)
+        """
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": start_ns / 1000,
+            "dur": (end_ns - start_ns) / 1000,
+            "pid": os.getpid() if pid is None else pid,
+            "tid": threading.get_native_id() if tid is None else tid,
+        }
+        if args:
+            event["args"] = args
+
+        with self._lock:
+            self.events.append(event)
+            if tid is None:
+                self.thread_names.setdefault(event["tid"], threading.current_thread().name)
+
+    def extend(self, events: List[Dict[str, Any]]) -> None:
+        """Merge events recorded elsewhere (e.g. in a worker process)."""
+        with self._lock:
+            self.events.extend(events)
+
+    def metadata_events(self) -> List[Dict[str, Any]]:
+        """Build process/thread name events for the recorded pids and tids."""
+        with self._lock:
+            events = list(self.events)
+            threads = dict(self.thread_names)
+
+        metadata = []
+
+        for pid in sorted({e["pid"] for e in events}):
+            name = "main" if pid == os.getpid() else f"worker {pid}"
+            metadata.append({"name": "process_name", "ph": "M", "pid": pid,
+                             "args": {"name": name}})
+
+        for pid, tid in sorted({(e["pid"], e["tid"]) for e in events}):
+            if pid == os.getpid() and tid in threads:
+                metadata.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                                 "args": {"name": threads[tid]}})
+
+        return metadata
+
+    def save(self, path: Path) -> Path:
+        """
+        Write the trace as Chrome Trace Event Format JSON.
+
+        Args:
+            path: Output file
+
+        Returns:
+            Path of the written trace
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        metadata = self.metadata_events()
+        with self._lock:
+            events = sorted(self.events, key=lambda e: e["ts"])
+
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"traceEvents": metadata + events, "displayTimeUnit": "ms"}, f)
+
+        logger.info(f"Trace saved: {path} ({len(events)} spans)")
+        return path
+
+
+_tracer: Optional[Tracer] = None
+
+
+def enable_tracing() -> Tracer:
+    """Start recording spans in this process, returning the active tracer."""
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer()
+    return _tracer
+
+
+def disable_tracing() -> Optional[Tracer]:
+    """Stop recording spans, returning the tracer that was active."""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    return tracer
+
+
+def get_tracer() -> Optional[Tracer]:
+    """Return the active tracer, or None if tracing is disabled."""
+    return _tracer
+
+
+@contextmanager
+def span(name: str, category: str = "pipeline", **args) -> Iterator[Dict[str, Any]]:
+    """
+    Trace a block of code.
+
+    Yields a dict that can be updated with extra args while the block runs.
+
+    Args:
+        name: Span name
+        category: Event category
+        **args: Extra fields shown with the event
+    """
+    tracer = _tracer
+    if tracer is None:
+        yield args
+        return
+
+    start = time.time_ns()
+    try:
+        yield args
+    finally:
+        tracer.add_span(name, category, start, time.time_ns(), args)
+
+
+def traced(name: Optional[str] = None, category: str = "processor") -> Callable:
+    """
+    Decorator tracing each call of a function.
+
+    Args:
+        name: Span name (default: the function's qualified name)
+        category: Event category
+    """
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            tracer = _tracer
+            if tracer is None:
+                return func(*args, **kwargs)
+
+            start = time.time_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                tracer.add_span(span_name, category, start, time.time_ns())
+
+        return wrapper
+
+    return decorator
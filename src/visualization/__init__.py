@@ -6,9 +6,13 @@ R scripts should be run using Rscript:
 
     Rscript src/visualization/plot_papers_distribution.R
 
-Or use the main pipeline:
+Or use the main pipeline, which renders them concurrently through
+r_runner.RScriptRunner:
 
-    python generate_all.py
+    python run_full_analysis.py
+
+With --plot-backend worker, plots are rendered in warm R sessions
+(r_worker.R driven by r_worker.RWorker) that load the libraries once.
 """
 
 
@@ -0,0 +1,221 @@
+"""
+R environment verification for Conference Data Analysis project.
+Checks that the R packages required by the plot scripts are installed,
+caching the result so unchanged R installations are verified without
+launching R. Packages are never installed automatically.
+"""
+
+import json
+import logging
+import os
+import shutil
+import subprocess
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from src.config.constants import R_CHECK_TIMEOUT, R_REQUIRED_PACKAGES
+from src.utils.manifest import file_signature
+from src.utils.tracing import span
+
+logger = logging.getLogger(__name__)
+
+# Environment variables that change where R finds packages
+R_ENV_VARS = ["R_HOME", "R_LIBS", "R_LIBS_USER", "R_LIBS_SITE"]
+
+# Prints R version, library paths and the install location of each package
+# (empty if missing). system.file() avoids scanning every installed package
+# the way installed.packages() does.
+_PROBE = """
+pkgs <- c({packages})
+cat("version\\t", R.version.string, "\\n", sep = "")
+for (p in .libPaths()) cat("libpath\\t", normalizePath(p), "\\n", sep = "")
+for (p in pkgs) cat("package\\t", p, "\\t", system.file(package = p), "\\n", sep = "")
+"""
+
+
+class RPackageError(RuntimeError):
+    """Raised when required R packages are missing."""
+
+    def __init__(self, missing: Sequence[str]):
+        self.missing = list(missing)
+        super().__init__(
+            f"Missing R packages: {', '.join(self.missing)} "
+            f"(install with: install.packages(c({', '.join(json.dumps(p) for p in self.missing)})))"
+        )
+
+
+@dataclass
+class REnvironment:
+    """Verified R installation."""
+    rscript: str
+    version: str
+    lib_paths: List[str] = field(default_factory=list)
+    packages: Dict[str, str] = field(default_factory=dict)
+    cached: bool = False
+
+
+class RPackageVerifier:
+    """Verifies required R packages, with a cache keyed on the R installation."""
+
+    def __init__(self, rscript: str, cache_path: Optional[Path] = None,
+                 timeout: float = R_CHECK_TIMEOUT):
+        """
+        Initialize RPackageVerifier.
+
+        Args:
+            rscript: Rscript executable
+            cache_path: JSON file the verification result is cached in (optional)
+            timeout: Timeout in seconds for probing R on a cache miss
+        """
+        self.rscript = rscript
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.timeout = timeout
+
+    def verify(self, packages: Sequence[str] = R_REQUIRED_PACKAGES,
+               refresh: bool = False) -> REnvironment:
+        """
+        Verify that packages are installed.
+
+        The cached result is reused without launching R while Rscript, the
+        R_* environment variables, the probed R version and library paths,
+        each library directory and each package's DESCRIPTION file are
+        unchanged.
+
+        Args:
+            packages: Required package names
+            refresh: Ignore the cache and probe R
+
+        Returns:
+            REnvironment describing the installation
+
+        Raises:
+            RPackageError: If any package is missing
+            RuntimeError: If R cannot be probed
+        """
+        key = self._cache_key()
+
+        if not refresh:
+            environment = self._load_cached(key, packages)
+            if environment is not None:
+                logger.info(f"R packages verified (cached): {environment.version}")
+                return environment
+
+        environment = self._probe(packages)
+
+        missing = [p for p in packages if not environment.packages.get(p)]
+        if missing:
+            self._discard_cache()
+            raise RPackageError(missing)
+
+        self._save_cache(key, environment)
+        logger.info(f"R packages verified: {environment.version}")
+        return environment
+
+    def _cache_key(self) -> Dict:
+        """Describe how R is launched, without launching it."""
+        executable = shutil.which(self.rscript) or self.rscript
+        signature = file_signature(executable) if os.path.exists(executable) else None
+
+        return {
+            "rscript": os.path.realpath(executable),
+            "signature": signature,
+            "env": {name: os.environ.get(name) for name in R_ENV_VARS},
+        }
+
+    @staticmethod
+    def _installation_key(environment: REnvironment) -> Dict:
+        """Describe a probed installation by its version and library directories.
+
+        A library directory's signature changes when packages are installed
+        into or removed from it, or when R is upgraded in place.
+        """
+        lib_paths = [
+            [path, file_signature(path) if os.path.isdir(path) else None]
+            for path in environment.lib_paths
+        ]
+        return {"version": environment.version, "lib_paths": lib_paths}
+
+    def _probe(self, packages: Sequence[str]) -> REnvironment:
+        """Ask R for its version, library paths and package locations."""
+        code = _PROBE.format(packages=", ".join(json.dumps(p) for p in packages))
+
+        try:
+            with span("Rscript package check", "rscript"):
+                result = subprocess.run(
+                    [self.rscript, "-e", code],
+                    capture_output=True,
+                    text=True,
+                    timeout=self.timeout
+                )
+        except subprocess.TimeoutExpired:
+            raise RuntimeError(f"R package check timed out after {self.timeout:g}s")
+        except OSError as e:
+            raise RuntimeError(f"Could not run {self.rscript}: {e}")
+
+        if result.returncode != 0:
+            raise RuntimeError(f"R package check failed: {result.stderr.strip()[:200]}")
+
+        environment = REnvironment(rscript=self.rscript, version="")
+
+        for line in result.stdout.splitlines():
+            kind, _, value = line.partition("\t")
+            if kind == "version":
+                environment.version = value
+            elif kind == "libpath":
+                environment.lib_paths.append(value)
+            elif kind == "package":
+                name, _, path = value.partition("\t")
+                environment.packages[name] = path
+
+        return environment
+
+    def _load_cached(self, key: Dict, packages: Sequence[str]) -> Optional[REnvironment]:
+        """Return the cached environment if it is still valid."""
+        if self.cache_path is None or not self.cache_path.exists():
+            return None
+
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            environment = REnvironment(**cache["environment"])
+            descriptions = cache["descriptions"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        if cache.get("key") != {**key, **self._installation_key(environment)}:
+            return None
+
+        for package in packages:
+            path = environment.packages.get(package)
+            if not path or package not in descriptions:
+                return None
+
+            description = Path(path) / "DESCRIPTION"
+            if not description.exists() or file_signature(description) != descriptions[package]:
+                return None
+
+        environment.cached = True
+        return environment
+
+    def _save_cache(self, key: Dict, environment: REnvironment):
+        """Cache a successful verification."""
+        if self.cache_path is None:
+            return
+
+        descriptions = {}
+        for package, path in environment.packages.items():
+            description = Path(path) / "DESCRIPTION"
+            if description.exists():
+                descriptions[package] = file_signature(description)
+
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.cache_path, 'w', encoding='utf-8') as f:
+            json.dump({"key": {**key, **self._installation_key(environment)},
+                       "environment": asdict(environment),
+                       "descriptions": descriptions}, f, indent=2)
+
+    def _discard_cache(self):
+        """Forget a cached verification."""
+        if self.cache_path is not None and self.cache_path.exists():
+            self.cache_path.unlink()
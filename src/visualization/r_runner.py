@@ -0,0 +1,211 @@
+"""
+R script runner for Conference Data Analysis project.
+Locates Rscript and renders plot scripts with bounded concurrency and
+per-plot timeouts, either as independent processes or in warm R workers.
+"""
+
+import logging
+import queue
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+from src.config.constants import PLOT_BACKEND, PLOT_BACKENDS, PLOT_TIMEOUT
+from src.utils.tracing import span
+
+logger = logging.getLogger(__name__)
+
+# Rscript locations tried in order (bare "Rscript" is resolved via PATH)
+RSCRIPT_CANDIDATES = [
+    r"C:\Program Files\R\R-4.5.1\bin\x64\Rscript.exe",
+    r"C:\Program Files\R\R-4.5.0\bin\x64\Rscript.exe",
+    "Rscript",
+]
+
+
+def find_rscript() -> Optional[str]:
+    """
+    Locate the Rscript executable.
+
+    Returns:
+        Path or command name of Rscript, or None if not found
+    """
+    for path in RSCRIPT_CANDIDATES:
+        if Path(path).exists() if path.startswith("C:") else True:
+            return path
+
+    return None
+
+
+@dataclass
+class PlotResult:
+    """Result from rendering a single plot script."""
+    script: str
+    description: str
+    success: bool
+    returncode: Optional[int] = None
+    stdout: str = ""
+    stderr: str = ""
+    elapsed: float = 0.0
+    error: Optional[str] = None
+
+
+class RScriptRunner:
+    """Runs R plot scripts, several at a time."""
+
+    def __init__(self, rscript: str, project_root: Path,
+                 max_workers: int = 1, timeout: float = PLOT_TIMEOUT,
+                 backend: str = PLOT_BACKEND):
+        """
+        Initialize RScriptRunner.
+
+        Args:
+            rscript: Rscript executable
+            project_root: Root directory of project (working directory of scripts)
+            max_workers: Maximum number of concurrent R processes
+            timeout: Per-plot timeout in seconds
+            backend: "subprocess" (one Rscript per plot) or "worker" (warm R sessions)
+        """
+        if backend not in PLOT_BACKENDS:
+            raise ValueError(f"Unknown plot backend: {backend} "
+                             f"(expected one of {', '.join(PLOT_BACKENDS)})")
+
+        self.rscript = rscript
+        self.project_root = Path(project_root)
+        self.script_dir = self.project_root / "src" / "visualization"
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self.backend = backend
+
+        # Render slots bound concurrency; idle warm workers are reused
+        self._slots = threading.BoundedSemaphore(self.max_workers)
+        self._idle_workers = queue.Queue()
+
+    def run_plot(self, script: str, description: str) -> PlotResult:
+        """
+        Render one plot script.
+
+        Args:
+            script: Script file name in src/visualization
+            description: Human-readable plot description
+
+        Returns:
+            PlotResult with exit status and captured output
+        """
+        script_path = self.script_dir / script
+
+        if not script_path.exists():
+            return PlotResult(script, description, success=False,
+                              error=f"Script not found: {script}")
+
+        start = time.perf_counter()
+
+        try:
+            with span(f"Rscript {script}", "rscript", script=script) as trace_args:
+                result = subprocess.run(
+                    [self.rscript, str(script_path)],
+                    cwd=self.project_root,
+                    capture_output=True,
+                    text=True,
+                    timeout=self.timeout
+                )
+                trace_args["returncode"] = result.returncode
+        except subprocess.TimeoutExpired as e:
+            return PlotResult(
+                script, description, success=False,
+                stdout=_as_text(e.stdout), stderr=_as_text(e.stderr),
+                elapsed=time.perf_counter() - start,
+                error=f"Timed out after {self.timeout:g}s"
+            )
+        except Exception as e:
+            return PlotResult(script, description, success=False,
+                              elapsed=time.perf_counter() - start, error=str(e))
+
+        return PlotResult(
+            script, description,
+            success=result.returncode == 0,
+            returncode=result.returncode,
+            stdout=result.stdout,
+            stderr=result.stderr,
+            elapsed=time.perf_counter() - start,
+            error=None if result.returncode == 0 else result.stderr.strip()[:100]
+        )
+
+    def render(self, script: str, description: str) -> PlotResult:
+        """
+        Render one plot with the configured backend and log the outcome.
+
+        Safe to call from several threads; at most max_workers plots render
+        at once.
+
+        Args:
+            script: Script file name in src/visualization
+            description: Human-readable plot description
+
+        Returns:
+            PlotResult for the plot
+        """
+        with self._slots:
+            logger.info(f"Generating: {description}")
+
+            if self.backend == "worker":
+                worker = self._borrow_worker()
+                try:
+                    result = worker.render(script, description, timeout=self.timeout)
+                finally:
+                    self._idle_workers.put(worker)
+            else:
+                result = self.run_plot(script, description)
+
+        if result.success:
+            logger.info(f"Successfully generated: {script} ({result.elapsed:.1f}s)")
+        else:
+            logger.error(f"Failed to generate {script}: {result.error}")
+
+        return result
+
+    def run_plots(self, plots: Sequence[Tuple[str, str]]) -> List[PlotResult]:
+        """
+        Render plot scripts concurrently.
+
+        Args:
+            plots: Sequence of (script, description)
+
+        Returns:
+            PlotResult per plot, in input order
+        """
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                return list(executor.map(lambda plot: self.render(*plot), plots))
+        finally:
+            self.close()
+
+    def close(self):
+        """Stop idle R workers (worker backend)."""
+        while True:
+            try:
+                self._idle_workers.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def _borrow_worker(self):
+        """Take an idle R worker, creating one if all are busy."""
+        try:
+            return self._idle_workers.get_nowait()
+        except queue.Empty:
+            # Imported here: r_worker depends on this module
+            from src.visualization.r_worker import RWorker
+            return RWorker(self.rscript, self.project_root)
+
+
+def _as_text(output) -> str:
+    """Normalize output captured by TimeoutExpired (bytes, str or None)."""
+    if output is None:
+        return ""
+    if isinstance(output, bytes):
+        return output.decode("utf-8", errors="replace")
+    return output
@@ -0,0 +1,250 @@
+"""
+Persistent R worker client for Conference Data Analysis project.
+Keeps one warm R session (r_worker.R) alive and sends it plot jobs over
+stdin, so libraries are loaded once instead of once per plot.
+"""
+
+import itertools
+import logging
+import queue
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.config.constants import PLOT_TIMEOUT
+from src.utils.tracing import span
+from src.visualization.r_runner import PlotResult
+
+logger = logging.getLogger(__name__)
+
+# Marker of status lines written by r_worker.R
+STATUS_PREFIX = "@@RWORKER"
+
+# Time allowed for the worker to load its libraries
+STARTUP_TIMEOUT = 120
+
+
+class RWorkerError(RuntimeError):
+    """Raised when the R worker cannot be started."""
+
+
+class RWorker:
+    """Client for one persistent r_worker.R process."""
+
+    def __init__(self, rscript: str, project_root: Path,
+                 startup_timeout: float = STARTUP_TIMEOUT):
+        """
+        Initialize RWorker. The R process is started on first use.
+
+        Args:
+            rscript: Rscript executable
+            project_root: Root directory of project (working directory of the worker)
+            startup_timeout: Seconds allowed for loading libraries
+        """
+        self.rscript = rscript
+        self.project_root = Path(project_root)
+        self.script_dir = self.project_root / "src" / "visualization"
+        self.startup_timeout = startup_timeout
+        self.jobs_run = 0
+
+        self._process: Optional[subprocess.Popen] = None
+        self._statuses: "queue.Queue[Optional[List[str]]]" = queue.Queue()
+        self._stdout: List[str] = []
+        self._stderr: List[str] = []
+        self._lock = threading.Lock()
+        self._job_ids = itertools.count(1)
+
+    @property
+    def alive(self) -> bool:
+        """Whether the R process is running."""
+        return self._process is not None and self._process.poll() is None
+
+    def start(self):
+        """
+        Start the R process and wait until its libraries are loaded.
+
+        Raises:
+            RWorkerError: If the worker fails or times out during startup
+        """
+        if self.alive:
+            return
+
+        self._statuses = queue.Queue()
+        self._stdout, self._stderr = [], []
+
+        start = time.perf_counter()
+        self._process = subprocess.Popen(
+            [self.rscript, str(self.script_dir / "r_worker.R")],
+            cwd=self.project_root,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            bufsize=1
+        )
+
+        threading.Thread(target=self._read_stdout, args=(self._process, self._statuses),
+                         daemon=True).start()
+        threading.Thread(target=self._read_stderr, args=(self._process,), daemon=True).start()
+
+        with span("R worker startup", "rscript", pid=self._process.pid):
+            status = self._wait_status(self.startup_timeout)
+
+        if status is None or status[:2] != ["STARTUP", "OK"]:
+            stderr = self._take_output()[1].strip()
+            detail = status[2] if status and len(status) > 2 else stderr[-200:] or "no response"
+            self.close()
+            raise RWorkerError(f"R worker failed to start: {detail}")
+
+        self._take_output()
+        logger.debug(f"R worker started in {time.perf_counter() - start:.1f}s")
+
+    def render(self, script: str, description: str,
+               params: Optional[Dict[str, str]] = None,
+               timeout: float = PLOT_TIMEOUT) -> PlotResult:
+        """
+        Render one plot script in the warm R session.
+
+        A job that times out kills the worker; it is restarted on the next call.
+
+        Args:
+            script: Script file name in src/visualization
+            description: Human-readable plot description
+            params: Top-level script variables to override (e.g. OUTPUT_PDF)
+            timeout: Job timeout in seconds
+
+        Returns:
+            PlotResult with job status and captured output
+        """
+        script_path = self.script_dir / script
+
+        if not script_path.exists():
+            return PlotResult(script, description, success=False,
+                              error=f"Script not found: {script}")
+
+        with self._lock:
+            start = time.perf_counter()
+
+            try:
+                self.start()
+            except (OSError, RWorkerError) as e:
+                return PlotResult(script, description, success=False,
+                                  elapsed=time.perf_counter() - start, error=str(e))
+
+            job_id = str(next(self._job_ids))
+            fields = [job_id, script_path.relative_to(self.project_root).as_posix()]
+            fields.extend(f"{name}={value}" for name, value in (params or {}).items())
+
+            try:
+                self._process.stdin.write("\t".join(fields) + "\n")
+                self._process.stdin.flush()
+            except OSError as e:
+                self.close()
+                return PlotResult(script, description, success=False,
+                                  elapsed=time.perf_counter() - start,
+                                  error=f"R worker unavailable: {e}")
+
+            with span(f"R worker {script}", "rscript", script=script,
+                      worker_pid=self._process.pid) as trace_args:
+                status = self._wait_status(timeout, job_id)
+                trace_args["status"] = status[1] if status else "timeout"
+            elapsed = time.perf_counter() - start
+
+            if status is None:
+                stdout, stderr = self._take_output()
+                timed_out = self.alive
+                self.close(kill=True)
+                return PlotResult(
+                    script, description, success=False,
+                    stdout=stdout, stderr=stderr, elapsed=elapsed,
+                    error=f"Timed out after {timeout:g}s" if timed_out
+                    else (stderr.strip()[:100] or "R worker exited")
+                )
+
+            stdout, stderr = self._take_output()
+            success = status[1] == "OK"
+            self.jobs_run += 1
+
+            return PlotResult(
+                script, description,
+                success=success,
+                returncode=0 if success else 1,
+                stdout=stdout,
+                stderr=stderr,
+                elapsed=elapsed,
+                error=None if success else (status[2] if len(status) > 2 else "")[:100]
+            )
+
+    def close(self, kill: bool = False):
+        """
+        Stop the R process.
+
+        Args:
+            kill: Kill immediately instead of letting the worker finish
+        """
+        process, self._process = self._process, None
+
+        if process is None:
+            return
+
+        if not kill and process.poll() is None:
+            try:
+                process.stdin.close()
+                process.wait(timeout=5)
+                return
+            except (OSError, subprocess.TimeoutExpired):
+                pass
+
+        process.kill()
+        process.wait()
+
+    def __enter__(self) -> "RWorker":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _wait_status(self, timeout: float, job_id: Optional[str] = None) -> Optional[List[str]]:
+        """Wait for the status line of a job (or startup); None on timeout or exit."""
+        deadline = time.monotonic() + timeout
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+
+            try:
+                status = self._statuses.get(timeout=remaining)
+            except queue.Empty:
+                return None
+
+            if status is None:
+                return None
+            if job_id is None or status[0] == job_id:
+                return status
+
+    def _take_output(self) -> tuple[str, str]:
+        """Return and reset output captured since the last job."""
+        stdout, self._stdout = self._stdout, []
+        stderr, self._stderr = self._stderr, []
+        return "".join(stdout), "".join(stderr)
+
+    def _read_stdout(self, process: subprocess.Popen, statuses: queue.Queue):
+        """Split worker stdout into status lines and script output."""
+        for line in process.stdout:
+            if line.startswith(STATUS_PREFIX + "\t"):
+                statuses.put(line.rstrip("\n").split("\t")[1:])
+            elif process is self._process:
+                self._stdout.append(line)
+
+        statuses.put(None)
+
+    def _read_stderr(self, process: subprocess.Popen):
+        """Collect worker stderr."""
+        for line in process.stderr:
+            if process is self._process:
+                self._stderr.append(line)
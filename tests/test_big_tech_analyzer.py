@@ -0,0 +1,35 @@
+"""Tests for BigTechAnalyzer output against the per-CSV analysis methods."""
+
+import pytest
+
+from benchmarks.synthetic_corpus import CorpusSpec, SyntheticCorpusGenerator
+from src.processors.big_tech_analyzer import BigTechAnalyzer
+from src.processors.data_reducer import DataReducer
+
+SPEC = CorpusSpec(conferences=4, start_year=2019, end_year=2022, papers_per_year=30,
+                  institutions=60, big_tech_rate=0.2, seed=7)
+
+
+@pytest.fixture(scope="module")
+def project(tmp_path_factory):
+    """Project tree with reduced synthetic ProcessedData."""
+    root = tmp_path_factory.mktemp("project")
+    SyntheticCorpusGenerator(SPEC).generate(root)
+    DataReducer(root, incremental=False).process_all_conferences()
+    return root
+
+
+def test_single_sweep_matches_separate_analyses(project, tmp_path):
+    legacy = BigTechAnalyzer(project)
+    yearly = legacy.generate_csv(tmp_path / "legacy_yearly.csv")
+    by_continent = legacy.generate_continent_csv(tmp_path / "legacy_continent.csv")
+
+    result = BigTechAnalyzer(project).generate_all_outputs(
+        tmp_path / "yearly.csv", tmp_path / "continent.csv"
+    )
+
+    assert result.yearly_csv.read_bytes() == yearly.read_bytes()
+    assert result.continent_csv.read_bytes() == by_continent.read_bytes()
+    assert result.yearly == BigTechAnalyzer(project).analyze_all_conferences()
+    assert len(result.yearly) == SPEC.conferences * 4
+    assert any(row["X0"] > 0 for row in result.by_continent)
@@ -0,0 +1,147 @@
+"""Tests for ColumnarStore building, binary save/load and the Corpus binary path."""
+
+import pytest
+
+from src.config.constants import DATA_DIRS
+from src.utils.columnar import _COLUMNS, ColumnarStore
+from src.utils.corpus import Corpus
+from src.utils.symbols import SymbolTable
+
+PAPERS = {
+    "2020": [
+        {
+            "Title": "Café at scale \ud800",
+            "Predominant Continent": ["EU"],
+            "Authors and Institutions": [
+                {"Name": "A", "Institutions": [
+                    {"Institution Name": "Google", "Country": "US"},
+                    {"Institution Name": "ETH Zurich", "Country": None},
+                ]},
+                {"Name": "B", "Institutions": [{"Country": "DE"}, None]},
+            ],
+        },
+        {"Title": "No authors", "Predominant Continent": [], "Authors and Institutions": []},
+    ],
+    "2021": [
+        {
+            "Title": "王",
+            "Predominant Continent": ["AS", "NA"],
+            "Authors and Institutions": [
+                {"Name": "C", "Institutions": [{"Institution Name": "Tsinghua", "Country": "CN"}]},
+            ],
+        },
+    ],
+}
+
+
+def build_store(symbols=None):
+    """Store of PAPERS under two conference names."""
+    store = ColumnarStore(symbols)
+    store.add_conference("osdi", PAPERS.items())
+    store.add_conference("sosp", [("2021", PAPERS["2021"])])
+    return store
+
+
+def expected_paper(paper, year):
+    """The fields ColumnarStore.paper() keeps from a processed paper."""
+    return {
+        "Title": paper["Title"],
+        "Year": year,
+        "Predominant Continent": paper["Predominant Continent"],
+        "Authors and Institutions": [
+            {"Institutions": author["Institutions"]} for author in paper["Authors and Institutions"]
+        ],
+    }
+
+
+def snapshot(store):
+    """Everything a store answers queries from, as plain values."""
+    return {
+        "groups": list(store.groups()),
+        "papers": [store.paper(i) for i in range(len(store))],
+        "has_predominant": store.has_predominant,
+        "num_authors": store.num_authors,
+        "num_affiliations": store.num_affiliations,
+    }
+
+
+def test_papers_are_materialized_with_kept_fields():
+    store = build_store()
+    assert store.conferences() == ["osdi", "sosp"]
+    assert store.select("osdi", "2020") == [0, 1]
+    assert store.select(year="2021") == [2, 3]
+
+    for year, papers in PAPERS.items():
+        for index, paper in zip(store.select("osdi", year), papers):
+            assert store.paper(index) == expected_paper(paper, year)
+
+
+@pytest.mark.parametrize("mmap_columns", [False, True])
+def test_save_load_round_trip(tmp_path, mmap_columns):
+    store = build_store()
+    path = tmp_path / "store.bin"
+    store.save(path)
+
+    loaded = ColumnarStore.load(path, mmap_columns=mmap_columns)
+
+    assert list(loaded.symbols) == list(store.symbols)
+    for name in _COLUMNS:
+        assert list(getattr(loaded, name)) == list(getattr(store, name)), name
+    assert snapshot(loaded) == snapshot(store)
+
+
+def test_mapped_store_survives_file_replacement(tmp_path):
+    path = tmp_path / "store.bin"
+    build_store().save(path)
+    loaded = ColumnarStore.load(path, mmap_columns=True)
+
+    ColumnarStore().save(path)
+
+    assert snapshot(loaded) == snapshot(build_store())
+
+
+def test_extend_translates_codes_between_symbol_tables():
+    symbols = SymbolTable()
+    symbols.intern("unrelated")
+    merged = ColumnarStore(symbols)
+
+    merged.extend(build_store())
+    merged.extend(build_store())
+
+    single = snapshot(build_store())
+    doubled = snapshot(merged)
+    assert doubled["papers"] == single["papers"] * 2
+    assert [(c, y) for c, y, _ in doubled["groups"]] == [(c, y) for c, y, _ in single["groups"]] * 2
+    assert merged.select("sosp") == [3, 7]
+
+
+def test_store_without_predominant_is_flagged():
+    store = ColumnarStore()
+    store.add_conference("osdi", [("2020", [{"Title": "raw"}])])
+    assert not store.has_predominant
+
+    store.set_predominant([["EU"]])
+    assert store.has_predominant
+    assert store.predominant(0) == ["EU"]
+
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / "store.bin"
+    path.write_bytes(b"not a store at all")
+
+    with pytest.raises(ValueError):
+        ColumnarStore.load(path)
+    with pytest.raises(FileNotFoundError):
+        ColumnarStore.load(tmp_path / "missing.bin")
+
+
+def test_corpus_refuses_binary_only_conferences(tmp_path):
+    store = ColumnarStore()
+    store.add_conference("osdi", PAPERS.items())
+    store.save(tmp_path / DATA_DIRS["processed"] / "osdi_data.bin")
+    corpus = Corpus(tmp_path)
+
+    assert corpus.paper_conferences() == ["osdi"]
+    assert snapshot(corpus.paper_store()) == snapshot(store)
+    with pytest.raises(FileNotFoundError):
+        corpus.papers("osdi")
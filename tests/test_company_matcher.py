@@ -0,0 +1,62 @@
+"""Tests for the Aho-Corasick company matcher against the regex baseline."""
+
+import random
+
+import pytest
+
+from src.config.constants import BIG_TECH_COMPANIES
+from src.utils.company_matcher import (
+    AhoCorasickCompanyMatcher,
+    RegexCompanyMatcher,
+    build_company_matcher,
+)
+
+REGEX = RegexCompanyMatcher(BIG_TECH_COMPANIES)
+AHO_CORASICK = AhoCorasickCompanyMatcher(BIG_TECH_COMPANIES)
+
+FILLER = ["university", "of", "labs", "research", "ltd", "x", "3", "é", "-", "_", "(", ")", ",", " "]
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Google Research", "google"),
+    ("IBM Research - Zurich", "ibm"),
+    ("Microsoft Azure", "microsoft"),
+    ("Amazon Web Services", "amazon"),
+    ("Telefónica I+D", "telefónica"),
+    ("ARM Ltd.", "arm"),
+    ("Harmonic Inc.", None),          # "arm" inside a word
+    ("Googleplex", None),
+    ("google_brain", None),           # "_" is a word character
+    ("Uber-ATG", "uber"),
+    ("University of Washington", None),
+    ("", None),
+])
+def test_known_institutions(text, expected):
+    assert REGEX.search(text) == expected
+    assert AHO_CORASICK.search(text) == expected
+
+
+def test_matches_regex_on_random_institutions():
+    rng = random.Random(0)
+    pieces = sorted(BIG_TECH_COMPANIES) + FILLER
+
+    for _ in range(20000):
+        text = "".join(rng.choice(pieces) + rng.choice(["", "", " ", "_", ","])
+                       for _ in range(rng.randint(1, 6)))
+        if rng.random() < 0.3:
+            text = text.upper()
+        assert AHO_CORASICK.search(text) == REGEX.search(text), repr(text)
+
+
+def test_overlapping_names_match_like_regex():
+    companies = ["he", "she", "hers", "his", "s"]
+    regex = RegexCompanyMatcher(companies)
+    automaton = AhoCorasickCompanyMatcher(companies)
+
+    for text in ["ushers", "she", "s he", "hers", "his she", "this", "s"]:
+        assert automaton.search(text) == regex.search(text), text
+
+
+def test_unknown_backend_raises():
+    with pytest.raises(ValueError):
+        build_company_matcher(BIG_TECH_COMPANIES, "unknown")
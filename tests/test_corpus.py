@@ -0,0 +1,88 @@
+"""Tests for the Corpus catalog."""
+
+import json
+import os
+import shutil
+
+import pytest
+
+from benchmarks.synthetic_corpus import CorpusSpec, SyntheticCorpusGenerator
+from src.config.constants import DATA_DIRS
+from src.processors.big_tech_analyzer import BigTechAnalyzer
+from src.processors.csv_generator import CSVGenerator
+from src.processors.data_reducer import DataReducer
+from src.utils.corpus import Corpus
+
+
+def test_committee_countries_are_interned(tmp_path):
+    committee_dir = tmp_path / DATA_DIRS["committee"]
+    committee_dir.mkdir(parents=True)
+    data = {"2020": {"Ann": {"MIT": "US", "ETH Zurich": "CH"}, "Bob": "US"},
+            "2021": {"Cid": {"Stanford University": "US"}}}
+    (committee_dir / "nsdi_committee.json").write_text(json.dumps(data), encoding='utf-8')
+    corpus = Corpus(tmp_path)
+
+    committee = corpus.committee("nsdi")
+
+    assert committee == data
+    assert committee["2020"]["Ann"]["MIT"] is committee["2020"]["Bob"]
+    assert committee["2020"]["Bob"] is committee["2021"]["Cid"]["Stanford University"]
+    assert set(corpus.symbols) == {"US", "CH"}
+    assert corpus.committee("nsdi") is committee
+
+
+def test_release_drops_one_kind_only(tmp_path):
+    for directory, name in [(DATA_DIRS["processed"], "nsdi_data.json"),
+                            (DATA_DIRS["committee"], "nsdi_committee.json")]:
+        (tmp_path / directory).mkdir(parents=True)
+        (tmp_path / directory / name).write_text('{"2020": {}}', encoding='utf-8')
+    corpus = Corpus(tmp_path)
+    corpus.papers("nsdi")
+    corpus.committee("nsdi")
+
+    corpus.release("papers")
+    corpus.papers("nsdi")
+    corpus.committee("nsdi")
+
+    assert (corpus.loads, corpus.hits) == (3, 1)
+
+
+@pytest.mark.parametrize("json_mtime, binary_mtime, expected", [
+    (1, 2, True),    # binary written after the JSON
+    (2, 2, True),    # both written by one run
+    (3, 2, False),   # JSON rewritten by a later json-only run
+    (None, 2, True),
+    (1, None, False),
+])
+def test_binary_papers_are_used_unless_older_than_json(tmp_path, json_mtime,
+                                                       binary_mtime, expected):
+    corpus = Corpus(tmp_path)
+    corpus.processed_dir.mkdir(parents=True)
+    for path, mtime in [(corpus.papers_path("nsdi"), json_mtime),
+                        (corpus.papers_binary_path("nsdi"), binary_mtime)]:
+        if mtime is not None:
+            path.write_bytes(b"")
+            os.utime(path, ns=(mtime * 10**18, mtime * 10**18))
+
+    assert corpus.has_binary_papers("nsdi") == expected
+
+
+def test_binary_processed_data_gives_the_same_csvs(tmp_path):
+    SyntheticCorpusGenerator(CorpusSpec(conferences=3, start_year=2020, end_year=2022,
+                                        papers_per_year=30, seed=5)).generate(tmp_path / "json")
+    shutil.copytree(tmp_path / "json", tmp_path / "binary")
+    outputs = {}
+
+    for output_format in ["json", "binary"]:
+        root = tmp_path / output_format
+        DataReducer(root, incremental=False, output_format=output_format).process_all_conferences()
+        corpus = Corpus(root)
+        assert (corpus.paper_store() is not None) == (output_format == "binary")
+
+        papers = CSVGenerator(root, corpus=corpus).generate_papers_csv()
+        big_tech = BigTechAnalyzer(root, corpus=corpus).generate_all_outputs()
+        assert papers.row_count > 0 and big_tech.papers_analyzed == papers.row_count
+        outputs[output_format] = [path.read_bytes() for path in
+                                  (papers.output_path, big_tech.yearly_csv, big_tech.continent_csv)]
+
+    assert outputs["binary"] == outputs["json"]
@@ -0,0 +1,47 @@
+"""Tests for DataReducer serial and parallel processing."""
+
+import os
+import shutil
+import tracemalloc
+
+from benchmarks.synthetic_corpus import CorpusSpec, SyntheticCorpusGenerator
+from src.config.constants import DATA_DIRS
+from src.processors.data_reducer import DataReducer
+from src.utils.run_report import RunReport
+
+SPEC = CorpusSpec(conferences=3, start_year=2020, end_year=2022, papers_per_year=40,
+                  institutions=80, seed=3)
+
+
+def reduce(root, workers):
+    """Reduce a project tree and return its stats and ProcessedData files."""
+    stats = DataReducer(root, incremental=False).process_all_conferences(workers=workers)
+    processed = root / DATA_DIRS["processed"]
+    return stats, {path.name: path.read_bytes() for path in sorted(processed.iterdir())}
+
+
+def test_parallel_run_matches_serial_run(tmp_path):
+    counts = SyntheticCorpusGenerator(SPEC).generate(tmp_path / "serial")
+    shutil.copytree(tmp_path / "serial", tmp_path / "parallel")
+
+    serial_stats, serial_files = reduce(tmp_path / "serial", workers=1)
+    parallel_stats, parallel_files = reduce(tmp_path / "parallel", workers=2)
+
+    assert len(serial_files) == 3
+    assert parallel_files == serial_files
+    assert list(parallel_stats) == list(serial_stats)
+    assert parallel_stats == serial_stats
+    assert sum(s.total_papers for s in serial_stats.values()) == counts["papers"]
+
+
+def test_workers_report_their_traced_memory(tmp_path):
+    SyntheticCorpusGenerator(SPEC).generate(tmp_path)
+    report = RunReport(trace_memory=True)
+    try:
+        DataReducer(tmp_path, incremental=False, report=report).process_all_conferences(workers=2)
+    finally:
+        tracemalloc.stop()
+
+    assert len(report.stages) == 3 * 3
+    assert all(stage.pid != os.getpid() for stage in report.stages)
+    assert all(stage.py_peak_mb > 0 for stage in report.stages)
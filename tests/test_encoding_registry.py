@@ -0,0 +1,91 @@
+"""Tests for EncodingRegistry lookups, merged saves and stale entries."""
+
+import json
+import os
+import threading
+
+from src.utils.encoding_registry import EncodingRegistry
+
+
+def touch(path, text="{}", mtime_ns=None):
+    """Write a file, optionally with a fixed mtime."""
+    path.write_text(text, encoding='utf-8')
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+    return path
+
+
+def test_entries_are_only_trusted_while_the_file_is_unchanged(tmp_path):
+    data = touch(tmp_path / "data.json", mtime_ns=10**18)
+    registry = EncodingRegistry()
+
+    assert registry.get(data) is None
+    registry.record(data, "latin-1")
+    assert registry.get(data) == "latin-1"
+
+    touch(data, mtime_ns=2 * 10**18)
+    assert registry.get(data) is None
+
+
+def test_entries_are_written_by_save_only(tmp_path):
+    data = touch(tmp_path / "data.json")
+    sidecar = tmp_path / "cache" / "encodings.json"
+
+    registry = EncodingRegistry(sidecar)
+    registry.record(data, "utf-8-sig")
+    assert not sidecar.exists()
+
+    registry.save()
+    assert EncodingRegistry(sidecar).get(data) == "utf-8-sig"
+
+
+def test_concurrent_saves_keep_each_others_entries(tmp_path):
+    sidecar = tmp_path / "encodings.json"
+    files = [touch(tmp_path / f"{i}.json") for i in range(40)]
+    registries = [EncodingRegistry(sidecar) for _ in range(4)]
+    barrier = threading.Barrier(len(registries))
+
+    def work(index, registry):
+        for path in files[index::len(registries)]:
+            registry.record(path, "utf-8")
+        barrier.wait()
+        registry.save()
+
+    threads = [threading.Thread(target=work, args=item) for item in enumerate(registries)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    reloaded = EncodingRegistry(sidecar)
+    assert all(reloaded.get(path) == "utf-8" for path in files)
+
+
+def test_save_drops_stale_entries(tmp_path):
+    sidecar = tmp_path / "encodings.json"
+    kept = touch(tmp_path / "kept.json")
+    changed = touch(tmp_path / "changed.json", mtime_ns=10**18)
+    deleted = touch(tmp_path / "deleted.json")
+
+    registry = EncodingRegistry(sidecar)
+    for path in (kept, changed, deleted):
+        registry.record(path, "latin-1")
+    registry.save()
+
+    touch(changed, "[]", mtime_ns=2 * 10**18)
+    deleted.unlink()
+    other = EncodingRegistry(sidecar)
+    other.record(touch(tmp_path / "new.json"), "utf-8")
+    other.save()
+
+    entries = json.loads(sidecar.read_text(encoding='utf-8'))
+    assert set(entries) == {str(kept.resolve()), str((tmp_path / "new.json").resolve())}
+    assert other.get(kept) == "latin-1"
+
+
+def test_shared_registry_is_one_instance_per_path(tmp_path):
+    sidecar = tmp_path / "cache" / "encodings.json"
+
+    registry = EncodingRegistry.shared(sidecar)
+    assert EncodingRegistry.shared(tmp_path / "cache" / ".." / "cache" / "encodings.json") is registry
+    assert EncodingRegistry.shared(tmp_path / "other.json") is not registry
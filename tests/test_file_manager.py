@@ -0,0 +1,80 @@
+"""Tests for FileManager encoding handling when loading and streaming JSON."""
+
+import codecs
+import json
+import logging
+
+import pytest
+
+from src.utils.file_manager import FileManager
+
+DATA = {
+    "2020": [{"Title": f"Paper {i}", "Institution": "ETH Zürich" if i == 2999 else "MIT"}
+             for i in range(3000)],
+    "2021": [],
+}
+
+
+def write(path, data, encoding, bom=False):
+    """Write JSON with non-ASCII text only near the end of the file."""
+    raw = json.dumps(data, ensure_ascii=False).encode(encoding)
+    path.write_bytes((codecs.BOM_UTF8 if bom else b"") + raw)
+    assert len(raw) > 1 << 16
+    return path
+
+
+def stream(file_manager, path):
+    """Materialize FileManager.iter_json_groups() output as a dict."""
+    return {key: list(items) for key, items in file_manager.iter_json_groups(path)}
+
+
+@pytest.mark.parametrize("encoding, bom, expected", [
+    ("utf-8", False, "utf-8"),
+    ("utf-8", True, "utf-8-sig"),
+    ("latin-1", False, "latin-1"),
+])
+def test_stream_settles_encoding_like_load_json(tmp_path, encoding, bom, expected):
+    path = write(tmp_path / "data.json", DATA, encoding, bom)
+
+    streaming = FileManager()
+    assert stream(streaming, path) == DATA
+    assert streaming.encoding_registry.get(path) == expected
+
+    loading = FileManager()
+    assert loading.load_json(path) == DATA
+    assert loading.encoding_registry.get(path) == expected
+
+    # A registry hit is used directly
+    assert stream(streaming, path) == DATA
+
+
+def test_mixed_encodings_are_not_recorded(tmp_path, caplog):
+    # Valid UTF-8 in the first chunk, a latin-1 byte far behind it
+    padding = "x" * (1 << 17)
+    path = tmp_path / "data.json"
+    path.write_bytes(f'{{"a": ["Zürich", "{padding}", "'.encode("utf-8") +
+                     "Zürich".encode("latin-1") + b'"]}')
+    file_manager = FileManager()
+
+    with caplog.at_level(logging.WARNING):
+        assert stream(file_manager, path) == {"a": ["Zürich", padding, "Zürich"]}
+
+    assert "decoding the rest as latin-1" in caplog.text
+    assert file_manager.encoding_registry.get(path) is None
+
+
+@pytest.mark.parametrize("encoding, bom", [("utf-8", False), ("utf-8", True), ("latin-1", False)])
+def test_mapped_load_matches_load_json(tmp_path, encoding, bom):
+    path = write(tmp_path / "data.json", DATA, encoding, bom)
+
+    assert FileManager().load_json_groups(path) == FileManager().load_json(path)
+
+
+def test_mapped_load_of_empty_file_fails_like_load_json(tmp_path):
+    path = tmp_path / "empty.json"
+    path.write_bytes(b"")
+
+    with pytest.raises(json.JSONDecodeError):
+        FileManager().load_json(path)
+    with pytest.raises(json.JSONDecodeError):
+        FileManager().load_json_groups(path)
@@ -0,0 +1,95 @@
+"""Tests for the incremental JSON reader against json.loads."""
+
+import io
+import json
+
+import pytest
+
+from src.utils.json_stream import iter_json_groups, iter_json_records
+
+DOCUMENTS = [
+    '{"a":[1.5e10]}',
+    '{"a":[1.5, 2]}',
+    '{"a": [-0.25, 3E-2, 1e+5, 0, -7, 12345678901234567890]}',
+    '{"a": [true, false, null, "x"], "b": []}',
+    '{"a": [-Infinity, NaN, {"t": true, "n": null, "x": -1.5e-3}]}',
+    '{"a": ["\\ud83d\\ude00 \\u00e9\\n", {"k": "\\"\\\\"}]}',
+    '{}',
+    '{"2020": [{"Title": "Caf\\u00e9 \\"quoted\\"", "Authors": [{"Name": "王"}]}],'
+    ' "2021": [{"n": [1, [2, {"k": 3.0}]]}, "s", 4]}',
+    ' { "k" : [ 1 , { } , [ ] ] , "e" : [ ] } ',
+]
+
+
+def read_groups(text, chunk_size):
+    """Materialize iter_json_groups() output as a dict."""
+    return {key: list(items) for key, items in iter_json_groups(io.StringIO(text), chunk_size)}
+
+
+@pytest.mark.parametrize("text", DOCUMENTS)
+def test_matches_json_loads_for_every_chunk_size(text):
+    expected = json.loads(text)
+    for chunk_size in range(1, len(text) + 1):
+        assert read_groups(text, chunk_size) == expected, f"chunk_size={chunk_size}"
+
+
+def test_records_are_flattened_in_order():
+    text = '{"2020": [{"id": 1}, {"id": 2}], "2021": [], "2022": [{"id": 3}]}'
+    records = list(iter_json_records(io.StringIO(text), chunk_size=3))
+    assert records == [("2020", {"id": 1}), ("2020", {"id": 2}), ("2022", {"id": 3})]
+
+
+def test_unread_items_are_skipped():
+    text = '{"a": [1, 2, 3], "b": [4]}'
+    keys = [key for key, _ in iter_json_groups(io.StringIO(text), chunk_size=2)]
+    assert keys == ["a", "b"]
+
+
+def test_object_hook_is_applied():
+    text = '{"a": [{"x": 1}, {"x": 2}]}'
+    groups = iter_json_groups(io.StringIO(text), object_hook=lambda obj: obj["x"])
+    assert {key: list(items) for key, items in groups} == {"a": [1, 2]}
+
+
+@pytest.mark.parametrize("text", [
+    '{"a": [1 2]}',
+    '{"a": [1.5e]}',
+    '{"a": [1,]}',
+    '{"a": [1]',
+    '{"a": [1]} x',
+    '{"a": [tru]}',
+    '{"a": [{"k": 1 2}]}',
+    '{"a": ["\\uZZZZ"]}',
+])
+def test_invalid_json_raises(text):
+    for chunk_size in (1, 4, len(text)):
+        with pytest.raises(json.JSONDecodeError):
+            read_groups(text, chunk_size)
+
+
+def test_non_array_value_raises():
+    with pytest.raises(ValueError):
+        read_groups('{"a": {"b": 1}}', 4)
+
+
+class CountingReader(io.StringIO):
+    """StringIO that counts the characters read from it."""
+
+    def __init__(self, text):
+        super().__init__(text)
+        self.chars_read = 0
+
+    def read(self, size=-1):
+        chunk = super().read(size)
+        self.chars_read += len(chunk)
+        return chunk
+
+
+def test_malformed_value_fails_without_reading_the_rest():
+    text = '{"a": [{"k": 1 2}' + ', {"k": 3}' * 100000 + ']}'
+    reader = CountingReader(text)
+
+    with pytest.raises(json.JSONDecodeError):
+        for _, items in iter_json_groups(reader, chunk_size=64):
+            list(items)
+    assert reader.chars_read <= 256
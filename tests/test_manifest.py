@@ -0,0 +1,154 @@
+"""Tests for FileManifest and StampStore freshness checks."""
+
+import os
+
+import pytest
+
+from src.utils import manifest
+from src.utils.manifest import FileManifest, StampStore
+
+
+def write(path, text, mtime_ns=None):
+    """Write a file, optionally with a fixed mtime."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding='utf-8')
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+    return path
+
+
+@pytest.fixture
+def count_digests(monkeypatch):
+    """Count file_digest() calls made by the manifest module."""
+    calls = []
+    digest = manifest.file_digest
+
+    def counting(path):
+        calls.append(path)
+        return digest(path)
+
+    monkeypatch.setattr(manifest, "file_digest", counting)
+    return calls
+
+
+# ----------------------------------------------------------------------
+# FileManifest
+# ----------------------------------------------------------------------
+
+def test_manifest_entry_is_fresh_until_input_or_code_changes(tmp_path):
+    source = write(tmp_path / "in.json", "[1]", mtime_ns=10**18)
+    files = FileManifest(tmp_path / "manifest.json")
+
+    assert not files.is_fresh("in", source, "v1")
+    files.record("in", source, "v1", papers=1)
+
+    assert files.is_fresh("in", source, "v1")
+    assert not files.is_fresh("in", source, "v2")
+    assert files.get("in")["papers"] == 1
+
+    # Same size, different content
+    write(source, "[2]", mtime_ns=2 * 10**18)
+    assert not files.is_fresh("in", source, "v1")
+
+    source.unlink()
+    assert not files.is_fresh("in", source, "v1")
+
+
+def test_touched_input_is_rehashed_once(tmp_path, count_digests):
+    source = write(tmp_path / "in.json", "[1]", mtime_ns=10**18)
+    files = FileManifest(tmp_path / "manifest.json")
+    files.record("in", source, "v1")
+    count_digests.clear()
+
+    os.utime(source, ns=(2 * 10**18, 2 * 10**18))
+    assert files.is_fresh("in", source, "v1")
+    assert files.is_fresh("in", source, "v1")
+    assert len(count_digests) == 1
+    assert files.get("in")["mtime_ns"] == 2 * 10**18
+
+
+def test_manifest_round_trips_and_ignores_corrupt_files(tmp_path):
+    source = write(tmp_path / "in.json", "[1]")
+    path = tmp_path / "cache" / "manifest.json"
+
+    files = FileManifest(path)
+    files.record("in", source, "v1")
+    files.record("gone", source, "v1")
+    files.discard("gone")
+    files.save()
+
+    reloaded = FileManifest(path)
+    assert set(reloaded.entries) == {"in"}
+    assert reloaded.is_fresh("in", source, "v1")
+
+    path.write_text("{not json", encoding='utf-8')
+    assert FileManifest(path).entries == {}
+
+
+# ----------------------------------------------------------------------
+# StampStore
+# ----------------------------------------------------------------------
+
+def test_fingerprint_tracks_inputs_sources_and_salt(tmp_path):
+    write(tmp_path / "data" / "a.json", "a")
+    write(tmp_path / "src" / "code.py", "x = 1")
+    stamps = StampStore(tmp_path / "stamps.json", tmp_path)
+
+    def fingerprint(salt=""):
+        return stamps.fingerprint(["data/*.json"], ["src/code.py"], salt)
+
+    base = fingerprint()
+    assert fingerprint() == base
+    assert fingerprint("other") != base
+
+    write(tmp_path / "data" / "b.json", "b")
+    with_b = fingerprint()
+    assert with_b != base
+
+    write(tmp_path / "src" / "code.py", "x = 2")
+    assert fingerprint() != with_b
+
+    (tmp_path / "data" / "b.json").unlink()
+    write(tmp_path / "src" / "code.py", "x = 1")
+    assert fingerprint() == base
+
+
+def test_stamp_is_current_until_outputs_change(tmp_path):
+    write(tmp_path / "out" / "a.csv", "a")
+    write(tmp_path / "out" / "b.csv", "b", mtime_ns=10**18)
+    stamps = StampStore(tmp_path / "stamps.json", tmp_path)
+    outputs = ["out/a.csv", "out/b.csv"]
+
+    assert not stamps.is_current("task", "f1", outputs)
+    stamps.record("task", "f1", outputs)
+
+    assert stamps.is_current("task", "f1", outputs)
+    assert not stamps.is_current("task", "f2", outputs)
+    assert not stamps.is_current("task", "f1", outputs[:1])
+
+    write(tmp_path / "out" / "b.csv", "B", mtime_ns=2 * 10**18)
+    assert not stamps.is_current("task", "f1", outputs)
+
+    stamps.record("task", "f1", outputs)
+    (tmp_path / "out" / "a.csv").unlink()
+    assert not stamps.is_current("task", "f1", outputs)
+
+    stamps.discard("task")
+    assert "task" not in stamps.stamps
+
+
+def test_stamps_and_digests_persist(tmp_path, count_digests):
+    write(tmp_path / "in.txt", "data")
+    write(tmp_path / "out.txt", "result")
+    path = tmp_path / "cache" / "stamps.json"
+
+    stamps = StampStore(path, tmp_path)
+    fingerprint = stamps.fingerprint(["in.txt"])
+    stamps.record("task", fingerprint, ["out.txt"])
+    stamps.save()
+    count_digests.clear()
+
+    reloaded = StampStore(path, tmp_path)
+    assert reloaded.fingerprint(["in.txt"]) == fingerprint
+    assert reloaded.is_current("task", fingerprint, ["out.txt"])
+    assert count_digests == []
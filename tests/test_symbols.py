@@ -0,0 +1,21 @@
+"""Tests for SymbolTable interning."""
+
+import json
+
+from src.utils.symbols import SymbolTable
+
+
+def test_object_hook_interns_only_listed_fields():
+    symbols = SymbolTable()
+    hook = symbols.json_object_hook(fields={"Country", "Predominant Continent"})
+    text = json.dumps([
+        {"Country": "US", "Name": "Ann", "Predominant Continent": ["NA", None]},
+        {"Country": "US", "Name": "Bob", "Predominant Continent": ["NA"], "Year": 2020},
+    ])
+
+    first, second = json.loads(text, object_hook=hook)
+
+    assert first["Country"] is second["Country"]
+    assert first["Predominant Continent"][0] is second["Predominant Continent"][0]
+    assert first["Predominant Continent"][1] is None
+    assert list(symbols) == ["US", "NA"]
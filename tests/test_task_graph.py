@@ -0,0 +1,177 @@
+"""Tests for TaskGraph ordering, failure propagation and up-to-date checks."""
+
+import threading
+import time
+
+import pytest
+
+from src.utils.manifest import StampStore
+from src.utils.run_report import RunReport
+from src.utils.task_graph import Task, TaskGraph
+
+
+class Recorder:
+    """Actions that log when they start and finish."""
+
+    def __init__(self):
+        self.events = []
+        self._lock = threading.Lock()
+
+    def action(self, name, fail=False, delay=0.0, write=None):
+        def run():
+            with self._lock:
+                self.events.append(("start", name))
+            time.sleep(delay)
+            if write is not None:
+                write.write_text(name, encoding='utf-8')
+            with self._lock:
+                self.events.append(("end", name))
+            if fail:
+                raise RuntimeError(f"{name} broke")
+            return name
+        return run
+
+    def started(self):
+        return [name for kind, name in self.events if kind == "start"]
+
+    def index(self, kind, name):
+        return self.events.index((kind, name))
+
+
+def diamond(recorder, fail=(), delay=0.0):
+    """load -> (csv, stats) -> plot, plus an unrelated task."""
+    graph = TaskGraph()
+    for name, inputs, outputs in [
+        ("plot", ["csv", "stats"], ["pdf"]),
+        ("csv", ["data"], ["csv"]),
+        ("stats", ["data"], ["stats"]),
+        ("load", [], ["data"]),
+        ("other", [], ["other"]),
+    ]:
+        graph.add(Task(name, recorder.action(name, fail=name in fail, delay=delay),
+                       inputs=inputs, outputs=outputs))
+    return graph
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_tasks_start_after_their_dependencies_finish(max_workers):
+    recorder = Recorder()
+    graph = diamond(recorder, delay=0.01)
+
+    results = graph.run(max_workers=max_workers)
+
+    assert all(result.status == "done" for result in results.values())
+    assert list(results) == graph.topological_order(graph.tasks)
+    for name in graph.tasks:
+        for dep in graph.dependencies(name):
+            assert recorder.index("end", dep) < recorder.index("start", name)
+
+
+def test_independent_tasks_run_concurrently():
+    recorder = Recorder()
+    graph = diamond(recorder, delay=0.05)
+
+    graph.run(max_workers=4)
+
+    # csv and stats both start before either finishes
+    assert recorder.index("start", "stats") < recorder.index("end", "csv")
+    assert recorder.index("start", "csv") < recorder.index("end", "stats")
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_failure_skips_downstream_tasks_only(max_workers):
+    recorder = Recorder()
+    graph = diamond(recorder, fail={"csv"})
+
+    results = graph.run(max_workers=max_workers)
+
+    assert results["csv"].status == "failed"
+    assert results["csv"].error == "csv broke"
+    assert results["plot"].status == "skipped"
+    assert "csv" in results["plot"].error
+    assert {name for name, r in results.items() if r.success} == {"load", "stats", "other"}
+    assert "plot" not in recorder.started()
+
+
+def test_failure_propagates_transitively():
+    recorder = Recorder()
+    graph = diamond(recorder, fail={"load"})
+
+    results = graph.run()
+
+    assert [name for name, r in results.items() if r.status == "skipped"] == ["csv", "stats", "plot"]
+    assert set(recorder.started()) == {"load", "other"}
+
+
+def test_selection_and_after():
+    recorder = Recorder()
+    graph = diamond(recorder)
+    graph.add(Task("report", recorder.action("report"), after=["other"]))
+
+    assert graph.select(until=["plot"]) == ["load", "csv", "stats", "plot"]
+    assert graph.select(only=["plot", "c*"]) == ["csv", "plot"]
+    assert graph.dependencies("report") == {"other"}
+
+    graph.run(graph.select(only=["plot"]))
+    assert recorder.started() == ["plot"]
+
+
+def test_invalid_graphs_are_rejected():
+    graph = TaskGraph()
+    graph.add(Task("a", lambda: None, inputs=["b.out"], outputs=["a.out"]))
+
+    with pytest.raises(ValueError):
+        graph.add(Task("a", lambda: None))
+    with pytest.raises(ValueError):
+        graph.add(Task("c", lambda: None, outputs=["a.out"]))
+
+    graph.add(Task("b", lambda: None, inputs=["a.out"], outputs=["b.out"]))
+    with pytest.raises(ValueError, match="cycle"):
+        graph.topological_order(graph.tasks)
+
+    with pytest.raises(ValueError):
+        graph.match(["nothing*"])
+
+
+def test_stamped_tasks_are_skipped_while_up_to_date(tmp_path):
+    (tmp_path / "in.txt").write_text("v1", encoding='utf-8')
+    (tmp_path / "code.py").write_text("", encoding='utf-8')
+    recorder = Recorder()
+    graph = TaskGraph()
+    graph.add(Task("build", recorder.action("build", write=tmp_path / "out.txt"),
+                   inputs=["in.txt"], outputs=["out.txt"], sources=["code.py"]))
+
+    def run(**kwargs):
+        stamps = StampStore(tmp_path / "stamps.json", tmp_path)
+        return graph.run(stamps=stamps, **kwargs)["build"].status
+
+    assert run() == "done"
+    assert run() == "up-to-date"
+    assert run(force=True) == "done"
+
+    (tmp_path / "in.txt").write_text("v2", encoding='utf-8')
+    assert run() == "done"
+    assert run() == "up-to-date"
+    assert recorder.started() == ["build"] * 3
+
+
+def test_report_gets_one_stage_per_task():
+    recorder = Recorder()
+    report = RunReport()
+
+    diamond(recorder, fail={"csv"}).run(max_workers=2, report=report)
+
+    statuses = {stage.name: stage.status for stage in report.stages}
+    assert statuses == {"load": "done", "csv": "failed", "stats": "done", "other": "done"}
+
+
+def test_results_are_reported_as_they_become_final():
+    recorder = Recorder()
+    graph = diamond(recorder, fail={"csv"})
+    reported = []
+
+    results = graph.run(max_workers=2, on_result=reported.append)
+
+    assert sorted(r.name for r in reported) == sorted(results)
+    assert [r.name for r in reported].index("plot") > [r.name for r in reported].index("csv")
+    assert next(r for r in reported if r.name == "plot").status == "skipped"